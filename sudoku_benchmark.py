@@ -0,0 +1,239 @@
+# -----------------------------------------------------------
+# BENCHMARK for SUDOKU SOLVER
+#
+# Mide el rendimiento de los motores de 'sudoku_solver.py' sobre
+# los conjuntos de datos del proyecto (o archivos indicados), y lo
+# compara contra una línea base guardada previamente.
+#
+# Uso:
+#   python3 sudoku_benchmark.py --engine bitmask --repeat 5 --json bench.json
+#   python3 sudoku_benchmark.py --baseline bench.json --threshold 0.10
+#   python3 sudoku_benchmark.py --engine objects --profile data/top95.txt
+#   python3 sudoku_benchmark.py --engine bitmask --branching data/top95.txt
+#   python3 sudoku_benchmark.py --engine scalable --box 4 data/16x16.txt
+# -----------------------------------------------------------
+
+from argparse import ArgumentParser
+import csv
+from math import ceil
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from sudoku_solver import ENGINES, SudokuBoard, SolverStats, _CELL_CHOICES, _VALUE_ORDERS
+
+# Conjuntos de datos por defecto y su separador entre secuencias
+_DATASETS = (
+	("data/easy50.txt", "========"),
+	("data/top95.txt", "\n"),
+	("data/hardest.txt", "\n"),
+	("data/hardest(2019).txt", "\n"),
+)
+# Campos reportados por archivo y motor
+_FIELDS = ("engine", "file", "puzzles", "solved", "unsolved", "excluded", "hz", "mean", "p50", "p95", "p99", 
+	"max", "guesses", "max_guesses", "backtracks", "peak_kib")
+# Motores que aplican la estrategia de ramificación ('dlx' y 'scalable' tienen la suya propia)
+_BRANCHING_ENGINES = ("objects", "bitmask")
+# Campos comparados contra la línea base: True si un valor mayor es peor
+_COMPARED = {"hz": False, "p50": True, "p95": True, "max": True}
+
+#####################################################################################################
+#####################################################################################################
+
+def _percentile(values, q, /):
+	# Percentil por rango más cercano sobre una lista ya ordenada
+	if not values: return 0.0
+	k = max(0, min(len(values) - 1, ceil(q * len(values) / 100) - 1))
+	return values[k]
+#-------------------------------------------------------------------------------#
+def _run_once(board, path, sep, engine, /, stats=None, branching=None, box=3):
+	# Las rutas relativas de los conjuntos por defecto se resuelven junto a este script
+	if not Path(path).exists() and (local:= Path(__file__).parent / path).exists():
+		path = str(local)
+	return list(board.iter_results(path, sep=sep, engine=engine, stats=stats, branching=branching, box=box))
+#-------------------------------------------------------------------------------#
+def profile_file(path, sep, engine, /, box:int=3):
+	"""
+	Resuelve un archivo una vez con instrumentación por técnica (corrida no cronometrada).
+	
+	RETURN:
+	- (SolverStats) agregados del archivo.
+	"""
+	stats = SolverStats()
+	_run_once(SudokuBoard(), path, sep, engine, stats=stats, box=box)
+	return stats
+#-------------------------------------------------------------------------------#
+def benchmark_file(path, sep, engine, /, repeat:int=3, warmup:int=1, memory=True, box:int=3):
+	"""
+	Resuelve un archivo varias veces con el motor indicado y resume su rendimiento.
+	
+	ARGS:
+	- path		: (str) localización del archivo de secuencias.
+	- sep		: (str) separador entre secuencias.
+	- engine	: (str) motor de resolución ("objects", "bitmask", "dlx" ó "scalable").
+	- repeat	: (int) corridas medidas; por tablero se toma el menor tiempo obtenido.
+	- warmup	: (int) corridas previas no medidas.
+	- memory	: (bool) mide el pico de memoria en una corrida adicional (no cronometrada).
+	- box		: (int) tamaño de cuadrante de los tableros del archivo.
+	
+	RETURN:
+	- (dict) métricas con las claves de '_FIELDS'; tiempos en segundos.
+	"""
+	board = SudokuBoard()
+	for _ in range(warmup):
+		_run_once(board, path, sep, engine, box=box)
+	best = None
+	for _ in range(max(1, repeat)):
+		results = _run_once(board, path, sep, engine, box=box)
+		if best is None:
+			best = results
+		else:
+			best = [r if r.elapsed < b.elapsed else b for r, b in zip(results, best)]
+	peak = 0
+	if memory:
+		tracemalloc.start()
+		_run_once(board, path, sep, engine, box=box)
+		peak = tracemalloc.get_traced_memory()[1]
+		tracemalloc.stop()
+	solved = [r for r in best if r.status == "solved"]
+	latencies = sorted(r.elapsed for r in best if r.status != "excluded")
+	total = sum(r.elapsed for r in solved)
+	return {
+		"engine": engine,
+		"file": path,
+		"puzzles": len(best),
+		"solved": len(solved),
+		"unsolved": sum(r.status == "unsolved" for r in best),
+		"excluded": sum(r.status == "excluded" for r in best),
+		"hz": len(solved) / total if total else 0.0,
+		"mean": total / len(solved) if solved else 0.0,
+		"p50": _percentile(latencies, 50),
+		"p95": _percentile(latencies, 95),
+		"p99": _percentile(latencies, 99),
+		"max": latencies[-1] if latencies else 0.0,
+		"guesses": sum(r.guesses for r in best),
+		"max_guesses": max((r.guesses for r in best), default=0),
+		"backtracks": sum(r.backtracks for r in best),
+		"peak_kib": peak / 1024,
+	}
+#-------------------------------------------------------------------------------#
+def compare_branching(path, sep, engine, /, box:int=3):
+	"""
+	Resuelve un archivo una vez por cada combinación de elección de celda y orden de valores
+	(corridas sin instrumentación, una sola vez cada una). Los motores que no aplican la
+	estrategia (ver '_BRANCHING_ENGINES'; con 'box' distinto de 3 se usa "scalable") se
+	corren una sola vez, con "cell" y "values" en "-".
+	
+	RETURN:
+	- (list) un diccionario por estrategia: "cell", "values", "guesses", "backtracks",
+		"max_guesses", "p95_guesses" y "seconds".
+	"""
+	board = SudokuBoard()
+	rows = []
+	if box != 3 or engine not in _BRANCHING_ENGINES:
+		strategies = [(None, None)]
+	else:
+		strategies = [(cell, values) for cell in _CELL_CHOICES for values in _VALUE_ORDERS]
+	for cell, values in strategies:
+		start = time.perf_counter()
+		results = _run_once(board, path, sep, engine, branching=None if cell is None else (cell, values), box=box)
+		seconds = time.perf_counter() - start
+		guesses = sorted(r.guesses for r in results if r.status != "excluded")
+		rows.append({"cell": cell or "-", "values": values or "-", "guesses": sum(guesses), 
+			"backtracks": sum(r.backtracks for r in results), "max_guesses": guesses[-1] if guesses else 0,
+			"p95_guesses": _percentile(guesses, 95), "seconds": seconds})
+	return rows
+#-------------------------------------------------------------------------------#
+def compare_with_baseline(rows, baseline, /, threshold:float=0.10):
+	"""
+	Compara métricas contra una línea base (misma estructura que la salida JSON).
+	
+	RETURN:
+	- (list) mensajes por cada métrica que empeoró más allá del umbral relativo.
+	"""
+	reference = {(b["engine"], b["file"]): b for b in baseline}
+	regressions = []
+	for row in rows:
+		base = reference.get((row["engine"], row["file"]))
+		if not base: continue
+		for field, higher_is_worse in _COMPARED.items():
+			old, new = base[field], row[field]
+			if not old: continue
+			change = (new - old) / old if higher_is_worse else (old - new) / old
+			if change > threshold:
+				regressions.append(f"{row['engine']} {row['file']}: {field} {old:.6g} -> {new:.6g} ({change:.1%} worse)")
+	return regressions
+#-------------------------------------------------------------------------------#
+def _print_table(rows, /):
+	print("{:<8} {:<24} {:>7} {:>8} {:>9} {:>9} {:>9} {:>9} {:>8} {:>9}".format(
+		"engine", "file", "solved", "Hz", "p50 ms", "p95 ms", "p99 ms", "max ms", "guesses", "peak KiB"))
+	for r in rows:
+		print("{:<8} {:<24} {:>7} {:>8.0f} {:>9.3f} {:>9.3f} {:>9.3f} {:>9.3f} {:>8} {:>9.0f}".format(
+			r["engine"], r["file"][-24:], f"{r['solved']}/{r['puzzles']}", r["hz"], r["p50"]*1e3, r["p95"]*1e3, 
+			r["p99"]*1e3, r["max"]*1e3, r["guesses"], r["peak_kib"]))
+#-------------------------------------------------------------------------------#
+def main(argv=None):
+	parser = ArgumentParser(description="Benchmark de los motores de sudoku_solver.")
+	parser.add_argument("files", nargs="*", help="archivos de secuencias (por defecto, los de data/)")
+	parser.add_argument("--sep", default="\n", help="separador entre secuencias de los archivos indicados")
+	parser.add_argument("--engine", action="append", choices=ENGINES,
+		help="motor a medir (puede repetirse; por defecto todos)")
+	parser.add_argument("--repeat", type=int, default=3, help="corridas medidas por archivo")
+	parser.add_argument("--warmup", type=int, default=1, help="corridas de calentamiento por archivo")
+	parser.add_argument("--no-memory", action="store_true", help="omitir la medición del pico de memoria")
+	parser.add_argument("--json", help="guardar resultados en formato JSON")
+	parser.add_argument("--csv", help="guardar resultados en formato CSV")
+	parser.add_argument("--baseline", help="archivo JSON de una corrida previa contra el cual comparar")
+	parser.add_argument("--threshold", type=float, default=0.10, help="empeoramiento relativo tolerado (0.10 = 10%%)")
+	parser.add_argument("--profile", action="store_true", help="reportar llamadas y tiempo por técnica (corrida adicional)")
+	parser.add_argument("--box", type=int, default=3, help="tamaño de cuadrante de los tableros indicados (2 a 5)")
+	parser.add_argument("--branching", action="store_true", 
+		help="comparar las estrategias de ramificación en lugar del benchmark habitual")
+	args = parser.parse_args(argv)
+
+	datasets = [(f, args.sep) for f in args.files] if args.files else _DATASETS
+	if args.branching:
+		print("{:<8} {:<24} {:<11} {:<10} {:>8} {:>10} {:>8} {:>8} {:>8}".format(
+			"engine", "file", "cell", "values", "guesses", "backtracks", "p95", "max", "seconds"))
+		# los tableros que no son de 9×9 sólo los resuelve "scalable"
+		engines = ("scalable",) if args.box != 3 else dict.fromkeys(args.engine or _BRANCHING_ENGINES)
+		for engine in engines:
+			if engine not in _BRANCHING_ENGINES:
+				print(f"[NOTE] {engine}: no aplica la estrategia de ramificación, se muestra una sola corrida",
+					file=sys.stderr)
+			for path, sep in datasets:
+				for r in compare_branching(path, sep, engine, box=args.box):
+					print("{:<8} {:<24} {:<11} {:<10} {:>8} {:>10} {:>8} {:>8} {:>8.3f}".format(
+						engine, path[-24:], r["cell"], r["values"], r["guesses"], r["backtracks"], r["p95_guesses"],
+						r["max_guesses"], r["seconds"]))
+		return 0
+	rows = []
+	for engine in args.engine or ("objects", "bitmask", "dlx"):
+		for path, sep in datasets:
+			rows.append(benchmark_file(path, sep, engine, repeat=args.repeat, warmup=args.warmup, memory=not args.no_memory,
+				box=args.box))
+	_print_table(rows)
+	if args.profile:
+		for row in rows:
+			print(f"\n[{row['engine']}] {row['file']}")
+			print(profile_file(row["file"], args.sep if args.files else dict(_DATASETS)[row["file"]], row["engine"], box=args.box))
+	if args.json:
+		with open(args.json, "w") as f:
+			json.dump(rows, f, indent=2)
+	if args.csv:
+		with open(args.csv, "w", newline="") as f:
+			writer = csv.DictWriter(f, fieldnames=_FIELDS)
+			writer.writeheader()
+			writer.writerows(rows)
+	if args.baseline:
+		with open(args.baseline) as f:
+			regressions = compare_with_baseline(rows, json.load(f), threshold=args.threshold)
+		for message in regressions:
+			print("[REGRESSION]", message)
+		if regressions: return 1
+		print("No regressions against", args.baseline)
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main())
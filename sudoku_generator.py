@@ -0,0 +1,288 @@
+# -----------------------------------------------------------
+# PUZZLE GENERATOR for SUDOKU SOLVER
+#
+# Genera tableros de 9×9 de solución única con el motor "bitmask"
+# de 'sudoku_solver.py': completa una cuadrícula al azar, retira
+# pistas mientras la solución siga siendo única, y califica su
+# dificultad según lo que el solucionador necesitó para resolverlo.
+#
+# Uso:
+#   python3 sudoku_generator.py 100 > puzzles.txt
+#   python3 sudoku_generator.py 20 --level hard --workers 4 --seed 7
+#   python3 sudoku_generator.py 50 --symmetric --min-depth 3 --grades
+#
+# Niveles de dificultad:
+#   easy	: se resuelve sólo con sencillos desnudos y ocultos
+#   medium	: requiere además la técnica de pares gemelos
+#   hard	: requiere prueba-error (con sus opciones probadas y profundidad)
+# -----------------------------------------------------------
+
+from argparse import ArgumentParser
+from itertools import count, islice
+import random
+import sys
+import time
+from sudoku_solver import BitmaskBoard, SolverStats, _solve_sequence, _UNITS, _CELL_UNITS, _PEERS, _BLOCK_RANGE, \
+	_NAKED_HIDDEN_TWINS, _SOLVED
+
+LEVELS = ("easy", "medium", "hard")
+
+#####################################################################################################
+#####################################################################################################
+
+def _forced(values, i, value, /):
+	# La celda vacía i sólo admite 'value' según las pistas: sencillo desnudo (sus vecinas tienen
+	# los otros 8 dígitos) ú oculto (en alguna de sus unidades, 'value' no cabe en otra celda)
+	if len(set(values[j] for j in _PEERS[i]) - {"0"}) == 8: return True
+	seen = {u for k in range(81) if values[k] == value for u in _CELL_UNITS[k]}
+	return any(all(j == i or values[j] != "0" or not seen.isdisjoint(_CELL_UNITS[j]) for j in _UNITS[u]) 
+		for u in _CELL_UNITS[i])
+#-------------------------------------------------------------------------------#
+
+class RatedPuzzle:
+	"""
+	Tablero generado (ó calificado con 'PuzzleGenerator.grade') y su dificultad.
+
+	ATTRS:
+	- puzzle	: (str) secuencia de 81 caracteres, "." en las celdas vacías.
+	- solution	: (str) secuencia solución de 81 dígitos.
+	- givens	: (int) cantidad de pistas.
+	- level		: (str) "easy", "medium" ó "hard".
+	- guesses	: (int) opciones probadas en la prueba-error.
+	- backtracks	: (int) veces que se restauró el tablero tras una opción fallida.
+	- depth		: (int) máxima profundidad de la prueba-error (0 si no se requirió).
+	"""
+	__slots__ = ("puzzle", "solution", "givens", "level", "guesses", "backtracks", "depth")
+	#-------------------------------------------------------------------------------#
+	def __init__(self, puzzle, solution, level, guesses=0, backtracks=0, depth=0):
+		self.puzzle = puzzle
+		self.solution = solution
+		self.givens = 81 - puzzle.count(".")
+		self.level = level
+		self.guesses = guesses
+		self.backtracks = backtracks
+		self.depth = depth
+	#-------------------------------------------------------------------------------#
+	def __repr__(self):
+		return (f"RatedPuzzle(puzzle={self.puzzle!r}, givens={self.givens}, level={self.level!r}, "
+			f"guesses={self.guesses}, backtracks={self.backtracks}, depth={self.depth})")
+	#-------------------------------------------------------------------------------#
+	def __getstate__(self):
+		return tuple(getattr(self, k) for k in self.__slots__)
+	#-------------------------------------------------------------------------------#
+	def __setstate__(self, state):
+		for k, v in zip(self.__slots__, state):
+			setattr(self, k, v)
+
+#-------------------------------------------------------------------------------#
+
+class PuzzleGenerator:
+	"""
+	Generador de tableros de solución única. Cada candidato se obtiene de una cuadrícula
+	completa al azar, retirando sus pistas en orden aleatorio y devolviendo las que dejan más
+	de una solución: el tablero resultante es mínimo (no admite retirar ninguna otra pista).
+	Al retirar una pista de un tablero de solución única, sólo puede aparecer otra solución con
+	un valor distinto en esa celda, por lo que basta buscar una solución que excluya dicho
+	valor: casi siempre se descarta ó se encuentra tras pocas opciones. Mientras quedan muchas
+	pistas, la celda suele quedar determinada por sus vecinas, y ni siquiera se busca.
+
+	ARGS:
+	- seed		: semilla del generador de números aleatorios (None: al azar).
+	- symmetric	: (bool) retirar las pistas por pares simétricos respecto al centro.
+	"""
+	#-------------------------------------------------------------------------------#
+	def __init__(self, seed=None, symmetric=False):
+		self.rng = random.Random(seed)
+		self.symmetric = symmetric
+		# Sólo sencillos, pares gemelos y prueba-error: es lo que mide la calificación, y las
+		# técnicas adicionales no aceleran la verificación de unicidad
+		self.__board = BitmaskBoard()
+		self.__board._techniques = ()
+		self.__record = None
+		self.__stats = SolverStats(self.__keep_record, slowest=0)
+	#-------------------------------------------------------------------------------#
+	def __keep_record(self, result, record, /):
+		self.__record = record
+	#-------------------------------------------------------------------------------#
+	def full_grid(self):
+		"""
+		Cuadrícula completa al azar: los cuadrantes de la diagonal (independientes entre sí) se
+		llenan con permutaciones aleatorias, la búsqueda completa el resto, y se mezclan bandas,
+		pilas, filas y columnas, y opcionalmente se transpone.
+
+		RETURN:
+		- (str) secuencia de 81 dígitos.
+		"""
+		rng = self.rng
+		values = ["0"]*81
+		for q in (0, 4, 8):
+			for i, d in zip(_UNITS[q], rng.sample("123456789", 9)):
+				values[i] = d
+		board = self.__board
+		board._load("".join(values), False)
+		board._count_solutions(1)
+		grid = board.get_current_sequence()
+		def order():
+			bands = rng.sample(_BLOCK_RANGE, 3)
+			return [b*3 + k for b in bands for k in rng.sample(_BLOCK_RANGE, 3)]
+		rows, cols = order(), order()
+		if rng.random() < 0.5: rows, cols = cols, rows
+		transposed = rng.random() < 0.5
+		return "".join(grid[c*9 + r] if transposed else grid[r*9 + c] for r in rows for c in cols)
+	#-------------------------------------------------------------------------------#
+	def __unique_without(self, values, removed, grid, /):
+		# El tablero (de solución única con las pistas 'removed') sigue siéndolo sin ellas si no
+		# hay solución con un valor distinto al de 'grid' en alguna de esas celdas
+		board = self.__board
+		seq = None
+		for i in removed:
+			if _forced(values, i, grid[i]): continue
+			if seq is None: seq = "".join(values)
+			board._load(seq, False)
+			if board._exclude(i, int(grid[i])) and board._count_solutions(1):
+				return False
+		return True
+	#-------------------------------------------------------------------------------#
+	def reduce(self, grid, /):
+		"""
+		Retira pistas de una cuadrícula completa, en orden aleatorio, mientras la solución
+		siga siendo única.
+
+		RETURN:
+		- (str) tablero mínimo, "." en las celdas vacías.
+		"""
+		values = list(grid)
+		cells = self.rng.sample(range(81), 81)
+		if self.symmetric:
+			groups = [(i, 80 - i) if i != 40 else (i,) for i in cells if i <= 40]
+		else:
+			groups = [(i,) for i in cells]
+		for group in groups:
+			for i in group: values[i] = "0"
+			if not self.__unique_without(values, group, grid):
+				for i in group: values[i] = grid[i]
+		return "".join(values).replace("0", ".")
+	#-------------------------------------------------------------------------------#
+	def grade(self, puzzle, /):
+		"""
+		Califica la dificultad de un tablero según lo que necesitó el motor para resolverlo:
+		"easy" si le bastaron los sencillos desnudos y ocultos, "medium" si requirió además
+		la técnica de pares gemelos, y "hard" si recurrió a la prueba-error (se registran
+		las opciones probadas, restauraciones y la profundidad alcanzada).
+
+		RETURN:
+		- (RatedPuzzle) tablero calificado, con su solución.
+		"""
+		result = _solve_sequence(self.__board, puzzle, 1, False, 0, False, self.__stats)
+		if result.status != _SOLVED:
+			raise ValueError("El tablero no tiene solución.")
+		record = self.__record
+		if result.guesses:
+			level = "hard"
+		else:
+			# los pares gemelos sólo se aplican cuando los sencillos ya no resuelven más celdas
+			level = "medium" if _NAKED_HIDDEN_TWINS in record["techniques"] else "easy"
+		puzzle = "".join(ch if ch in "123456789" else "." for ch in "".join(puzzle.split()))
+		return RatedPuzzle(puzzle, result.solution, level, result.guesses, result.backtracks, record["max_depth"])
+	#-------------------------------------------------------------------------------#
+	def candidate(self):
+		"""
+		Genera y califica un tablero mínimo de solución única.
+
+		RETURN:
+		- (RatedPuzzle) tablero generado.
+		"""
+		return self.grade(self.reduce(self.full_grid()))
+
+#-------------------------------------------------------------------------------#
+
+_worker_generator = None	# generador propio de cada proceso
+
+_worker_filter = None		# (nivel mínimo, profundidad mínima) de los tableros conservados
+
+def _accepted(rated, level, min_depth, /):
+	return LEVELS.index(rated.level) >= level and rated.depth >= min_depth
+#-------------------------------------------------------------------------------#
+def _init_worker(symmetric, level, min_depth, /):
+	global _worker_generator, _worker_filter
+	_worker_generator = PuzzleGenerator(symmetric=symmetric)
+	_worker_filter = (level, min_depth)
+#-------------------------------------------------------------------------------#
+def _generate_in_worker(key, /):
+	# Cada candidato usa su propia semilla: el resultado no depende del proceso que lo genere
+	_worker_generator.rng.seed(key)
+	rated = _worker_generator.candidate()
+	return rated if _accepted(rated, *_worker_filter) else None
+#-------------------------------------------------------------------------------#
+def generate(total, /, level=None, min_depth:int=0, symmetric=False, workers:int=1, chunksize:int=4, seed=None):
+	"""
+	Generador de tableros de 9×9 de solución única y dificultad calificada. Los candidatos
+	que no alcanzan el nivel ó la profundidad solicitados se descartan (en los procesos, sin
+	enviarse al principal). Con la misma semilla se obtienen los mismos tableros, en el mismo
+	orden, con cualquier cantidad de procesos.
+
+	ARGS:
+	- total		: (int) cantidad de tableros a entregar.
+	- level		: (str) nivel mínimo: "easy" (cualquiera), "medium" ó "hard".
+	- min_depth	: (int) profundidad mínima de la prueba-error.
+	- symmetric	: (bool) tableros con pistas simétricas respecto al centro.
+	- workers	: (int) número de procesos generadores.
+	- chunksize	: (int) cantidad de candidatos enviados a la vez a cada proceso.
+	- seed		: (int|str) semilla (None: al azar).
+
+	RETURN:
+	- (RatedPuzzle) uno por tablero generado.
+	"""
+	if level is not None and level not in LEVELS:
+		raise ValueError(f"Nivel '{level}' no reconocido, opciones: {', '.join(LEVELS)}.")
+	if workers < 1 or chunksize < 1:
+		raise ValueError("'workers' y 'chunksize' deben ser mayores a cero.")
+	if total < 1: return
+	if seed is None: seed = random.randrange(1 << 32)
+	level = LEVELS.index(level) if level is not None else 0
+	keys = (f"{seed}:{k}" for k in count())
+	if workers == 1:
+		_init_worker(symmetric, level, min_depth)
+		for key in keys:
+			if (rated:= _generate_in_worker(key)) is not None:
+				yield rated
+				total -= 1
+				if not total: return
+	from multiprocessing import Pool
+	# Los candidatos se envían por ventanas: 'imap' consumiría sin fin la secuencia de semillas
+	window = workers * chunksize * 4
+	with Pool(workers, _init_worker, (symmetric, level, min_depth)) as pool:
+		while True:
+			for rated in pool.imap(_generate_in_worker, list(islice(keys, window)), chunksize):
+				if rated is not None:
+					yield rated
+					total -= 1
+					if not total: return
+#-------------------------------------------------------------------------------#
+def main(argv=None):
+	parser = ArgumentParser(description="Generador de tableros Sudoku de solución única, con calificación de dificultad.")
+	parser.add_argument("count", type=int, help="cantidad de tableros a generar")
+	parser.add_argument("--level", choices=LEVELS, help="nivel mínimo de dificultad")
+	parser.add_argument("--min-depth", type=int, default=0, help="profundidad mínima de la prueba-error")
+	parser.add_argument("--symmetric", action="store_true", help="pistas simétricas respecto al centro")
+	parser.add_argument("--workers", type=int, default=1, help="procesos generadores")
+	parser.add_argument("--seed", help="semilla, para generar los mismos tableros")
+	parser.add_argument("--grades", action="store_true", help="agregar pistas, nivel, opciones probadas y profundidad a cada línea")
+	args = parser.parse_args(argv)
+
+	time_start = time.perf_counter()
+	n = 0
+	for rated in generate(args.count, level=args.level, min_depth=args.min_depth, symmetric=args.symmetric,
+			workers=args.workers, seed=args.seed):
+		n += 1
+		line = rated.puzzle
+		if args.grades:
+			line += f"\t{rated.givens}\t{rated.level}\t{rated.guesses}\t{rated.depth}"
+		sys.stdout.write(line + "\n")
+		sys.stdout.flush()
+	elapsed = time.perf_counter() - time_start
+	print(f"{n} puzzles generated in {elapsed:.2f} secs ({n/elapsed if elapsed else 0:.1f} per sec)", file=sys.stderr)
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main())
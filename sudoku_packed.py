@@ -0,0 +1,237 @@
+# -----------------------------------------------------------
+# PACKED FORMAT for SUDOKU SOLVER
+#
+# Formato binario compacto para archivos de tableros (o de sus
+# soluciones): 4 bits por celda, 41 bytes por tablero, con una
+# cabecera fija. Los registros son de tamaño constante, por lo que
+# el tablero i se lee directamente (archivo mapeado en memoria) sin
+# recorrer ni interpretar los anteriores.
+#
+# Uso:
+#   python3 sudoku_packed.py pack data/top95.txt top95.sdk
+#   python3 sudoku_packed.py pack data/easy50.txt easy50.sdk --sep "========"
+#   python3 sudoku_packed.py solve top95.sdk top95.sol.sdk --engine bitmask
+#   python3 sudoku_packed.py unpack top95.sol.sdk
+#
+# Estructura:
+#   cabecera (32 bytes): "SDKP", versión, tipo (tableros ó soluciones),
+#       celdas por tablero, bytes por registro y cantidad de registros
+#   registro i (41 bytes, en 32 + 41*i): un dígito por nibble, el de
+#       la celda par en el nibble alto; 0 es celda vacía
+# Las secuencias inválidas se guardan como registros vacíos, y los
+# tableros sin solución como soluciones vacías, para conservar la
+# numeración de la fuente.
+# -----------------------------------------------------------
+
+import mmap
+import os
+import struct
+import sys
+from sudoku_solver import ENGINES, SudokuBoard, iter_sequences
+
+MAGIC = b"SDKP"
+VERSION = 1
+# Tipos de archivo
+PUZZLES, SOLUTIONS = 0, 1
+# magic, versión, tipo, celdas, bytes por registro, registros (y relleno hasta 32 bytes)
+_HEADER = struct.Struct("<4sBBHHQ14x")
+_CELLS = 81
+_RECORD_SIZE = (_CELLS + 1) // 2
+_EMPTY_RECORD = bytes(_RECORD_SIZE)
+# Cada carácter de una secuencia a su nibble: los dígitos 1-9 se conservan, el resto es "0"
+_NIBBLES = bytes(ch if ch in b"123456789" else ord("0") for ch in range(256))
+
+#####################################################################################################
+#####################################################################################################
+
+def _pack_sequence(sequence, /):
+	# Secuencia de 81 caracteres -> registro; cada dígito ya es un carácter hexadecimal válido
+	seq = "".join(sequence.split())
+	if len(seq) != _CELLS: return _EMPTY_RECORD
+	return bytes.fromhex((seq.encode("latin-1", "replace").translate(_NIBBLES) + b"0").decode())
+#-------------------------------------------------------------------------------#
+def _unpack_record(record, /):
+	return record.hex()[:_CELLS]
+#-------------------------------------------------------------------------------#
+
+class PackedWriter:
+	"""
+	Escribe registros en un archivo de formato empaquetado; la cantidad de registros de la
+	cabecera se actualiza al cerrarlo.
+
+	ARGS:
+	- path		: (str) archivo a crear (se sobrescribe si existe).
+	- kind		: (int) PUZZLES ó SOLUTIONS.
+	"""
+	#-------------------------------------------------------------------------------#
+	def __init__(self, path, kind=PUZZLES):
+		if kind not in (PUZZLES, SOLUTIONS):
+			raise ValueError("'kind' debe ser PUZZLES ó SOLUTIONS.")
+		self.kind = kind
+		self.count = 0
+		self.__file = open(path, "wb")
+		self.__file.write(_HEADER.pack(MAGIC, VERSION, kind, _CELLS, _RECORD_SIZE, 0))
+	#-------------------------------------------------------------------------------#
+	def write(self, sequence, /):
+		"""
+		Agrega una secuencia (None ó inválida: registro vacío).
+		"""
+		self.__file.write(_EMPTY_RECORD if sequence is None else _pack_sequence(sequence))
+		self.count += 1
+	#-------------------------------------------------------------------------------#
+	def close(self):
+		if self.__file.closed: return
+		self.__file.seek(0)
+		self.__file.write(_HEADER.pack(MAGIC, VERSION, self.kind, _CELLS, _RECORD_SIZE, self.count))
+		self.__file.close()
+	#-------------------------------------------------------------------------------#
+	def __enter__(self):
+		return self
+	#-------------------------------------------------------------------------------#
+	def __exit__(self, *exc):
+		self.close()
+
+#-------------------------------------------------------------------------------#
+
+class PackedPuzzles:
+	"""
+	Lector de un archivo de formato empaquetado, mapeado en memoria: 'len()', acceso por
+	índice (también negativo) y por rebanadas, e iteración. Cada elemento es una secuencia
+	de 81 dígitos ("0" en las celdas vacías; una secuencia de ceros si el registro está vacío).
+
+	ARGS:
+	- path		: (str) archivo a leer.
+	"""
+	#-------------------------------------------------------------------------------#
+	def __init__(self, path):
+		self.path = path
+		with open(path, "rb") as f:
+			header = f.read(_HEADER.size)
+			if len(header) < _HEADER.size or header[:len(MAGIC)] != MAGIC:
+				raise ValueError(f"'{path}' no está en formato empaquetado.")
+			magic, version, self.kind, cells, size, self.__count = _HEADER.unpack(header)
+			if version != VERSION or cells != _CELLS or size != _RECORD_SIZE:
+				raise ValueError(f"Versión ó dimensiones no soportadas en '{path}'.")
+			if os.fstat(f.fileno()).st_size < _HEADER.size + self.__count * _RECORD_SIZE:
+				raise ValueError(f"'{path}' está truncado.")
+			self.__map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if self.__count else None
+	#-------------------------------------------------------------------------------#
+	def __len__(self):
+		return self.__count
+	#-------------------------------------------------------------------------------#
+	def __getitem__(self, index):
+		if type(index) == slice:
+			return [self[i] for i in range(*index.indices(self.__count))]
+		if index < 0: index += self.__count
+		if not 0 <= index < self.__count:
+			raise IndexError("Índice de tablero fuera de rango.")
+		start = _HEADER.size + index * _RECORD_SIZE
+		return _unpack_record(self.__map[start: start + _RECORD_SIZE])
+	#-------------------------------------------------------------------------------#
+	def __iter__(self):
+		# Por bloques de registros, para reducir las lecturas del mapa
+		block = 4096
+		for first in range(0, self.__count, block):
+			start = _HEADER.size + first * _RECORD_SIZE
+			data = self.__map[start: start + min(block, self.__count - first) * _RECORD_SIZE].hex()
+			width = 2 * _RECORD_SIZE
+			for k in range(0, len(data), width):
+				yield data[k: k + _CELLS]
+	#-------------------------------------------------------------------------------#
+	def close(self):
+		if self.__map is not None:
+			self.__map.close()
+			self.__map = None
+	#-------------------------------------------------------------------------------#
+	def __enter__(self):
+		return self
+	#-------------------------------------------------------------------------------#
+	def __exit__(self, *exc):
+		self.close()
+
+#-------------------------------------------------------------------------------#
+
+def is_packed(path, /):
+	"""
+	Verifica si un archivo está en formato empaquetado (por su firma).
+	"""
+	try:
+		with open(path, "rb") as f:
+			return f.read(len(MAGIC)) == MAGIC
+	except OSError:
+		return False
+#-------------------------------------------------------------------------------#
+def pack(sources, path, /, sep="\n"):
+	"""
+	Convierte secuencias de tableros (archivos de texto en cualquiera de los formatos
+	aceptados por 'solve_from', ó secuencias sueltas) a un archivo empaquetado.
+
+	ARGS:
+	- sources	: (str|list) secuencia(s) y/o archivo(s) de origen.
+	- path		: (str) archivo empaquetado a crear.
+	- sep		: (str) separador entre secuencias dentro de los archivos de origen.
+
+	RETURN:
+	- (int) cantidad de tableros escritos.
+	"""
+	with PackedWriter(path, PUZZLES) as writer:
+		for seq in iter_sequences([sources] if type(sources) == str else sources, sep):
+			writer.write(seq)
+	return writer.count
+#-------------------------------------------------------------------------------#
+def unpack(path, /, blank="."):
+	"""
+	Generador de las secuencias de un archivo empaquetado, en formato de texto ('blank' en
+	las celdas vacías).
+	"""
+	with PackedPuzzles(path) as puzzles:
+		for seq in puzzles:
+			yield seq.replace("0", blank) if blank != "0" else seq
+#-------------------------------------------------------------------------------#
+def write_solutions(results, path, /):
+	"""
+	Guarda las soluciones de un lote (resultados de 'iter_results' ó 'solve_from') en un
+	archivo empaquetado paralelo al de los tableros: la solución del tablero i en el registro i.
+
+	RETURN:
+	- (int) cantidad de registros escritos.
+	"""
+	with PackedWriter(path, SOLUTIONS) as writer:
+		for result in results:
+			writer.write(result.solution)
+	return writer.count
+#-------------------------------------------------------------------------------#
+def main(argv=None):
+	# 'argparse' sólo se importa al usarse como programa: 'iter_sequences' importa este módulo
+	from argparse import ArgumentParser
+	parser = ArgumentParser(description="Conversión entre archivos de tableros Sudoku en texto y en formato empaquetado.")
+	commands = parser.add_subparsers(dest="command", required=True)
+	command = commands.add_parser("pack", help="convertir archivos de texto a formato empaquetado")
+	command.add_argument("sources", nargs="+", help="archivos de secuencias ('-' para la entrada estándar)")
+	command.add_argument("output", help="archivo empaquetado a crear")
+	command.add_argument("--sep", default="\n", help="separador entre secuencias de los archivos de origen")
+	command = commands.add_parser("unpack", help="escribir las secuencias de un archivo empaquetado, una por línea")
+	command.add_argument("source", help="archivo empaquetado")
+	command.add_argument("--blank", default=".", help="carácter para las celdas vacías")
+	command = commands.add_parser("solve", help="resolver un archivo y guardar un archivo paralelo de soluciones")
+	command.add_argument("source", help="archivo de tableros (empaquetado ó de texto)")
+	command.add_argument("output", help="archivo empaquetado de soluciones a crear")
+	command.add_argument("--sep", default="\n", help="separador entre secuencias, si el origen es de texto")
+	command.add_argument("--engine", default="bitmask", choices=ENGINES, help="motor de resolución")
+	command.add_argument("--workers", type=int, default=1, help="procesos resolutores")
+	args = parser.parse_args(argv)
+
+	if args.command == "pack":
+		count = pack(args.sources, args.output, sep=args.sep)
+		print(f"{count} puzzles written to {args.output}", file=sys.stderr)
+	elif args.command == "unpack":
+		for seq in unpack(args.source, blank=args.blank):
+			sys.stdout.write(seq + "\n")
+	else:
+		results = SudokuBoard().iter_results(args.source, sep=args.sep, engine=args.engine, workers=args.workers)
+		count = write_solutions(results, args.output)
+		print(f"{count} solutions written to {args.output}", file=sys.stderr)
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,222 @@
+# -----------------------------------------------------------
+# SOLVING SERVICE for SUDOKU SOLVER
+#
+# Servicio asyncio que recibe tableros por líneas (TCP ó entrada
+# estándar), los reparte entre procesos de 'sudoku_solver.py' y
+# devuelve cada resultado, como una línea JSON, apenas se resuelve.
+#
+# Uso:
+#   python3 sudoku_server.py --port 8765 --workers 4 --timeout 2
+#   python3 sudoku_server.py --stdio < data/top95.txt
+#
+# Protocolo (una línea por solicitud, una línea por respuesta):
+#   -> ..5.3...(81 caracteres)
+#   -> {"id": "a1", "puzzle": "..5.3...", "timeout": 0.5, "max_guesses": 1000}
+#   <- {"id": "a1", "status": "solved", "solution": "145327...", "elapsed": 0.0012, ...}
+# Las respuestas pueden llegar en distinto orden que las solicitudes; el
+# "id" (por defecto, el número de línea) permite asociarlas.
+# -----------------------------------------------------------
+
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import multiprocessing
+import json
+import os
+import sys
+from sudoku_solver import ENGINES, SudokuBoard, SolutionCache
+
+# Segundos adicionales al 'timeout' antes de responder sin esperar al proceso: la búsqueda se
+# detiene sola al vencer su plazo, pero sólo lo verifica en cada opción probada
+_GRACE = 1.0
+
+_worker_board = None	# tablero propio de cada proceso resolutor
+
+_worker_engine = None
+
+#####################################################################################################
+#####################################################################################################
+
+def _init_service_worker(engine, /):
+	global _worker_board, _worker_engine
+	_worker_board = SudokuBoard()
+	_worker_engine = engine
+#-------------------------------------------------------------------------------#
+def _solve_request(item, /):
+	# 'item': (secuencia, opciones máximas, segundos máximos); resuelve con la API pública
+	seq, max_guesses, timeout = item
+	return next(_worker_board.iter_results(seq, engine=_worker_engine, max_guesses=max_guesses, timeout=timeout))
+
+#-------------------------------------------------------------------------------#
+
+class SolverService:
+	"""
+	Front-end asyncio de un pool de procesos resolutores. Cada conexión (o la entrada
+	estándar) puede tener a lo sumo 'backlog' tableros en curso: al alcanzarse, se deja de
+	leer la entrada hasta que alguno termine. Un tablero patológico sólo ocupa su proceso
+	hasta vencer su plazo, sin retener las respuestas de los demás.
+
+	ARGS:
+	- engine	: (str) motor de resolución ("objects", "bitmask", "dlx" ó "scalable").
+	- workers	: (int) procesos resolutores (por defecto, uno por CPU).
+	- timeout	: (float) segundos máximos de búsqueda por tablero; una solicitud puede
+			pedir menos, no más.
+	- max_guesses	: (int) opciones máximas que puede probar la búsqueda por tablero.
+	- backlog	: (int) tableros en curso por conexión (por defecto, 4 por proceso).
+	- cache		: (SolutionCache) caché opcional, consultada antes de despachar.
+	"""
+	#-------------------------------------------------------------------------------#
+	def __init__(self, engine="bitmask", workers=None, timeout=5.0, max_guesses=None, backlog=None, cache=None):
+		self.workers = workers or os.cpu_count() or 1
+		self.timeout = timeout
+		self.max_guesses = max_guesses
+		self.backlog = backlog or self.workers * 4
+		self.cache = cache
+		# Los procesos se crean a demanda, con conexiones ya abiertas: no deben heredar sus sockets
+		# (el cliente no vería el cierre de su conexión), por lo que no se usa 'fork'
+		context = multiprocessing.get_context(
+			"forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn")
+		self.__executor = ProcessPoolExecutor(self.workers, context, _init_service_worker, (engine,))
+	#-------------------------------------------------------------------------------#
+	@staticmethod
+	def __capped(requested, limit, /):
+		if requested is None: return limit
+		return requested if limit is None else min(requested, limit)
+	#-------------------------------------------------------------------------------#
+	async def solve(self, puzzle, /, timeout=None, max_guesses=None):
+		"""
+		Resuelve un tablero en el pool, sin bloquear el bucle de eventos.
+
+		RETURN:
+		- (dict) respuesta: "status" ("solved", "unsolved", "excluded", "timeout",
+			"guess_limit" ó "error") y, si corresponde, "solution", "elapsed", "guesses"
+			y "backtracks".
+		"""
+		seq = "".join(puzzle.split())
+		# la caché sólo se consulta con tableros de 81 caracteres; el resto lo excluye el proceso
+		if self.cache is not None and len(seq) == 81 and (solution:= self.cache.get(seq)) is not None:
+			return {"status": "solved", "solution": solution, "elapsed": 0.0, "guesses": 0, "backtracks": 0, "cached": True}
+		timeout = self.__capped(timeout, self.timeout)
+		max_guesses = self.__capped(max_guesses, self.max_guesses)
+		loop = asyncio.get_running_loop()
+		future = loop.run_in_executor(self.__executor, _solve_request, (seq, max_guesses, timeout))
+		try:
+			result = await asyncio.wait_for(future, None if timeout is None else timeout + _GRACE)
+		except asyncio.TimeoutError:
+			return {"status": "timeout"}
+		status = result.status
+		if status == "excluded":
+			return {"status": "excluded"}
+		if status == "aborted":
+			status = "guess_limit" if max_guesses is not None and result.guesses >= max_guesses else "timeout"
+		elif status == "solved" and self.cache is not None:
+			self.cache.put(seq, result.solution)
+		return {"status": status, "solution": result.solution, "elapsed": round(result.elapsed, 6),
+			"guesses": result.guesses, "backtracks": result.backtracks}
+	#-------------------------------------------------------------------------------#
+	async def __answer(self, line, lineN, emit, slots, /):
+		# Procesa una solicitud y escribe su respuesta; libera su lugar en el backlog
+		rid = lineN
+		try:
+			if line.startswith("{"):
+				request = json.loads(line)
+				rid = request.get("id", lineN)
+				response = await self.solve(str(request["puzzle"]),
+					timeout=request.get("timeout"), max_guesses=request.get("max_guesses"))
+			else:
+				response = await self.solve(line)
+		except Exception as e:
+			response = {"status": "error", "error": f"[{type(e).__name__}] {e}"}
+		finally:
+			slots.release()
+		await emit(json.dumps({"id": rid, **response}) + "\n")
+	#-------------------------------------------------------------------------------#
+	async def serve_lines(self, reader, emit, /):
+		"""
+		Atiende solicitudes, una por línea, hasta el fin de la entrada.
+
+		ARGS:
+		- reader	: objeto con la corrutina 'readline()' (p.ej. 'asyncio.StreamReader').
+		- emit		: corrutina que recibe cada línea de respuesta.
+		"""
+		slots = asyncio.Semaphore(self.backlog)
+		pending = set()
+		lineN = 0
+		while True:
+			await slots.acquire()		# contrapresión: no leer más si el backlog está lleno
+			data = await reader.readline()
+			if not data:
+				slots.release()
+				break
+			lineN += 1
+			if not (line:= data.decode().strip() if type(data) == bytes else data.strip()):
+				slots.release()
+				continue
+			task = asyncio.ensure_future(self.__answer(line, lineN, emit, slots))
+			pending.add(task)
+			task.add_done_callback(pending.discard)
+		if pending: await asyncio.wait(pending)
+	#-------------------------------------------------------------------------------#
+	async def handle_client(self, reader, writer):
+		"""
+		Manejador de conexiones para 'asyncio.start_server'.
+		"""
+		async def emit(text):
+			writer.write(text.encode())
+			await writer.drain()
+		try:
+			await self.serve_lines(reader, emit)
+		except ConnectionError:
+			pass
+		finally:
+			writer.close()
+	#-------------------------------------------------------------------------------#
+	def close(self):
+		self.__executor.shutdown(wait=True)
+
+#-------------------------------------------------------------------------------#
+
+class _StdinReader:
+	# Lectura de líneas de la entrada estándar sin bloquear el bucle de eventos (funciona
+	# también con archivos redirigidos, que no admiten lectura asíncrona directa)
+	async def readline(self):
+		return await asyncio.get_running_loop().run_in_executor(None, sys.stdin.readline)
+#-------------------------------------------------------------------------------#
+async def _emit_stdout(text, /):
+	sys.stdout.write(text)
+	sys.stdout.flush()
+#-------------------------------------------------------------------------------#
+async def _serve(service, args, /):
+	if args.stdio:
+		await service.serve_lines(_StdinReader(), _emit_stdout)
+		return
+	server = await asyncio.start_server(service.handle_client, args.host, args.port)
+	print(f"Serving on {', '.join(str(s.getsockname()) for s in server.sockets)}", file=sys.stderr)
+	async with server:
+		await server.serve_forever()
+#-------------------------------------------------------------------------------#
+def main(argv=None):
+	parser = ArgumentParser(description="Servicio asyncio de resolución de tableros Sudoku (líneas JSON).")
+	parser.add_argument("--host", default="127.0.0.1", help="dirección donde escuchar")
+	parser.add_argument("--port", type=int, default=8765, help="puerto TCP donde escuchar")
+	parser.add_argument("--stdio", action="store_true", help="atender la entrada estándar en lugar de TCP")
+	parser.add_argument("--engine", default="bitmask", choices=ENGINES, help="motor de resolución")
+	parser.add_argument("--workers", type=int, help="procesos resolutores (por defecto, uno por CPU)")
+	parser.add_argument("--timeout", type=float, default=5.0, help="segundos máximos de búsqueda por tablero")
+	parser.add_argument("--max-guesses", type=int, help="opciones máximas probadas por tablero")
+	parser.add_argument("--backlog", type=int, help="tableros en curso por conexión")
+	parser.add_argument("--cache-size", type=int, default=0, help="soluciones en caché (0 = sin caché)")
+	args = parser.parse_args(argv)
+
+	service = SolverService(args.engine, args.workers, args.timeout, args.max_guesses, args.backlog,
+		SolutionCache(args.cache_size) if args.cache_size else None)
+	try:
+		asyncio.run(_serve(service, args))
+	except KeyboardInterrupt:
+		pass
+	finally:
+		service.close()
+	return 0
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -9,16 +9,62 @@
 # OS tested: Ubuntu (linux)
 # -----------------------------------------------------------
 
-from pathlib import Path
-from itertools import combinations
-import re 
+from itertools import combinations, islice, chain, permutations, product
+from collections import deque, OrderedDict
+from math import factorial, prod, inf, isqrt
+import os
+import sys
 import time
-# from sys import setrecursionlimit		# default recursion limit = 10^4
+# NumPy (opcional) se importa recién al usar 'solve_batch' (ver '_numpy_available'), para no
+# cargarlo en cada arranque del programa
+np = None
 
 _BOARD_RANGE = range(9)
 _BLOCK_RANGE = range(3)
 _VALID_DIGITS = list(range(1, 10))
 _STARTING_COUNTER = dict(zip(_VALID_DIGITS, (9,)*len(_VALID_DIGITS)))
+# Tamaños de cuadrante admitidos (tableros de 4×4 a 25×25) y símbolo de cada valor (0: celda
+# vacía); en 9×9 los símbolos son los dígitos de siempre
+_BOX_SIZES = range(2, 6)
+_SYMBOLS = "0123456789ABCDEFGHIJKLMNOP"
+# Pistas mínimas de un tablero con solución única, por tamaño de cuadrante (sólo se conocen las
+# de 4×4 y 9×9)
+_MINIMUM_GIVENS = {2: 4, 3: 17}
+#-------------------------------------------------------------------------------#
+def _unit_tables(box, /):
+	# Unidades de un tablero de cuadrantes de box×box (celdas indexadas en orden fila-columna):
+	# cuadrantes, filas y columnas, en ese orden; por celda, sus 3 unidades y sus celdas vecinas
+	size = box*box
+	span = range(size)
+	units = tuple(
+		[tuple(((q//box)*box + k//box)*size + (q%box)*box + k%box for k in span) for q in span] +
+		[tuple(r*size + k for k in span) for r in span] +
+		[tuple(k*size + c for k in span) for c in span])
+	cell_units = tuple(((i//size//box)*box + i%size//box, size + i//size, 2*size + i%size) for i in range(size*size))
+	peers = tuple(tuple(sorted({j for u in cell_units[i] for j in units[u]} - {i})) for i in range(size*size))
+	return units, cell_units, peers
+#-------------------------------------------------------------------------------#
+# Tablas inmutables compartidas por todos los tableros de 9×9. Unidades: cuadrantes (0..8), 
+# filas (9..17) y columnas (18..26), cada una con sus 9 celdas; por celda: sus 3 unidades 
+# (cuadrante, fila, columna) y sus 20 celdas vecinas
+_UNITS, _CELL_UNITS, _PEERS = _unit_tables(3)
+# Estados de un tablero tras procesarlo
+_EXCLUDED, _UNSOLVED, _SOLVED = "excluded", "unsolved", "solved"
+_ABORTED = "aborted"	# búsqueda detenida por límite de opciones probadas o de tiempo
+# Técnicas con las que se resuelve una celda
+_GIVEN, _NAKED_SINGLE, _GUESS = "given", "naked_single", "guess"
+_SOLUTION = "solution"	# pista tomada de la solución, sin una técnica que la deduzca (ver 'hint')
+_HIDDEN_SINGLE_BY = ("hidden_single_quadrant", "hidden_single_row", "hidden_single_column")
+_NAKED_HIDDEN_TWINS = "naked_hidden_twins"
+# Técnicas adicionales aplicadas por defecto tras los pares gemelos (ver '_TECHNIQUES')
+_DEFAULT_TECHNIQUES = ("box_line", "naked_pairs", "hidden_pairs")
+# Estrategia de ramificación por defecto de la prueba-error: (elección de celda, orden de valores)
+_DEFAULT_BRANCHING = ("twins", "natural")
+# Roles de los métodos medidos por 'SolverStats' que no son técnicas de propagación
+_SEARCH, _RESTORE, _NODE = "search", "restore", "node"
+# Retorno de la búsqueda de los motores al alcanzar el límite de opciones probadas ó de tiempo
+# (en otro caso, retorna la cantidad de soluciones halladas)
+_LIMITED = -1
 
 #####################################################################################################
 #####################################################################################################
@@ -37,20 +83,49 @@ class FColors:
 #####################################################################################################
 
 class SudokuBoard:
+	# Métodos medidos por 'SolverStats' y la técnica (o rol) que representan
+	_INSTRUMENTED = {
+		"_SudokuBoard__place_unique_candidates": _NAKED_SINGLE,
+		"_SudokuBoard__trace_single_frequency_values": _HIDDEN_SINGLE_BY,
+		"_SudokuBoard__apply_naked_hidden_twins_technique": _NAKED_HIDDEN_TWINS,
+		"_SudokuBoard__apply_technique": None,
+		"_SudokuBoard__search": _SEARCH,
+		"_SudokuBoard__open_node": _NODE,
+		"_SudokuBoard__restore_board_by_using_snapshot": _RESTORE,
+	}
+	# Límites de la búsqueda por tablero (ver '_solve_sequence')
+	_max_guesses = inf
+	_deadline = inf
+	# Técnicas adicionales aplicadas, en orden, tras los pares gemelos
+	_techniques = _DEFAULT_TECHNIQUES
+	# Elección de celda y orden de valores de la prueba-error (ver '_branching_strategy')
+	_branching = _DEFAULT_BRANCHING
+	# Tamaño de cuadrante: sólo 'ScalableBoard' admite otro distinto de 3
+	_box = 3
 	#-------------------------------------------------------------------------------#
 	def __init__(self):
 		self.__cells = []
 		self.__quadrants = []
 		self.__rows = []
 		self.__columns = []
+		self.__all_cells = []	# celdas del tablero en orden fila-columna
+		self.__sectors = []		# cuadrantes, filas y columnas
+		self._unique_candidates = UniqueCandidatesQueue()	# celdas con candidato único
+		self._conflict = None	# celda que se quedó sin candidatos (tablero inconsistente)
 		self.__step = 0		# incrementa en 1 por celda-solución encontrada
+		self.__guesses = 0		# opciones probadas en el proceso de prueba-error
+		self.__backtracks = 0	# restauraciones del tablero tras una opción fallida
+		self.__placed_by = [None]*81	# técnica con la que se resolvió cada celda
+		self.__engines = {"objects": self}	# motores instanciados, reutilizables entre llamadas
+		self.__clashes = 0		# pares (sector, dígito) repetidos por el jugador (ver 'place')
+		self.__build_board()
 	#-------------------------------------------------------------------------------#
 	def __build_board(self):
 		# Defines
 		_MatrixOf = lambda ownerObj,classType,scope: [[classType(ownerObj) for c in scope] for r in scope]
 		_VectorOf = lambda ownerObj,classType,scope: [classType(ownerObj) for i in scope]
 		# Ejecutas
-		Cell.unique_candidates.clear()
+		self._unique_candidates.clear()
 		self.__columns.clear()
 		self.__rows.clear()
 		self.__quadrants.clear()
@@ -59,21 +134,41 @@ class SudokuBoard:
 		self.__quadrants = _VectorOf(self, Quadrant, _BOARD_RANGE)
 		self.__rows = _VectorOf(self, Row, _BOARD_RANGE)
 		self.__columns = _VectorOf(self, Column, _BOARD_RANGE)
+		self.__all_cells = [cell for row in self.__cells for cell in row]
+		self.__sectors = self.__quadrants + self.__rows + self.__columns
+		self.__placed_by = [None]*81
 		self.__link_cells_to_sectors()
 	#-------------------------------------------------------------------------------#
-	def __load_data(self, sequence, restoring=False, /):
-		try:
-			for i,value in enumerate(sequence):
-				if value.isnumeric() and int(value) > 0:
-					cell = self.__cells[i // 9][ i % 9]
-					cell.value = int(value)
-					if not restoring: cell.is_given = True
-					# print(f"Cell[{i//9},{i%9}] = {value}",">"*20)
-					# self.__show_availability_per_sector()
-			return True
-		except NoCandidatesError as e:
-			print("[ERROR] Tablero inconsistente.", e)
-			return False
+	def __reset_board(self):
+		# Devuelve celdas y sectores a su estado inicial, sin reconstruir el tablero
+		for cell in self.__all_cells:
+			cell._reset()
+		for sector in self.__sectors:
+			sector._available = _STARTING_COUNTER.copy()
+			sector._placed = [0]*10
+		self._unique_candidates.clear()
+		self._conflict = None
+		self.__placed_by = [None]*81
+		self.__clashes = 0
+	#-------------------------------------------------------------------------------#
+	def __load_data(self, sequence, verbose=True, stop=True, /):
+		# Con 'stop' en False (modo de juego) se cargan todas las pistas aunque alguna celda
+		# se quede sin candidatos; el resultado indica igualmente si el tablero es consistente
+		consistent = True
+		for i,value in enumerate(sequence):
+			if value.isnumeric() and int(value) > 0:
+				cell = self.__cells[i // 9][ i % 9]
+				cell.value = int(value)
+				cell.is_given = True
+				self.__placed_by[i] = _GIVEN
+				# print(f"Cell[{i//9},{i%9}] = {value}",">"*20)
+				# self.__show_availability_per_sector()
+				if self._conflict is not None and consistent:
+					if verbose: print("[ERROR] Tablero inconsistente.", 
+						f"Celda {self._conflict.pos} se ha quedado sin valores candidatos")
+					if stop: return False
+					consistent = False
+		return consistent
 	#-------------------------------------------------------------------------------#
 	def show_board(self, boardN, can_show, /):
 		"""
@@ -94,25 +189,19 @@ class SudokuBoard:
 				print("")
 	#-------------------------------------------------------------------------------#
 	def __link_cells_to_sectors(self):
-		for r in _BOARD_RANGE:
-			for c in _BOARD_RANGE:
-				quadrant = self.__quadrants[(r//3)*3+(c//3)]
-				cell = self.__cells[r][c]
-				quadrant.cells.append(cell)
-				cell._from_quadrant = quadrant
-				cell.pos = (r,c)
-		for r in _BOARD_RANGE:
-			self.__rows[r].cells.extend(self.__cells[r])
-			for c in _BOARD_RANGE:
-				self.__cells[r][c]._from_row = self.__rows[r]
-		for c in _BOARD_RANGE:
-			for r in _BOARD_RANGE:
-				self.__columns[c].cells.append(self.__cells[r][c])
-				self.__cells[r][c]._from_column = self.__columns[c]
+		for sector, indexes in zip(self.__sectors, _UNITS):
+			sector.cells.extend(self.__all_cells[i] for i in indexes)
+		for i, cell in enumerate(self.__all_cells):
+			q, r, c = _CELL_UNITS[i]
+			cell._from_quadrant = self.__sectors[q]
+			cell._from_row = self.__sectors[r]
+			cell._from_column = self.__sectors[c]
+			cell.pos = (i // 9, i % 9)
 	#-------------------------------------------------------------------------------#
 	def __trace_single_frequency_values(self, way, show_by_step, showing, boardN, /):
 		"""
-		Método privado que ratrea candidatos de frecuencia por sección.
+		Método privado que ratrea candidatos de frecuencia por sección. Retorna None si el
+		tablero es inconsistente, o si hubo cambios en el tablero.
 		
 		ARGS:
 		- way		: (int) modo de rastreo, por cuadrante/fila/columna.
@@ -124,7 +213,6 @@ class SudokuBoard:
 		"""
 		# Definiendo variables
 		BY_QUADRANT, BY_ROW, BY_COLUMN = _BLOCK_RANGE
-		d = "Cuadrante" if way==BY_QUADRANT else "Fila" if way==BY_ROW else "Columna"
 		# Seleccionar los sectores a procesar
 		sectors = self.__quadrants if way==BY_QUADRANT else self.__rows if way==BY_ROW else self.__columns
 		# Iniciar al barrido por fila/columna
@@ -148,7 +236,7 @@ class SudokuBoard:
 								targets[cell] = unique
 								break	# salir del FOR en curso
 							else:
-								raise Exception(f"[{d}] Celda contiene más de un candidato único.")
+								return None		# celda con más de un candidato único
 				# tratar celdas con candidatos de frecuencia única
 				cell = unique = None
 				if targets:
@@ -157,6 +245,7 @@ class SudokuBoard:
 					for cell, unique in targets.items():
 						self.__step += 1
 						cell.value = unique
+						self.__placed_by[cell.pos['row']*9 + cell.pos['col']] = _HIDDEN_SINGLE_BY[way]
 						self.show_board(boardN, showing and show_by_step and not (self.__step % show_by_step))
 		return change_exists
 	#-------------------------------------------------------------------------------#
@@ -196,153 +285,230 @@ class SudokuBoard:
 		# self.__show_availability_per_sector()
 		return change_exists
 	#-------------------------------------------------------------------------------#
-	def __restore_board_by_using_sequence(self, sequence, step, /):
-		# Reiniciar contadores de todas las secciones
-		for i in _BOARD_RANGE:
-			self.__quadrants[i]._available = _STARTING_COUNTER.copy()
-			self.__rows[i]._available = _STARTING_COUNTER.copy()
-			self.__columns[i]._available = _STARTING_COUNTER.copy()
-		# Reiniciar candidatos de celdas y valores de celdas
-		for r in _BOARD_RANGE:
-			for c in _BOARD_RANGE:
-				cell = self.__cells[r][c]
-				cell._candidates = _VALID_DIGITS.copy()
-				cell.value = None
-		# Cargar secuencia
-		self.__load_data(sequence, True)
+	def __apply_techniques(self):
+		if not self._techniques: return False
+		# candidatos como máscaras de bits, el formato que reciben las técnicas adicionales
+		cands = [sum(1 << (d-1) for d in cell._candidates) for cell in self.__all_cells]
+		places = _unit_places(cands)
+		for name in self._techniques:
+			if self.__apply_technique(name, cands, places): return True
+		return False
+	#-------------------------------------------------------------------------------#
+	def __apply_technique(self, name, cands, places, /):
+		change_exists = False
+		for i, mask in _TECHNIQUES[name][1](cands, places):
+			cell = self.__all_cells[i]
+			values = [d for d in cell._candidates if mask >> (d-1) & 1]
+			if values:
+				cell._remove_candidates_from_cell(values)
+				cell._check_uniqueness()
+				change_exists = True
+		return change_exists
+	#-------------------------------------------------------------------------------#
+	def __take_snapshot(self):
+		# Estado compacto del tablero (valores, candidatos y contadores por sector), 
+		# suficiente para restaurarlo sin volver a propagar los valores asignados
+		return (
+			[cell.value for cell in self.__all_cells],
+			[cell._candidates.copy() for cell in self.__all_cells],
+			[sector._available.copy() for sector in self.__sectors],
+			self.__placed_by.copy(),
+			self.__step)
+	#-------------------------------------------------------------------------------#
+	def __restore_board_by_using_snapshot(self, snapshot, /):
+		values, candidates, counters, placed_by, step = snapshot
+		# Restaurar valores y candidatos de celdas
+		for cell, value, cands in zip(self.__all_cells, values, candidates):
+			cell._restore(value, cands.copy())
+		# Restaurar contadores de todas las secciones
+		for sector, counter in zip(self.__sectors, counters):
+			sector._available = counter.copy()
+		self.__placed_by = placed_by.copy()
 		self.__step = step
-		# Vaciar lista de candidatos únicos
-		Cell.unique_candidates.clear()
-	#-------------------------------------------------------------------------------#
-	def __make_decisions(self):
-		#---------------------------------------------------------------#
-		def detect_starting_cell_to_make_decision():
-			# ¿cuál es la menor cantidad de candidatos que tiene una celda en el tablero presente?
-			min_base = 9
-			for quadrant in self.__quadrants:
-				# Identificar los candidatos con frecuencia 2 en el cuadrante
-				twins = [k for k,v in quadrant._available.items() if v==2]
-				shared = 0
-				for cell in quadrant.cells:
-					if 1 < (l:= len(cell._candidates)) < min_base:
-						min_base = l
-					if len(twins) > 1 and l > 1:
-						shared = len(set(cell._candidates).intersection(set(twins)))
-						if shared == 2 and l==2: break
-						shared = 0
-				if shared == 2 and l == 2: break
-				cell = None
-			# Si se encontró una celda bajo condiciones de paridad...
-			if shared == 2 and l == 2 and cell: return cell
-			# caso contrario, retornar la celda con el mínimo de canditatos
-			for quadrant in self.__quadrants:
-				for cell in quadrant.cells:
-					if len(cell._candidates) == min_base: return cell
-			return None
-		#---------------------------------------------------------------#
-		def make_a_decision_on_the_candidate(option, row, col, /):
-			decision_was_right = True
-			self.__cells[row][col].value = option
-			# print(f"     Opción seleccionada: {option}")
-			try:
-				self.__solve(False, 0, 0, True)
-				# print(f"     Opción {option}... Correcta")
-			except Exception:
-				# print(f"     Opción {option}... Fallida")
-				decision_was_right = False
-			finally:
-				return decision_was_right
-		#---------------------------------------------------------------#
-		# Seleccionar la celda de donde se empezarán a tomar decisiones
-		if not (cell:= detect_starting_cell_to_make_decision()): 
-			raise InconsistentBoardError("No se encuentra un camino de solución al tablero.")
-		# Obtener data necesaria para propósitos de restauración/decisión
-		BASE_BOARD_SEQ = self.get_current_sequence()
-		BASE_STEP = self.__step
-		OPTIONS = cell._candidates.copy()
-		row = cell.pos['row']
-		col = cell.pos['col']
-		# self.show_board(0,True)
-		# print(f"Tomando decisiones sobre los candidatos {cell._candidates} de la celda {cell.pos}")
-		cell = None
-		# Probar cada opción para saber cuál conduce al tablero solución
-		for i, option in enumerate(OPTIONS):
-			if i: 
-				# self.show_board(0,True)				
-				self.__restore_board_by_using_sequence(BASE_BOARD_SEQ, BASE_STEP)
-			if (is_right:= make_a_decision_on_the_candidate(option, row, col)): break
-		if not is_right:
-			raise InconsistentBoardError(f"Candidatos {OPTIONS} conducen a un tablero inconsistente.")
-#-------------------------------------------------------------------------------#
-	def __solve(self, showing, show_by_step, boardN, recursive=False, /):
+		# Vaciar cola de candidatos únicos
+		self._unique_candidates.clear()
+		self._conflict = None
+	#-------------------------------------------------------------------------------#
+	def __detect_starting_cell_to_make_decision(self):
+		# ¿cuál es la menor cantidad de candidatos que tiene una celda en el tablero presente?
+		min_base = 9
+		for quadrant in self.__quadrants:
+			# Identificar los candidatos con frecuencia 2 en el cuadrante
+			twins = [k for k,v in quadrant._available.items() if v==2]
+			shared = 0
+			for cell in quadrant.cells:
+				if 1 < (l:= len(cell._candidates)) < min_base:
+					min_base = l
+				if len(twins) > 1 and l > 1:
+					shared = len(set(cell._candidates).intersection(set(twins)))
+					if shared == 2 and l==2: break
+					shared = 0
+			if shared == 2 and l == 2: break
+			cell = None
+		# Si se encontró una celda bajo condiciones de paridad...
+		if shared == 2 and l == 2 and cell: return cell
+		# caso contrario, retornar la celda con el mínimo de canditatos
+		for quadrant in self.__quadrants:
+			for cell in quadrant.cells:
+				if len(cell._candidates) == min_base: return cell
+		return None
+	#-------------------------------------------------------------------------------#
+	def __branch(self):
+		# Celda a decidir y sus opciones, en orden inverso de prueba (ver '_branching');
+		# None si no queda celda alguna por decidir
+		choose, order = _CELL_CHOICES[self._branching[0]], _VALUE_ORDERS[self._branching[1]]
+		if choose is None and order is None:
+			cell = self.__detect_starting_cell_to_make_decision()
+			return None if cell is None else (cell, cell._candidates[::-1])
+		# candidatos como máscaras de bits, el formato que reciben las estrategias
+		cands = [sum(1 << (d-1) for d in cell._candidates) for cell in self.__all_cells]
+		places = _unit_places(cands)
+		if choose is None:
+			if (cell:= self.__detect_starting_cell_to_make_decision()) is None: return None
+			i = cell.pos['row']*9 + cell.pos['col']
+		else:
+			if (i:= choose(cands, places)) is None: return None
+			cell = self.__all_cells[i]
+		options = order(cands, places, i) if order is not None else cell._candidates
+		return (cell, options[::-1])
+	#-------------------------------------------------------------------------------#
+	def __open_node(self, depth, /):
+		# Punto de decisión abierto a la profundidad indicada; sólo lo mide 'SolverStats'
+		pass
+	#-------------------------------------------------------------------------------#
+	def __search(self, showing, show_by_step, boardN, /):
 		"""
-		Método privado que procesa la solución a un tablero Sudoku.
+		Método privado de prueba-error, iterativo: cada punto de decisión de la pila guarda el
+		estado previo del tablero, la celda elegida y sus opciones aún no probadas. Las
+		contradicciones se reportan por valor de retorno, sin excepciones.
+		
+		RETURN:
+		- (int) 1 si el tablero quedó resuelto, 0 si no tiene solución, ó '_LIMITED' si se 
+			alcanzó el límite de opciones probadas ó de tiempo.
+		"""
+		stack = []
+		consistent = self.__propagate(showing, show_by_step, boardN)
+		while True:
+			if consistent:
+				if self.is_solved(): return 1
+				if (branch:= self.__branch()) is None:
+					consistent = False
+				else:
+					self.__open_node(len(stack) + 1)
+					stack.append([self.__take_snapshot(), *branch, 0])
+			# Retroceder hasta el punto de decisión más reciente con opciones por probar
+			while stack and not stack[-1][2]: stack.pop()
+			if not stack: return 0
+			frame = stack[-1]
+			snapshot, cell, options, tried = frame
+			if tried:
+				self.__backtracks += 1
+				self.__restore_board_by_using_snapshot(snapshot)
+			frame[3] += 1
+			if self.__guesses >= self._max_guesses or time.perf_counter() > self._deadline: return _LIMITED
+			self.__guesses += 1
+			self.__placed_by[cell.pos['row']*9 + cell.pos['col']] = _GUESS
+			cell.value = options.pop()
+			consistent = self._conflict is None and self.__propagate(False, 0, boardN)
+	#-------------------------------------------------------------------------------#
+	def __place_unique_candidates(self, show_by_step, showing, boardN, /):
+		while self._unique_candidates and self._conflict is None:
+			cell = self._unique_candidates.pop()
+			if cell._candidates:
+				self.__step += 1
+				cell.value = cell._candidates[0]
+				self.__placed_by[cell.pos['row']*9 + cell.pos['col']] = _NAKED_SINGLE
+				self.show_board(boardN, showing and show_by_step and not (self.__step % show_by_step))
+	#-------------------------------------------------------------------------------#
+	def __propagate(self, showing, show_by_step, boardN, /):
+		"""
+		Método privado que aplica las técnicas de resolución hasta que ya no haya cambios.
 		
 		ARGS:
 		- showing	: (bool) permite la visualización de tableros intermedios y final.
 		- show_by_step	: (int) cada cuántos pasos/asignaciones se mostrará el estado del
-				tablero Sudoku siendo resuelto. Omitido si se un lote de tableros, 
-				en tal caso sólo llega a mostrar el tablero final.
+				tablero Sudoku siendo resuelto.
 		- boardN	: (int) número de tablero siendo procesado su solución.
-		- recursive	: (bool) indica si el proceso se ejecuta en modo recursivo.
+		
+		RETURN:
+		- (bool) False si el tablero resulta inconsistente.
 		"""
-		if show_by_step < 0: show_by_step = 0
-		if not recursive: self.__step = 0
 		twins_applied = False
-		made_decision = False
 		while True:
 			# Tratar candidatos únicos en celda
-			while Cell.unique_candidates:
-				cell = Cell.unique_candidates.pop(0)
-				if cell._candidates:
-					self.__step += 1
-					cell.value = cell._candidates[0]
-					self.show_board(boardN, showing and show_by_step and not (self.__step % show_by_step))
-				cell = None
+			self.__place_unique_candidates(show_by_step, showing, boardN)
+			if self._conflict is not None: return False
 			
 			# Localizar candidatos únicos por cuadrante (0), fila (1), columna (2)
 			rescan = True
-			while rescan and not Cell.unique_candidates:
+			while rescan and not self._unique_candidates:
 				rescan = False
 				for way in _BLOCK_RANGE:
-					rescan = rescan or self.__trace_single_frequency_values(way, show_by_step, showing, boardN)
+					# tras el primer cambio, volver a los candidatos únicos antes de otro modo de rastreo
+					if rescan: break
+					rescan = self.__trace_single_frequency_values(way, show_by_step, showing, boardN)
+					if rescan is None or self._conflict is not None: return False
 				if rescan: twins_applied = False
-			if Cell.unique_candidates: continue
-			if self.is_solved(): break
+			if self._unique_candidates: continue
+			if self.is_solved(): return True
 
 			# Aquí se llega sin candidatos únicos ni candidatos de frecuencia única en todos los sectores
 			# Aplicar técnica de pares gemelos (naked/hidden twins) por cuadrante
 			if not twins_applied:
 				rescan = True
 				num_try = 0
-				while rescan and not Cell.unique_candidates:
+				while rescan and not self._unique_candidates:
 					num_try += 1
 					rescan = self.__apply_naked_hidden_twins_technique()
-				if Cell.unique_candidates: continue
-				# si el tablero no tiene cambios en sus candidatos tras aplicar la técnica en su primer
-				# intento, entonces se debe aplicar el proceso de prueba-error inmediatamente
-				if num_try==1: break
+					if self._conflict is not None: return False
+				if self._unique_candidates: continue
 				# ya que hubo cambios en los candidatos del tablero, hacer un nuevo chequeo en busca de 
 				# celdas-solución. Si tras el chequeo no hay cambio alguno en el tablero, ya no debería
-				# ejecutarse esta técnica, y debería salirse del bucle presente.
-				twins_applied = True
-			else:
-				break	# termina el WHILE padre
-
-		# Iniciar proceso de prueba-error si el tablero no ha sido resuelto
-		if not self.is_solved(): 
-			self.__make_decisions()
-			made_decision = True
+				# ejecutarse esta técnica, y debería pasarse a las técnicas adicionales.
+				if num_try > 1:
+					twins_applied = True
+					continue
+			# Aplicar técnicas adicionales (pipeline); tras el primer cambio, volver a las anteriores.
+			# Sin cambios, se debe pasar al proceso de prueba-error
+			changed = self.__apply_techniques()
+			if self._conflict is not None: return False
+			if not changed: return True
+			twins_applied = False
+	#-------------------------------------------------------------------------------#
+	def __solve(self, showing, show_by_step, boardN, /):
+		"""
+		Método privado que procesa la solución a un tablero Sudoku.
+		
+		ARGS:
+		- showing	: (bool) permite la visualización de tableros intermedios y final.
+		- show_by_step	: (int) cada cuántos pasos/asignaciones se mostrará el estado del
+				tablero Sudoku siendo resuelto. Omitido si se un lote de tableros, 
+				en tal caso sólo llega a mostrar el tablero final.
+		- boardN	: (int) número de tablero siendo procesado su solución.
+		"""
+		if show_by_step < 0: show_by_step = 0
+		self.__step = self.__guesses = self.__backtracks = 0
+		if (found:= self.__search(showing, show_by_step, boardN)) == _LIMITED:
+			raise SearchLimitError(f"Búsqueda detenida tras {self.__guesses} opciones probadas.")
+		if not found:
+			raise InconsistentBoardError("No se encuentra un camino de solución al tablero.")
 		# Mostrar tablero final
-		if not recursive:
-			self.show_board(boardN, showing and (made_decision or not (show_by_step and not (self.__step % show_by_step))))
+		self.show_board(boardN, showing and (self.__guesses or not (show_by_step and not (self.__step % show_by_step))))
+	#-------------------------------------------------------------------------------#
+	def _load(self, sequence, verbose=True, /):
+		self.__reset_board()
+		return self.__load_data(sequence, verbose)
+	#-------------------------------------------------------------------------------#
+	def _run(self, showing, show_by_step, boardN, /):
+		self.__solve(showing, show_by_step, boardN)
 	#-------------------------------------------------------------------------------#
-	def __parse_sequence(self, data):
-		# https://www.technologyreview.com/s/426554/mathematicians-solve-minimum-sudoku-problem
-		minimum_numbers_given = 17
-		values_per_board = 81
-		seq = re.sub(r'\s+', '', data)
-		return (seq, len(seq) == values_per_board and len(re.findall(r'[1-9]', seq)) >= minimum_numbers_given)
+	def _metrics(self):
+		return (self.__step, self.__guesses, self.__backtracks, tuple(self.__placed_by))
+	#-------------------------------------------------------------------------------#
+	def _candidates_left(self):
+		# Candidatos restantes y celdas sin resolver (para 'SolverStats')
+		return (sum(len(cell._candidates) for cell in self.__all_cells),
+			sum(cell.value is None for cell in self.__all_cells))
 	#-------------------------------------------------------------------------------#
 	def is_solved(self):
 		for i in _BOARD_RANGE:
@@ -350,85 +516,409 @@ class SudokuBoard:
 				return False
 		return True
 	#-------------------------------------------------------------------------------#
-	def solve_from(self, source, /, show_by_step:int=0, show_boards=True, sep="\n", text=""):
+	def __engine(self, engine, /):
+		if engine not in self.__engines:
+			self.__engines[engine] = _ENGINES[engine]()
+		return self.__engines[engine]
+	#-------------------------------------------------------------------------------#
+	def __sized_engine(self, engine, box, /):
+		# Motor para el tamaño de cuadrante indicado: los tableros que no son de 9×9 sólo los
+		# admite "scalable", que se usa en lugar del motor solicitado
+		if box not in _BOX_SIZES:
+			raise ValueError("'box' debe estar entre 2 y 5.")
+		if box != 3: engine = "scalable"
+		if engine == "scalable": self.__engine(engine)._box = box
+		return engine
+	#-------------------------------------------------------------------------------#
+	def count_solutions(self, sequence, /, limit:int=2, engine="bitmask", box:int=3):
+		"""
+		Cuenta las soluciones de un tablero Sudoku, deteniendo la búsqueda apenas se alcanza
+		el límite indicado.
+		
+		ARGS:
+		- sequence	: (str) secuencia de 81 caracteres (box**4, en general) representando el tablero.
+		- limit		: (int) cantidad de soluciones a partir de la cual se detiene la búsqueda.
+		- engine	: (str) motor de búsqueda: "bitmask" (propagación y prueba-error, el motor
+				por defecto), "dlx" ó "scalable" (el único para tableros que no son de 9×9).
+				"objects" no puede contar soluciones: se acepta, pero cuenta "bitmask",
+				que aplica las mismas técnicas sobre máscaras de bits.
+		- box		: (int) tamaño de cuadrante, como en 'solve_from'.
+		
+		RETURN:
+		- (int) número de soluciones halladas, como máximo 'limit' (0 si es inconsistente).
+		"""
+		if engine not in _ENGINES:
+			raise ValueError(f"Motor '{engine}' no reconocido, opciones: {', '.join(_ENGINES)}.")
+		if engine == "objects": engine = "bitmask"
+		if limit < 1:
+			raise ValueError("'limit' debe ser mayor a cero.")
+		engine = self.__sized_engine(engine, box)
+		seq = _parse_sequence(sequence, box)[0]
+		if len(seq) != box**4:
+			raise ValueError(f"Se esperaba una secuencia de {box**4} caracteres.")
+		board = self.__engine(engine)
+		# el motor se comparte con 'solve_from': el conteo no depende de su última configuración
+		board._techniques = _DEFAULT_TECHNIQUES
+		board._branching = _DEFAULT_BRANCHING
+		if not board._load(seq, False): return 0
+		return board._count_solutions(limit)
+	#-------------------------------------------------------------------------------#
+	def has_unique_solution(self, sequence, /, engine="bitmask", box:int=3):
+		"""
+		Verifica que un tablero Sudoku tenga una y sólo una solución.
+		
+		ARGS:
+		- sequence	: (str) secuencia de 81 caracteres (box**4, en general) representando el tablero.
+		- engine	: (str) motor de búsqueda, como en 'count_solutions' ("objects" cuenta con
+				"bitmask").
+		- box		: (int) tamaño de cuadrante, como en 'solve_from'.
+		"""
+		return self.count_solutions(sequence, limit=2, engine=engine, box=box) == 1
+	#-------------------------------------------------------------------------------#
+	def __iter_results(self, source, sep, engine, workers, chunksize, show_boards, show_by_step, verbose, stats, cache, 
+			limits, techniques, branching, box, checkpoint=None, /):
+		if engine not in _ENGINES:
+			raise ValueError(f"Motor '{engine}' no reconocido, opciones: {', '.join(_ENGINES)}.")
+		if workers < 1 or chunksize < 1:
+			raise ValueError("'workers' y 'chunksize' deben ser mayores a cero.")
+		if not (type(source) == str or (type(source) in (list, tuple) and all(type(x) == str for x in source))):
+			raise TypeError("Data type is not a string.")
+		engine = self.__sized_engine(engine, box)
+		if cache is not None and box != 3:
+			raise ValueError("La caché de soluciones sólo admite tableros de 9×9.")
+		if not source: return
+		techniques = _technique_pipeline(techniques)
+		branching = _branching_strategy(branching)
+		board = self.__engine(engine)
+		board._techniques = techniques
+		board._branching = branching
+		sources = [source] if type(source) == str else list(source)
+		sequences = iter_sequences(sources, sep, box)
+		# Al reanudar un lote, omitir (sin resolverlos) los tableros ya procesados
+		first = 1
+		if checkpoint is not None:
+			first += checkpoint._resume([sources, sep, box])
+			sequences = islice(sequences, first - 1, None)
+		# Si se procesa más de un tablero, no mostrar soluciones parciales
+		head = list(islice(sequences, 2))
+		if len(head) > 1: show_by_step = 0
+		sequences = chain(head, sequences)
+		# Resolver tableros a medida que se leen, en paralelo si se solicitan varios procesos
+		if workers > 1 and len(head) > 1:
+			results = _solve_in_pool(sequences, engine, workers, chunksize, verbose, stats, cache, limits, techniques,
+				branching, box, first)
+		else:
+			results = (_solve_sequence(board, seq, i, show_boards, show_by_step, verbose, stats, cache, limits) 
+				for i, seq in enumerate(sequences, first))
+		if checkpoint is None:
+			yield from results
+			return
+		# Un tablero se registra cuando se pide el siguiente: ya fue entregado
+		try:
+			for result in results:
+				yield result
+				checkpoint._record(result)
+		finally:
+			checkpoint.close()
+	#-------------------------------------------------------------------------------#
+	def iter_results(self, source, /, sep="\n", engine="objects", workers:int=1, chunksize:int=32, stats=None, cache=None,
+			max_guesses=None, timeout=None, techniques=None, branching=None, box:int=3, checkpoint=None):
+		"""
+		Generador que resuelve tablero(s) Sudoku sin escribir en la salida estándar,
+		entregando un 'SolveResult' por tablero, en el orden de entrada.
+		
+		ARGS:
+		- source	: (str|list) secuencia(s) y/o archivo(s), igual que en 'solve_from'.
+		- sep		: (str) separador entre secuencias, útil si 'source' es un archivo.
+		- engine	: (str) motor de resolución: "objects", "bitmask", "dlx" ó "scalable", como en
+				'solve_from' (los tableros que no son de 9×9 siempre usan "scalable").
+		- workers	: (int) número de procesos para resolver un lote de tableros.
+		- chunksize	: (int) cantidad de tableros enviados a la vez a cada proceso.
+		- stats		: (SolverStats) instrumentación opcional por técnica.
+		- cache		: (SolutionCache) caché opcional de soluciones.
+		- max_guesses	: (int) opciones que puede probar la búsqueda por tablero.
+		- timeout	: (float) segundos de búsqueda por tablero.
+		- techniques	: (list|dict|set) técnicas adicionales de propagación, como en 'solve_from'.
+		- branching	: (str|tuple) estrategia de ramificación, como en 'solve_from'.
+		- box		: (int) tamaño de cuadrante, como en 'solve_from'.
+		- checkpoint	: (Checkpoint) progreso para reanudar el lote, como en 'solve_from'.
+		"""
+		limits = None if max_guesses is None and timeout is None else (max_guesses, timeout)
+		yield from self.__iter_results(source, sep, engine, workers, chunksize, False, 0, False, stats, cache, limits, 
+			techniques, branching, box, checkpoint)
+	#-------------------------------------------------------------------------------#
+	def solve_from(self, source, /, show_by_step:int=0, show_boards=True, sep="\n", text="", engine="objects",
+			workers:int=1, chunksize:int=32, stats=None, cache=None, max_guesses=None, timeout=None, techniques=None,
+			branching=None, box:int=3, checkpoint=None):
 		"""
 		Método principal llamado para dar solución a tablero(s) Sudoku.
 		
 		ARGS:
 		- source	: (str) cadena de texto representando: (1) una secuencia fija de 81 
 				caracteres alfanuméricos, ó (2) la localización del archivo conteniendo 
-				secuencias de tableros Sudoku.
+				secuencias de tableros Sudoku ("-" para la entrada estándar). También se 
+				acepta una lista de ellas. Los archivos se leen a medida que se resuelven.
 		- show_by_step	: (int) cada cuántos pasos/asignaciones se mostrará el estado del
 				tablero Sudoku siendo resuelto. Omitido si se un lote de tableros, en tal 
 				caso sólo llega a mostrar el tablero final.
 		- show_boards	: (bool) permite la visualización de tableros intermedios y final.
 		- sep		: (str) separador entre secuencias, útil si 'source' es un archivo.
 		- text		: (str) texto a agregar al sumario estadístico final.
+		- engine	: (str) motor de resolución: "objects" (celdas y sectores como objetos),
+				"bitmask" (candidatos como máscaras de bits de 9 bits), "dlx" (cobertura 
+				exacta con Dancing Links) ó "scalable" (máscaras de bits para tableros de 
+				cualquier tamaño admitido).
+		- workers	: (int) número de procesos para resolver un lote de tableros; con más
+				de uno, los tableros no se visualizan, sólo el sumario final.
+		- chunksize	: (int) cantidad de tableros enviados a la vez a cada proceso.
+		- stats		: (SolverStats) instrumentación opcional: llamadas, eliminaciones, 
+				asignaciones y tiempo por técnica, acumulados para todo el lote.
+		- cache		: (SolutionCache) caché opcional: los tableros ya resueltos, ó 
+				equivalentes por simetría a uno resuelto, no se vuelven a resolver.
+		- max_guesses	: (int) opciones que puede probar la búsqueda por tablero; al 
+				excederse, el tablero se abandona con estado "aborted".
+		- timeout	: (float) segundos que puede tomar la búsqueda por tablero, igual que
+				'max_guesses' (se verifica en cada opción probada).
+		- techniques	: técnicas adicionales que los motores "objects" y "bitmask" aplican tras
+				los pares gemelos y antes de la prueba-error: una lista (en ese orden), un
+				dict nombre -> costo (de menor a mayor costo), ó un set (por costo estimado).
+				Opciones: "pointing", "box_line", "naked_pairs", "hidden_pairs", 
+				"naked_triples", "hidden_triples", "x_wing", "naked_quads", "hidden_quads"
+				y "swordfish". Por defecto: "box_line", "naked_pairs" y "hidden_pairs";
+				una lista vacía las desactiva.
+		- branching	: estrategia de ramificación de la prueba-error de los motores "objects"
+				y "bitmask": la elección de celda ("twins", por defecto; "mrv", la de menos
+				candidatos; ó "mrv_degree", desempatando por vecinas sin resolver), ó un par
+				(elección de celda, orden de valores), con el orden "natural" (por defecto),
+				"lcv" (valor menos restrictivo) ó "frequency" (menos posiciones del dígito
+				en las unidades de la celda).
+		- box		: (int) tamaño de cuadrante: 3 (por defecto) para 9×9, ó 2, 4 y 5 para
+				tableros de 4×4, 16×16 y 25×25, cuyas secuencias (de box**4 caracteres) 
+				usan los símbolos 1-9 y luego A-P, con "0" ó "." en las celdas vacías. Los
+				tableros que no son de 9×9 se resuelven siempre con el motor "scalable", y
+				no admiten 'cache'.
+		- checkpoint	: (Checkpoint) progreso del lote: una corrida interrumpida se reanuda
+				en el siguiente tablero sin procesar, y los tableros abandonados por
+				'max_guesses' ó 'timeout' se agregan a su archivo de cuarentena.
+		
+		RETURN:
+		- (list) un 'SolveResult' por tablero procesado en esta corrida, en el orden de entrada.
 		"""
+		if engine not in _ENGINES:
+			raise ValueError(f"Motor '{engine}' no reconocido, opciones: {', '.join(_ENGINES)}.")
+		if not (type(source) == str or (type(source) in (list, tuple) and all(type(x) == str for x in source))):
+			raise TypeError("Data type is not a string.")
+		results = []
+		limits = None if max_guesses is None and timeout is None else (max_guesses, timeout)
 		if source:
-			if type(source) == str:
-				try:
-					# Si no es una secuencia, es archivo, entonces extraer todas las secuencias
-					if not self.__parse_sequence(source)[1]:
-						sourcefile = Path(source)
-						if not sourcefile.exists(): 
-							raise FileNotFoundError("File not found.")
-						else:
-							with sourcefile.open() as sf:
-								source = sf.read().strip().split(sep)
-							if not source: raise ValueError("File empty.")
-					else:
-						source = [source,]
-					# Si se procesa más de un tablero, no mostrar soluciones parciales
-					if len(source) > 1: show_by_step = 0
-					# Resolver tableros
-					csolved = cout = cunsolved = 0
-					times = []
-					# Extraer cada secuencia y resolverla, midiendo su tiempo de ejecución
-					for i, seq in enumerate(source, 1):
-						seq, flag = self.__parse_sequence(seq)
-						if flag:
-							self.__build_board()
-							if self.__load_data(seq):
-								if show_boards: print(seq)
-								self.show_board(i, show_boards and show_by_step)
-								time_start = time.perf_counter()
-								try:
-									self.__solve(show_boards, show_by_step, i)
-								except Exception as e:
-									self.show_board(i, show_boards and not show_by_step)
-									print(f"[{type(e).__name__}] {e}")
-								finally:
-									delta_time = time.perf_counter() - time_start
-								if show_boards:
-									print("({:.5f} seconds)\n".format(delta_time))
-								if self.is_solved():
-									csolved += 1
-									times.append(delta_time)
-								else: 
-									cunsolved += 1
-							else: cout += 1
-						else: cout += 1
-					# Mostrar sumario estadístico al finalizar todo el proceso
-					size = len(source)
-					if times:
-						print("Excluded {}, Unsolved {}, Solved {} of {} {} puzzles (avg {:.5f} secs ({:.0f} Hz), max {:.5f} secs)".format(
-							cout, cunsolved, csolved, size, text, sum(times)/size, size/sum(times), max(times)))
+			try:
+				csolved = cout = cunsolved = size = 0
+				times = []
+				# Contabilizar cada resultado en el orden de entrada
+				for result in self.__iter_results(source, sep, engine, workers, chunksize, show_boards, show_by_step, True, stats, cache, limits, techniques, branching, box, checkpoint):
+					size += 1
+					if result.status == _SOLVED:
+						csolved += 1
+						times.append(result.elapsed)
+					elif result.status in (_UNSOLVED, _ABORTED):
+						cunsolved += 1
 					else:
-						print("Excluded {}, Unsolved {}, Solved {} of {} {} puzzles".format(
-							cout, cunsolved, csolved, size, text))
-				except Exception as e:
-					print(f"[{type(e).__name__}] {e}")
-			else:
-				raise TypeError("Data type is not a string.")
+						cout += 1
+					results.append(result)
+				# Mostrar sumario estadístico al finalizar todo el proceso
+				print(_summary(cout, cunsolved, size, text, times))
+				if cache is not None:
+					print("Cache: {hits} hits, {misses} misses, {evictions} evictions, {size} of {maxsize} solutions".format(**cache.info()))
+				if checkpoint is not None:
+					print("Checkpoint: {done} puzzles done ({resumed} before resuming), {aborted} aborted".format(**checkpoint.info()))
+			except Exception as e:
+				print(f"[{type(e).__name__}] {e}")
+		return results
+	#-------------------------------------------------------------------------------#
+	def solve_batch(self, source, /, sep="\n", engine="bitmask", chunksize:int=8192, max_guesses=None, timeout=None,
+			techniques=None, branching=None, box:int=3):
+		"""
+		Resuelve un lote de tableros Sudoku sin escribir en la salida estándar. Con NumPy, los
+		tableros se cargan por bloques en arreglos (N, 81) y los sencillos desnudos y ocultos se
+		propagan a la vez sobre todo el bloque; sólo los que no se completan así pasan, uno a 
+		uno, al motor indicado. Sin NumPy, todos los tableros se resuelven con dicho motor.
+		
+		ARGS:
+		- source	: (str|list) secuencia(s) y/o archivo(s), igual que en 'solve_from'.
+		- sep		: (str) separador entre secuencias, útil si 'source' es un archivo.
+		- engine	: (str) motor para los tableros que requieren búsqueda.
+		- chunksize	: (int) cantidad de tableros propagados a la vez.
+		- max_guesses	: (int) opciones que puede probar la búsqueda por tablero.
+		- timeout	: (float) segundos de búsqueda por tablero.
+		- techniques	: (list|dict|set) técnicas adicionales del motor, como en 'solve_from'.
+		- branching	: (str|tuple) estrategia de ramificación del motor, como en 'solve_from'.
+		- box		: (int) tamaño de cuadrante, como en 'solve_from'; la propagación por
+				bloques sólo se aplica a tableros de 9×9.
+		
+		RETURN:
+		- (list) un 'SolveResult' por tablero, en el orden de entrada. En los tableros resueltos
+			sólo por propagación, 'elapsed' es su parte del tiempo del bloque.
+		"""
+		if engine not in _ENGINES:
+			raise ValueError(f"Motor '{engine}' no reconocido, opciones: {', '.join(_ENGINES)}.")
+		if chunksize < 1:
+			raise ValueError("'chunksize' debe ser mayor a cero.")
+		if not (type(source) == str or (type(source) in (list, tuple) and all(type(x) == str for x in source))):
+			raise TypeError("Data type is not a string.")
+		engine = self.__sized_engine(engine, box)
+		results = []
+		if not source: return results
+		board = self.__engine(engine)
+		board._techniques = _technique_pipeline(techniques)
+		board._branching = _branching_strategy(branching)
+		limits = None if max_guesses is None and timeout is None else (max_guesses, timeout)
+		sequences = iter_sequences([source] if type(source) == str else source, sep, box)
+		if box != 3 or not _numpy_available():
+			for i, seq in enumerate(sequences, 1):
+				results.append(_solve_sequence(board, seq, i, False, 0, False, None, None, limits))
+			return results
+		while (block:= list(islice(sequences, chunksize))):
+			results.extend(_solve_block(board, block, len(results) + 1, limits))
+		return results
 	#-------------------------------------------------------------------------------#
 	def get_current_sequence(self):
-		seq = ""
-		for r in _BOARD_RANGE:
-			for c in _BOARD_RANGE:
-				value = self.__cells[r][c].value
-				seq += str(value) if value else "0"
-		return seq
+		return "".join(str(cell.value) if cell.value else "0" for cell in self.__all_cells)
+	#-------------------------------------------------------------------------------#
+	def start(self, sequence, /):
+		"""
+		Carga un tablero para jugarlo movimiento a movimiento, sin resolverlo (ver 'place',
+		'unplace', 'candidates', 'conflicts' y 'hint'). El tablero es el mismo que usan
+		'solve_from' e 'iter_results' con el motor "objects", por lo que resolver con ellos
+		descarta la partida.
+		
+		ARGS:
+		- sequence	: (str) secuencia de 81 caracteres representando el tablero.
+		
+		RETURN:
+		- (bool) False si las pistas se contradicen (la partida se carga de todos modos).
+		"""
+		seq, flag = _parse_sequence(sequence)
+		if not flag:
+			raise ValueError("Se esperaba una secuencia de 81 caracteres con al menos 17 pistas.")
+		self.__reset_board()
+		consistent = self.__load_data(seq, False, False)
+		for cell in self.__all_cells:
+			if cell.value is not None:
+				self.__count_placement(cell, cell.value, 1)
+		return consistent and not self.__clashes
+	#-------------------------------------------------------------------------------#
+	def __playable(self, row, col, /):
+		if row not in _BOARD_RANGE or col not in _BOARD_RANGE:
+			raise IndexError("Posición fuera del tablero.")
+		cell = self.__cells[row][col]
+		if cell.is_given:
+			raise ValueError(f"Celda {cell.pos} es una pista del tablero.")
+		return cell
+	#-------------------------------------------------------------------------------#
+	def __count_placement(self, cell, value, delta, /):
+		# Actualiza las asignaciones por dígito de los sectores de la celda, y los repetidos
+		for sector in (cell._from_quadrant, cell._from_row, cell._from_column):
+			if sector._placed[value] + (delta > 0) == 2: self.__clashes += delta
+			sector._placed[value] += delta
+	#-------------------------------------------------------------------------------#
+	def place(self, row, col, value, /):
+		"""
+		Asigna un valor a una celda, reemplazando el que tuviera. Los candidatos se retiran
+		sólo de sus celdas vecinas, por la misma propagación entre sectores que al resolver.
+		Se admiten valores repetidos en un sector (ver 'conflicts').
+		
+		ARGS:
+		- row, col	: (int) posición de la celda (0 a 8).
+		- value		: (int) valor a asignar (1 a 9).
+		
+		RETURN:
+		- (bool) True si el valor era candidato de la celda, False si repite el de una vecina.
+		"""
+		cell = self.__playable(row, col)
+		if value not in _VALID_DIGITS:
+			raise ValueError("El valor debe estar entre 1 y 9.")
+		if cell.value == value:
+			return cell._from_quadrant._placed[value] == cell._from_row._placed[value] == cell._from_column._placed[value] == 1
+		if cell.value is not None: self.unplace(row, col)
+		fits = value in cell._candidates
+		self.__count_placement(cell, value, 1)
+		cell.value = value
+		return fits
+	#-------------------------------------------------------------------------------#
+	def unplace(self, row, col, /):
+		"""
+		Retira el valor asignado a una celda, en cualquier orden respecto a los demás
+		movimientos: la celda y sus vecinas recuperan los candidatos que ya no estén 
+		asignados en alguno de sus sectores, revisando sólo sus 20 vecinas.
+		
+		RETURN:
+		- (int) valor retirado, None si la celda estaba vacía.
+		"""
+		cell = self.__playable(row, col)
+		if (value:= cell.value) is None: return None
+		self.__count_placement(cell, value, -1)
+		cell.value = None
+		cell._add_candidates_to_cell([d for d in _VALID_DIGITS if not cell._blocked(d)])
+		for sector in (cell._from_quadrant, cell._from_row, cell._from_column):
+			sector._restore_candidate_to_sector(value)
+		return value
+	#-------------------------------------------------------------------------------#
+	def candidates(self, row, col, /):
+		"""
+		Candidatos actuales de una celda (lista vacía si tiene un valor asignado).
+		"""
+		if row not in _BOARD_RANGE or col not in _BOARD_RANGE:
+			raise IndexError("Posición fuera del tablero.")
+		return sorted(self.__cells[row][col]._candidates)
+	#-------------------------------------------------------------------------------#
+	def conflicts(self):
+		"""
+		Celdas cuyo valor se repite en alguno de sus sectores.
+		
+		RETURN:
+		- (list) posiciones (fila, columna), en orden.
+		"""
+		if not self.__clashes: return []
+		found = set()
+		for sector in self.__sectors:
+			for d in _VALID_DIGITS:
+				if sector._placed[d] > 1:
+					found.update((cell.pos["row"], cell.pos["col"]) for cell in sector.cells if cell.value == d)
+		return sorted(found)
+	#-------------------------------------------------------------------------------#
+	def hint(self):
+		"""
+		Sugiere el siguiente movimiento: un candidato único de una celda ó de frecuencia única
+		en un cuadrante, fila ó columna; si no lo hay, el valor que tiene en la solución la 
+		celda con menos candidatos.
+		
+		RETURN:
+		- (tuple) (fila, columna, valor, técnica), con la técnica "naked_single", 
+			"hidden_single_quadrant", "hidden_single_row", "hidden_single_column" ó
+			"solution"; None si el tablero está completo, tiene conflictos, ó ya no tiene
+			solución a partir de los valores asignados.
+		"""
+		empty = [cell for cell in self.__all_cells if cell.value is None]
+		if not empty or self.__clashes: return None
+		# Los valores asignados deben conducir a una solución
+		board = self.__engine("bitmask")
+		if not board._load(self.get_current_sequence(), False): return None
+		try:
+			board._run(False, 0, 0)
+		except InconsistentBoardError:
+			return None
+		for cell in empty:
+			if len(cell._candidates) == 1:
+				return (cell.pos["row"], cell.pos["col"], cell._candidates[0], _NAKED_SINGLE)
+		for way, sectors in enumerate((self.__quadrants, self.__rows, self.__columns)):
+			for sector in sectors:
+				for d in _VALID_DIGITS:
+					if sector._available[d] == 1 and not sector._placed[d]:
+						cell = next(cell for cell in sector.cells if d in cell._candidates)
+						return (cell.pos["row"], cell.pos["col"], d, _HIDDEN_SINGLE_BY[way])
+		cell = min(empty, key=lambda cell: len(cell._candidates))
+		row, col = cell.pos["row"], cell.pos["col"]
+		return (row, col, board._values[row*9 + col], _SOLUTION)
 	#-------------------------------------------------------------------------------#
 	def __check_links(self): # sólo para propósitos de verificación
 		# Checking rows
@@ -488,28 +978,37 @@ class Sector:
 		self._owner = owner
 		# Números disponibles dentro del sector
 		self._available = _STARTING_COUNTER.copy()
+		# Celdas con cada valor asignado en el sector, por dígito (sólo en el tablero interactivo)
+		self._placed = [0]*10
 		self.cells = []
 	#-------------------------------------------------------------------------------#
-	def _remove_candidate_from_sector(self, value, avoid:list=[], /):
+	def _remove_candidate_from_sector(self, value, avoid:list=(), /):
 		if not self._solved():
-			for cell in set(self.cells)-set(avoid):
-				if value in cell._candidates: # omite celdas con valores asignados
+			for cell in self.cells:
+				if value in cell._candidates and cell not in avoid: # omite celdas con valores asignados
 					cell._remove_candidates_from_cell(value)
 					# if not cell._candidates:
 					# 	raise NoCandidatesError(f"Celda {cell.pos} se ha quedado sin valores candidatos")
 					cell._check_uniqueness()
 	#-------------------------------------------------------------------------------#
-	def _update_availability_in_sector(self, keys):
+	def _restore_candidate_to_sector(self, value, /):
+		# Inverso de '_remove_candidate_from_sector': devuelve el candidato a las celdas vacías
+		# que ya no lo tienen asignado en ninguno de sus sectores
+		for cell in self.cells:
+			if cell.value is None and value not in cell._candidates and not cell._blocked(value):
+				cell._add_candidates_to_cell(value)
+	#-------------------------------------------------------------------------------#
+	def _update_availability_in_sector(self, keys, delta=-1, /):
 		if type(keys) == list:
 			for k in keys:
-				self._available[k] -= 1
+				self._available[k] += delta
 		elif type(keys) == int:
-			self._available[keys] -= 1
+			self._available[keys] += delta
 		else:
 			raise TypeError("Tipo de dato no aceptado.")
 	#-------------------------------------------------------------------------------#
 	def _solved(self):
-		return set(self._available.values()) == {0}
+		return not any(self._available.values())
 
 #####################################################################################################
 #####################################################################################################
@@ -519,13 +1018,45 @@ class Column(Sector): pass
 class Quadrant(Sector): pass
 class NoCandidatesError(Exception): pass
 class InconsistentBoardError(Exception): pass
+class SearchLimitError(Exception): pass
 
 #####################################################################################################
 #####################################################################################################
 
-class Cell:
+class UniqueCandidatesQueue:
+	"""
+	Cola FIFO de celdas con candidato único, propia de cada tablero. No admite celdas
+	repetidas y verifica la pertenencia de una celda en tiempo constante.
+	"""
+	#-------------------------------------------------------------------------------#
+	def __init__(self):
+		self.__queue = deque()
+		self.__members = set()
+	#-------------------------------------------------------------------------------#
+	def __len__(self):
+		return len(self.__queue)
+	#-------------------------------------------------------------------------------#
+	def __contains__(self, cell):
+		return cell in self.__members
+	#-------------------------------------------------------------------------------#
+	def append(self, cell):
+		if cell not in self.__members:
+			self.__members.add(cell)
+			self.__queue.append(cell)
 	#-------------------------------------------------------------------------------#
-	unique_candidates = []		# class attribute/variable
+	def pop(self):
+		cell = self.__queue.popleft()
+		self.__members.discard(cell)
+		return cell
+	#-------------------------------------------------------------------------------#
+	def clear(self):
+		self.__queue.clear()
+		self.__members.clear()
+
+#####################################################################################################
+#####################################################################################################
+
+class Cell:
 	#-------------------------------------------------------------------------------#
 	def __init__(self, owner:SudokuBoard):
 		self._owner = owner
@@ -566,13 +1097,23 @@ class Cell:
 		else:
 			raise TypeError("Se esperaba una tupla de par de dígitos numéricos válidos.")
 	#-------------------------------------------------------------------------------#
+	def _reset(self):
+		self.__value = None
+		self._candidates = _VALID_DIGITS.copy()
+		self.is_given = False
+	#-------------------------------------------------------------------------------#
+	def _restore(self, value, candidates, /):
+		# Restablece el estado de la celda sin propagar cambios a sus sectores
+		self.__value = value
+		self._candidates = candidates
+	#-------------------------------------------------------------------------------#
 	def _check_uniqueness(self):
 		if self.value is None:
 			if len(self._candidates) == 1:
-				if self not in Cell.unique_candidates:
-					Cell.unique_candidates.append(self)
-			if len(self._candidates) == 0:
-				raise NoCandidatesError(f"Celda {self.pos} se ha quedado sin valores candidatos")
+				self._owner._unique_candidates.append(self)
+			if len(self._candidates) == 0 and self._owner._conflict is None:
+				# contradicción: se reporta al tablero, que la verifica tras cada técnica
+				self._owner._conflict = self
 	#-------------------------------------------------------------------------------#
 	def __propagate_candidate_removal_through_sectors(self, value):
 		self._from_quadrant._remove_candidate_from_sector(value)
@@ -590,32 +1131,2265 @@ class Cell:
 		self._from_quadrant._update_availability_in_sector(values)
 		self._from_row._update_availability_in_sector(values)
 		self._from_column._update_availability_in_sector(values)
+	#-------------------------------------------------------------------------------#
+	def _add_candidates_to_cell(self, values):
+		# Inverso de '_remove_candidates_from_cell' (ver 'SudokuBoard.unplace')
+		if type(values) == int:
+			self._candidates.append(values)
+		elif type(values) == list:
+			self._candidates.extend(values)
+		else:
+			raise TypeError("Tipo de dato no aceptado.")
+		self._from_quadrant._update_availability_in_sector(values, 1)
+		self._from_row._update_availability_in_sector(values, 1)
+		self._from_column._update_availability_in_sector(values, 1)
+	#-------------------------------------------------------------------------------#
+	def _blocked(self, value, /):
+		# El valor está asignado en alguno de los sectores de la celda
+		return bool(self._from_quadrant._placed[value] or self._from_row._placed[value] or self._from_column._placed[value])
+
+#####################################################################################################
+#####################################################################################################
+
+# Tablas precalculadas para el motor de máscaras de bits. El candidato 'd' (1..9) de una celda
+# se representa con el bit (d-1); una máscara 0 indica que no quedan candidatos.
+_ALL_CANDIDATES = (1 << 9) - 1
+_POPCOUNT = tuple(bin(m).count("1") for m in range(1 << 9))
+_LOWEST_DIGIT = tuple((m & -m).bit_length() for m in range(1 << 9))	# 0 si la máscara es 0
+_DIGITS_OF = tuple(tuple(d for d in _VALID_DIGITS if m >> (d-1) & 1) for m in range(1 << 9))
+# Por celda: (base de la unidad en la tabla de posiciones, máscara que retira a la celda de la unidad)
+_CELL_SLOTS = tuple(tuple((u*9, ~(1 << _UNITS[u].index(i))) for u in range(27) if i in _UNITS[u]) for i in range(81))
+
+#####################################################################################################
+#####################################################################################################
+
+# Técnicas adicionales de propagación. Cada una recibe los candidatos de las 81 celdas (máscaras
+# de 9 bits, 0 si la celda está resuelta) y las posiciones disponibles por unidad y dígito (ver
+# '_unit_places'), y retorna las eliminaciones halladas como pares (celda, máscara a retirar),
+# sin modificar el tablero: cada motor las aplica a su propia representación.
+
+# Máscaras de posiciones (0..8) de cada fila (0..2) y columna (3..5) internas de un cuadrante,
+# y de cada segmento de 3 posiciones de una fila/columna que cae dentro de un mismo cuadrante
+_BOX_LINE_MASKS = tuple(0b111 << 3*k for k in _BLOCK_RANGE) + tuple(0b001001001 << k for k in _BLOCK_RANGE)
+_SEGMENT_MASKS = _BOX_LINE_MASKS[:3]
+# Para unas posiciones (2 ó más) de un dígito: la fila/columna interna ó el segmento que las
+# contiene por completo, -1 si no lo hay
+_BOX_LINE_OF = tuple(next((j for j in range(6) if not m & ~_BOX_LINE_MASKS[j]), -1) if _POPCOUNT[m] > 1 else -1 
+	for m in range(1 << 9))
+_SEGMENT_OF = tuple(j if j < 3 else -1 for j in _BOX_LINE_OF)
+# Celdas afectadas: de la fila/columna interna de un cuadrante, las que están fuera de él; y del
+# cuadrante de un segmento de fila/columna, las que están fuera de ella
+_POINTING_CELLS = tuple(tuple(
+	tuple(i for i in _UNITS[9 + (q//3)*3 + j] if i not in _UNITS[q]) if j < 3 else
+	tuple(i for i in _UNITS[18 + (q%3)*3 + j-3] if i not in _UNITS[q]) for j in range(6)) for q in _BOARD_RANGE)
+_CLAIMING_CELLS = tuple(tuple(
+	tuple(i for i in _UNITS[_CELL_UNITS[_UNITS[u][3*j]][0]] if i not in _UNITS[u]) for j in _BLOCK_RANGE) for u in range(9, 27))
+
+def _unit_places(cands, /):
+	# Posiciones disponibles de cada dígito en cada unidad (misma disposición que
+	# 'BitmaskBoard._places'), a partir de los candidatos de las celdas
+	places = [0]*243
+	for i in range(81):
+		for d in _DIGITS_OF[cands[i]]:
+			for base, clear in _CELL_SLOTS[i]:
+				places[base+d-1] |= ~clear
+	return places
+#-------------------------------------------------------------------------------#
+def _find_pointing(cands, places, /):
+	# Dígito confinado a una fila (columna) dentro de un cuadrante: se elimina del resto de
+	# esa fila (columna) fuera del cuadrante
+	found = []
+	for q in _BOARD_RANGE:
+		base = q*9
+		for d in _BOARD_RANGE:
+			if (j:= _BOX_LINE_OF[places[base+d]]) < 0: continue
+			bit = 1 << d
+			for i in _POINTING_CELLS[q][j]:
+				if cands[i] & bit: found.append((i, bit))
+	return found
+#-------------------------------------------------------------------------------#
+def _find_box_line(cands, places, /):
+	# Dígito confinado a un cuadrante dentro de una fila (columna): se elimina del resto
+	# del cuadrante
+	found = []
+	for u in range(9, 27):
+		base = u*9
+		for d in _BOARD_RANGE:
+			if (j:= _SEGMENT_OF[places[base+d]]) < 0: continue
+			bit = 1 << d
+			for i in _CLAIMING_CELLS[u-9][j]:
+				if cands[i] & bit: found.append((i, bit))
+	return found
+#-------------------------------------------------------------------------------#
+def _find_naked_pairs(cands, places, /):
+	# Caso frecuente de '_find_naked_subset' (tamaño 2), agrupando celdas de candidatos idénticos
+	found = []
+	seen = {}
+	for i in range(81):
+		if _POPCOUNT[m:= cands[i]] != 2: continue
+		if m not in seen:
+			seen[m] = [i]
+			continue
+		for j in seen[m]:
+			for u in _CELL_UNITS[i]:
+				if u in _CELL_UNITS[j]:
+					found.extend((k, m) for k in _UNITS[u] if cands[k] & m and k != i and k != j)
+		seen[m].append(i)
+	return found
+#-------------------------------------------------------------------------------#
+def _find_hidden_pairs(cands, places, /):
+	# Caso frecuente de '_find_hidden_subset' (tamaño 2): dos dígitos con las mismas dos
+	# posiciones en una unidad
+	found = []
+	for u in range(27):
+		base = u*9
+		seen = {}
+		for d in _BOARD_RANGE:
+			if _POPCOUNT[m:= places[base+d]] != 2: continue
+			if m not in seen:
+				seen[m] = d
+				continue
+			keep = (1 << d) | (1 << seen[m])
+			cells = _UNITS[u]
+			found.extend((cells[k-1], ~keep & _ALL_CANDIDATES) for k in _DIGITS_OF[m] if cands[cells[k-1]] & ~keep)
+	return found
+#-------------------------------------------------------------------------------#
+def _find_naked_subset(cands, places, size, /):
+	# 'size' celdas de una unidad cuyos candidatos, en conjunto, son 'size' dígitos: esos
+	# dígitos se eliminan del resto de celdas de la unidad
+	found = []
+	for u in range(27):
+		cells = _UNITS[u]
+		pool = [i for i in cells if 2 <= _POPCOUNT[cands[i]] <= size]
+		if len(pool) < size: continue
+		for subset in combinations(pool, size):
+			union = 0
+			for i in subset: union |= cands[i]
+			if _POPCOUNT[union] != size: continue
+			found.extend((i, union) for i in cells if cands[i] & union and i not in subset)
+	return found
+#-------------------------------------------------------------------------------#
+def _find_hidden_subset(cands, places, size, /):
+	# 'size' dígitos de una unidad confinados, en conjunto, a 'size' celdas: el resto de
+	# candidatos de esas celdas se elimina
+	found = []
+	for u in range(27):
+		base = u*9
+		pool = [d for d in _BOARD_RANGE if 2 <= _POPCOUNT[places[base+d]] <= size]
+		if len(pool) < size: continue
+		cells = _UNITS[u]
+		for subset in combinations(pool, size):
+			union = keep = 0
+			for d in subset:
+				union |= places[base+d]
+				keep |= 1 << d
+			if _POPCOUNT[union] != size: continue
+			found.extend((cells[k-1], ~keep & _ALL_CANDIDATES) for k in _DIGITS_OF[union] if cands[cells[k-1]] & ~keep)
+	return found
+#-------------------------------------------------------------------------------#
+def _find_fish(cands, places, size, /):
+	# X-Wing (2) / Swordfish (3): un dígito cuyas posiciones en 'size' filas caen en sólo
+	# 'size' columnas se elimina del resto de esas columnas (y viceversa)
+	found = []
+	for d in _BOARD_RANGE:
+		bit = 1 << d
+		for first, cross in ((9, 18), (18, 9)):
+			pool = [u for u in range(first, first+9) if 2 <= _POPCOUNT[places[u*9+d]] <= size]
+			if len(pool) < size: continue
+			for subset in combinations(pool, size):
+				union = 0
+				for u in subset: union |= places[u*9+d]
+				if _POPCOUNT[union] != size: continue
+				# posiciones (en la fila/columna base) de las celdas que forman la figura
+				base_pos = {u - first for u in subset}
+				for k in _DIGITS_OF[union]:
+					line = _UNITS[cross + k - 1]
+					found.extend((i, bit) for pos, i in enumerate(line) if cands[i] & bit and pos not in base_pos)
+	return found
+#-------------------------------------------------------------------------------#
+# Técnicas disponibles: nombre -> (costo relativo, función). Sin indicación, el pipeline las
+# aplica en orden de costo, volviendo a las técnicas básicas tras la primera que elimine algo.
+_TECHNIQUES = {
+	"pointing": (1, _find_pointing),
+	"box_line": (1, _find_box_line),
+	"naked_pairs": (2, _find_naked_pairs),
+	"hidden_pairs": (2, _find_hidden_pairs),
+	"naked_triples": (3, lambda cands, places: _find_naked_subset(cands, places, 3)),
+	"hidden_triples": (3, lambda cands, places: _find_hidden_subset(cands, places, 3)),
+	"x_wing": (4, lambda cands, places: _find_fish(cands, places, 2)),
+	"naked_quads": (5, lambda cands, places: _find_naked_subset(cands, places, 4)),
+	"hidden_quads": (5, lambda cands, places: _find_hidden_subset(cands, places, 4)),
+	"swordfish": (6, lambda cands, places: _find_fish(cands, places, 3)),
+}
+
+def _technique_pipeline(techniques, /):
+	# Nombres de las técnicas adicionales en el orden en que se aplicarán: el de la secuencia
+	# recibida, el de los costos indicados (dict), ó el de los costos por defecto (set)
+	if techniques is None: return _DEFAULT_TECHNIQUES
+	if type(techniques) == dict:
+		names = sorted(techniques, key=techniques.get)
+	elif type(techniques) in (set, frozenset):
+		names = sorted(techniques, key=lambda name: (_TECHNIQUES[name][0] if name in _TECHNIQUES else 0, name))
+	else:
+		names = list(techniques)
+	for name in names:
+		if name not in _TECHNIQUES:
+			raise ValueError(f"Técnica '{name}' no reconocida, opciones: {', '.join(_TECHNIQUES)}.")
+	return tuple(names)
+
+#####################################################################################################
+#####################################################################################################
+
+# Estrategias de ramificación de la prueba-error. Las de elección de celda reciben los candidatos
+# y las posiciones por unidad y dígito (igual que las técnicas adicionales), y retornan la celda a
+# decidir, None si no queda ninguna sin resolver; las de orden de valores reciben además la celda,
+# y retornan sus dígitos en el orden en que se probarán. Con "twins" y "natural", cada motor usa
+# su propia elección (celda con dos candidatos de frecuencia 2 en su cuadrante, ó la primera con
+# el mínimo de candidatos) y su propio orden de candidatos.
+
+def _choose_mrv(cands, places, /):
+	# Mínimos valores restantes: la primera celda con menos candidatos
+	best, size = None, 10
+	for i, mask in enumerate(cands):
+		if mask and (n:= _POPCOUNT[mask]) < size:
+			best, size = i, n
+			if n < 3: break		# tras la propagación no quedan celdas con un solo candidato
+	return best
+#-------------------------------------------------------------------------------#
+def _choose_mrv_degree(cands, places, /):
+	# Entre las celdas con menos candidatos, la que tiene más vecinas sin resolver (grado)
+	size = min((_POPCOUNT[mask] for mask in cands if mask), default=0)
+	if not size: return None
+	best, degree = None, -1
+	for i, mask in enumerate(cands):
+		if _POPCOUNT[mask] == size:
+			if (n:= sum(1 for j in _PEERS[i] if cands[j])) > degree:
+				best, degree = i, n
+	return best
+#-------------------------------------------------------------------------------#
+def _order_lcv(cands, places, i, /):
+	# Valor menos restrictivo: primero el dígito que menos candidatos retira a las vecinas
+	peers = _PEERS[i]
+	return sorted(_DIGITS_OF[cands[i]], key=lambda d: sum(cands[j] >> (d-1) & 1 for j in peers))
+#-------------------------------------------------------------------------------#
+def _order_frequency(cands, places, i, /):
+	# Primero el dígito con menos posiciones disponibles en alguna unidad de la celda (el más 
+	# próximo a ser candidato de frecuencia única), y en empate, con menos posiciones en total
+	units = _CELL_UNITS[i]
+	def key(d):
+		counts = [_POPCOUNT[places[u*9 + d-1]] for u in units]
+		return (min(counts), sum(counts))
+	return sorted(_DIGITS_OF[cands[i]], key=key)
+#-------------------------------------------------------------------------------#
+_CELL_CHOICES = {"twins": None, "mrv": _choose_mrv, "mrv_degree": _choose_mrv_degree}
+_VALUE_ORDERS = {"natural": None, "lcv": _order_lcv, "frequency": _order_frequency}
+
+def _branching_strategy(branching, /):
+	# Par (elección de celda, orden de valores) a partir del nombre de una elección de celda, ó
+	# de un par de nombres; None para la estrategia por defecto
+	if branching is None: return _DEFAULT_BRANCHING
+	cell, value = (branching, _DEFAULT_BRANCHING[1]) if type(branching) == str else tuple(branching)
+	if cell not in _CELL_CHOICES:
+		raise ValueError(f"Elección de celda '{cell}' no reconocida, opciones: {', '.join(_CELL_CHOICES)}.")
+	if value not in _VALUE_ORDERS:
+		raise ValueError(f"Orden de valores '{value}' no reconocido, opciones: {', '.join(_VALUE_ORDERS)}.")
+	return (cell, value)
+
+class BitmaskBoard:
+	"""
+	Motor alternativo que representa los candidatos de cada celda como una máscara de 9 bits,
+	y cada unidad (cuadrante/fila/columna) como 9 máscaras de posiciones, una por dígito.
+	Aplica la misma lógica que 'SudokuBoard': candidatos únicos, candidatos de frecuencia
+	única por sector, técnica de pares gemelos por cuadrante y prueba-error.
+	"""
+	_INSTRUMENTED = {
+		"_BitmaskBoard__place_unique_candidates": _NAKED_SINGLE,
+		"_BitmaskBoard__trace_single_frequency_values": _HIDDEN_SINGLE_BY,
+		"_BitmaskBoard__apply_naked_hidden_twins_technique": _NAKED_HIDDEN_TWINS,
+		"_BitmaskBoard__apply_technique": None,
+		"_BitmaskBoard__search": _SEARCH,
+		"_BitmaskBoard__open_node": _NODE,
+		"_BitmaskBoard__restore": _RESTORE,
+	}
+	_max_guesses = inf
+	_deadline = inf
+	_techniques = _DEFAULT_TECHNIQUES
+	_branching = _DEFAULT_BRANCHING
+	_box = 3
+	#-------------------------------------------------------------------------------#
+	def __init__(self):
+		self._cands = [_ALL_CANDIDATES]*81		# candidatos por celda
+		self._values = [0]*81					# valor solución por celda, 0 si no tiene
+		self._places = [_ALL_CANDIDATES]*243	# posiciones disponibles por unidad y dígito
+		self._placed = [0]*27					# dígitos ya asignados por unidad
+		self._givens = [False]*81
+		self._placed_by = [None]*81				# técnica con la que se resolvió cada celda
+		self._queue = []						# celdas con candidato único
+		self.__step = 0
+		self.__guesses = 0
+		self.__backtracks = 0
+		self.__showing = False
+		self.__show_by_step = 0
+		self.__boardN = 0
+	#-------------------------------------------------------------------------------#
+	def __reset(self):
+		self._cands = [_ALL_CANDIDATES]*81
+		self._values = [0]*81
+		self._places = [_ALL_CANDIDATES]*243
+		self._placed = [0]*27
+		self._givens = [False]*81
+		self._placed_by = [None]*81
+		self._queue.clear()
+		self.__step = self.__guesses = self.__backtracks = 0
+	#-------------------------------------------------------------------------------#
+	def __eliminate(self, i, bit, /):
+		# Retorna False si la celda se queda sin candidatos
+		# (las celdas con valor asignado no tienen candidatos)
+		cands = self._cands
+		if cands[i] & bit:
+			cands[i] ^= bit
+			places = self._places
+			d = _LOWEST_DIGIT[bit] - 1
+			for base, clear in _CELL_SLOTS[i]:
+				places[base+d] &= clear
+			n = _POPCOUNT[cands[i]]
+			if n == 1:
+				self._queue.append(i)
+			elif not n:
+				return False
+		return True
+	#-------------------------------------------------------------------------------#
+	def __assign(self, i, value, /):
+		# Retorna False si la asignación conduce a un tablero inconsistente
+		if self._values[i]:
+			return self._values[i] == value
+		bit = 1 << (value-1)
+		cands = self._cands
+		if not cands[i] & bit:
+			return False
+		self._values[i] = value
+		placed = self._placed
+		for u in _CELL_UNITS[i]:
+			placed[u] |= bit
+		# retirar todos los candidatos de la celda de sus unidades
+		places = self._places
+		slots = _CELL_SLOTS[i]
+		for d in _DIGITS_OF[cands[i]]:
+			for base, clear in slots:
+				places[base+d-1] &= clear
+		cands[i] = 0
+		# propagar la eliminación del valor a las celdas vecinas (versión en línea de
+		# '__eliminate', por ser el camino más transitado)
+		d = value - 1
+		queue = self._queue
+		for j in _PEERS[i]:
+			if (c:= cands[j]) & bit:
+				cands[j] = c = c ^ bit
+				for base, clear in _CELL_SLOTS[j]:
+					places[base+d] &= clear
+				if (n:= _POPCOUNT[c]) == 1:
+					queue.append(j)
+				elif not n:
+					return False
+		self.__step += 1
+		if self.__showing and not (self.__step % self.__show_by_step):
+			self.show_board(self.__boardN, True)
+		return True
+	#-------------------------------------------------------------------------------#
+	def _load(self, sequence, verbose=True, /):
+		self.__reset()
+		for i, value in enumerate(sequence):
+			if value.isnumeric() and int(value) > 0:
+				if not self.__assign(i, int(value)):
+					if verbose: print("[ERROR] Tablero inconsistente.", f"Celda {dict(row=i//9, col=i%9)} no admite el valor {value}")
+					return False
+				self._givens[i] = True
+				self._placed_by[i] = _GIVEN
+		self._queue.clear()
+		self.__step = 0
+		return True
+	#-------------------------------------------------------------------------------#
+	def __place_unique_candidates(self):
+		queue = self._queue
+		while queue:
+			i = queue.pop()
+			if not self._values[i]:
+				if not self._cands[i] or not self.__assign(i, _LOWEST_DIGIT[self._cands[i]]):
+					return False
+				self._placed_by[i] = _NAKED_SINGLE
+		return True
+	#-------------------------------------------------------------------------------#
+	def __trace_single_frequency_values(self, way, /):
+		# Retorna None si el tablero es inconsistente, o si hubo cambios en el tablero
+		places = self._places
+		values = self._values
+		placed = self._placed
+		change_exists = False
+		for u in range(way*9, way*9+9):
+			if placed[u] == _ALL_CANDIDATES: continue
+			cells = _UNITS[u]
+			base = u*9
+			for d in _BOARD_RANGE:
+				m = places[base+d]
+				if not m:
+					# un dígito sin asignar que no tiene lugar en la unidad
+					if not placed[u] >> d & 1: return None
+				elif _POPCOUNT[m] == 1:
+					i = cells[_LOWEST_DIGIT[m]-1]
+					if not values[i]:
+						if not self.__assign(i, d+1):
+							return None
+						self._placed_by[i] = _HIDDEN_SINGLE_BY[way]
+						change_exists = True
+		return change_exists
+	#-------------------------------------------------------------------------------#
+	def __apply_naked_hidden_twins_technique(self):
+		# Retorna None si el tablero es inconsistente, o si hubo cambios en los candidatos
+		places = self._places
+		cands = self._cands
+		eliminate = self.__eliminate
+		change_exists = False
+		for q in _BOARD_RANGE:
+			cells = _UNITS[q]
+			base = q*9
+			twos = [d for d in _BOARD_RANGE if _POPCOUNT[places[base+d]] == 2]
+			if not twos: continue
+			# si un candidato aparece 2 veces en una misma fila/columna del cuadrante,
+			# eliminar ese candidato del resto de celdas de esa fila/columna
+			for d in twos:
+				m = places[base+d]
+				a = cells[_LOWEST_DIGIT[m]-1]
+				b = cells[_LOWEST_DIGIT[m & (m-1)]-1]
+				if a//9 == b//9:
+					unit = _UNITS[9 + a//9]
+				elif a%9 == b%9:
+					unit = _UNITS[18 + a%9]
+				else:
+					continue
+				bit = 1 << d
+				for j in unit:
+					if j != a and j != b and cands[j] & bit:
+						if not eliminate(j, bit): return None
+						change_exists = True
+			# si dos candidatos aparecen en las mismas dos celdas, eliminar el resto
+			# de candidatos en ambas celdas
+			for d1, d2 in combinations(twos, 2):
+				m = places[base+d1]
+				if m == places[base+d2] and _POPCOUNT[m] == 2:
+					keep = (1 << d1) | (1 << d2)
+					for k in (_LOWEST_DIGIT[m]-1, _LOWEST_DIGIT[m & (m-1)]-1):
+						i = cells[k]
+						for d in _DIGITS_OF[cands[i] & ~keep]:
+							if not eliminate(i, 1 << (d-1)): return None
+							change_exists = True
+		return change_exists
+	#-------------------------------------------------------------------------------#
+	def __propagate(self):
+		# Misma secuencia de técnicas que 'SudokuBoard.__solve'; retorna False si el
+		# tablero resulta inconsistente.
+		twins_applied = False
+		queue = self._queue
+		while True:
+			if not self.__place_unique_candidates(): return False
+			# Localizar candidatos únicos por cuadrante (0), fila (1), columna (2)
+			rescan = True
+			while rescan and not queue:
+				rescan = False
+				for way in _BLOCK_RANGE:
+					if (changed:= self.__trace_single_frequency_values(way)) is None: return False
+					rescan = rescan or changed
+				if rescan: twins_applied = False
+			if queue: continue
+			if 0 not in self._values: return True
+			# Aplicar técnica de pares gemelos (naked/hidden twins) por cuadrante
+			if not twins_applied:
+				rescan = True
+				num_try = 0
+				while rescan and not queue:
+					num_try += 1
+					if (rescan:= self.__apply_naked_hidden_twins_technique()) is None: return False
+				if queue: continue
+				if num_try > 1:
+					twins_applied = True
+					continue
+			# Aplicar técnicas adicionales; tras el primer cambio, volver a las anteriores
+			if (changed:= self.__apply_techniques()) is None: return False
+			if not changed: return True
+			twins_applied = False
+	#-------------------------------------------------------------------------------#
+	def __apply_techniques(self):
+		# Retorna None si el tablero es inconsistente, o si hubo cambios en los candidatos
+		cands = self._cands
+		places = self._places
+		for name in self._techniques:
+			if (changed:= self.__apply_technique(name, cands, places)) is None or changed: return changed
+		return False
+	#-------------------------------------------------------------------------------#
+	def __apply_technique(self, name, cands, places, /):
+		eliminate = self.__eliminate
+		change_exists = False
+		for i, mask in _TECHNIQUES[name][1](cands, places):
+			for d in _DIGITS_OF[cands[i] & mask]:
+				if not eliminate(i, 1 << (d-1)): return None
+				change_exists = True
+		return change_exists
+	#-------------------------------------------------------------------------------#
+	def __detect_starting_cell_to_make_decision(self):
+		# Preferir una celda con dos candidatos que sean de frecuencia 2 en su cuadrante,
+		# caso contrario, la primera celda con el mínimo de candidatos
+		places = self._places
+		cands = self._cands
+		min_base, first = 10, None
+		for q in _BOARD_RANGE:
+			base = q*9
+			twins = 0
+			for d in _BOARD_RANGE:
+				if _POPCOUNT[places[base+d]] == 2: twins |= 1 << d
+			for i in _UNITS[q]:
+				if (l:= _POPCOUNT[cands[i]]) > 1:
+					if l == 2 and _POPCOUNT[twins] > 1 and cands[i] & twins == cands[i]:
+						return i
+					if l < min_base:
+						min_base, first = l, i
+		return first
+	#-------------------------------------------------------------------------------#
+	def __snapshot(self):
+		return (self._cands[:], self._values[:], self._places[:], self._placed[:], self._placed_by[:], self.__step)
+	#-------------------------------------------------------------------------------#
+	def __restore(self, state, /):
+		self._cands = state[0][:]
+		self._values = state[1][:]
+		self._places = state[2][:]
+		self._placed = state[3][:]
+		self._placed_by = state[4][:]
+		self.__step = state[5]
+		self._queue.clear()
+	#-------------------------------------------------------------------------------#
+	def __branch(self):
+		# Celda a decidir según la elección de '_branching', None si no queda ninguna
+		if (choose:= _CELL_CHOICES[self._branching[0]]) is None:
+			return self.__detect_starting_cell_to_make_decision()
+		return choose(self._cands, self._places)
+	#-------------------------------------------------------------------------------#
+	def __open_node(self, depth, /):
+		# Punto de decisión abierto a la profundidad indicada; sólo lo mide 'SolverStats'
+		pass
+	#-------------------------------------------------------------------------------#
+	def __search(self, limit=1, /):
+		# Prueba-error iterativa, con una pila de puntos de decisión (estado previo, celda y
+		# opciones aún no probadas). Retorna las soluciones halladas, hasta 'limit' (el tablero
+		# queda en la última), ó '_LIMITED' al alcanzar el límite de opciones ó de tiempo.
+		stack = []
+		found = 0
+		consistent = self.__propagate()
+		while True:
+			if consistent:
+				if 0 not in self._values:
+					found += 1
+					if found >= limit: return found
+				elif (i:= self.__branch()) is not None:
+					self.__open_node(len(stack) + 1)
+					order = _VALUE_ORDERS[self._branching[1]]
+					options = order(self._cands, self._places, i) if order is not None else _DIGITS_OF[self._cands[i]]
+					stack.append([self.__snapshot(), i, list(options[::-1]), 0])
+			# Retroceder hasta el punto de decisión más reciente con opciones por probar
+			while stack and not stack[-1][2]: stack.pop()
+			if not stack: return found
+			frame = stack[-1]
+			state, i, options, tried = frame
+			if tried:
+				self.__backtracks += 1
+				self.__restore(state)
+			frame[3] += 1
+			if self.__guesses >= self._max_guesses or time.perf_counter() > self._deadline: return _LIMITED
+			self.__guesses += 1
+			self._placed_by[i] = _GUESS
+			consistent = self.__assign(i, options.pop()) and self.__propagate()
+	#-------------------------------------------------------------------------------#
+	def _count_solutions(self, limit, /):
+		return self.__search(limit)
+	#-------------------------------------------------------------------------------#
+	def _exclude(self, i, value, /):
+		# Descarta un valor de una celda sin resolver tras '_load' (p.ej. para buscar una solución
+		# distinta de una conocida, ver 'sudoku_generator.py'); False si se queda sin candidatos
+		return self.__eliminate(i, 1 << (value-1))
+	#-------------------------------------------------------------------------------#
+	def _run(self, showing, show_by_step, boardN, /):
+		if show_by_step < 0: show_by_step = 0
+		self.__showing = bool(showing and show_by_step)
+		self.__show_by_step = show_by_step
+		self.__boardN = boardN
+		self.__step = self.__guesses = self.__backtracks = 0
+		try:
+			if (found:= self.__search()) == _LIMITED:
+				raise SearchLimitError(f"Búsqueda detenida tras {self.__guesses} opciones probadas.")
+			if not found:
+				raise InconsistentBoardError("No se encuentra un camino de solución al tablero.")
+		finally:
+			self.__showing = False
+		self.show_board(boardN, showing and not (show_by_step and not (self.__step % show_by_step)))
+	#-------------------------------------------------------------------------------#
+	def _metrics(self):
+		return (self.__step, self.__guesses, self.__backtracks, tuple(self._placed_by))
+	#-------------------------------------------------------------------------------#
+	def _candidates_left(self):
+		return (sum(_POPCOUNT[c] for c in self._cands), self._values.count(0))
+	#-------------------------------------------------------------------------------#
+	def is_solved(self):
+		return 0 not in self._values
+	#-------------------------------------------------------------------------------#
+	def get_current_sequence(self):
+		return "".join(map(str, self._values))
+	#-------------------------------------------------------------------------------#
+	def show_board(self, boardN, can_show, /):
+		"""
+		Método para visualizar el estado de un tablero Sudoku.
+		
+		ARGS:
+		- can_show	: (bool) permite la visualización de tablero.
+		- boardN	: (int) número de tablero siendo procesado su solución.
+		"""
+		if can_show: _print_board(self._values, self._givens, boardN, self.__step)
+
+#-------------------------------------------------------------------------------#
+def _print_board(values, givens, boardN, step, /):
+	# Visualiza un tablero representado por sus valores en orden fila-columna (0 si la celda
+	# está vacía), de cualquier tamaño admitido
+	size = isqrt(len(values))
+	box = isqrt(size)
+	print("*"*30, f"[ BOARD Nº {boardN}: STEP {step} ]", "*"*30)
+	for row in range(size):
+		if row and not (row % box): print("┼".join(["─"*box]*box))
+		for col in range(size):
+			if col and not (col % box): print("|", end="")
+			i = row*size + col
+			value = values[i]
+			if not value:
+				print("·", end="")
+			else:
+				print(_SYMBOLS[value] if not givens[i] else f"{FColors.FAIL}{_SYMBOLS[value]}{FColors.ENDC}", end="")
+		print("")
+
+#####################################################################################################
+#####################################################################################################
+
+class DancingLinksBoard:
+	"""
+	Motor que resuelve el tablero como un problema de cobertura exacta (Algoritmo X de Knuth,
+	con "Dancing Links"). Las 324 restricciones (celda, fila-dígito, columna-dígito y
+	cuadrante-dígito) y las 729 opciones (celda-dígito) se enlazan una sola vez; cada tablero
+	cubre sus pistas y, al terminar, las descubre para dejar la estructura lista para el
+	siguiente.
+	"""
+	# Técnica equivalente al cubrir una restricción con una única opción disponible
+	__FORCED_BY = (_NAKED_SINGLE, _HIDDEN_SINGLE_BY[1], _HIDDEN_SINGLE_BY[2], _HIDDEN_SINGLE_BY[0])
+	# Sin técnicas de propagación separables: sólo se mide la búsqueda
+	_INSTRUMENTED = {"_DancingLinksBoard__search": _SEARCH, "_DancingLinksBoard__open_node": _NODE}
+	_max_guesses = inf
+	_deadline = inf
+	_box = 3
+	#-------------------------------------------------------------------------------#
+	def __init__(self):
+		# Nodo 0: raíz; nodos 1..324: cabeceras de restricción; luego 4 nodos por opción
+		n = 1 + 324 + 729*4
+		self._L = list(range(n))
+		self._R = list(range(n))
+		self._U = list(range(n))
+		self._D = list(range(n))
+		self._C = list(range(n))		# cabecera de cada nodo
+		self._ROW = [-1]*n				# opción (celda*9 + dígito-1) de cada nodo
+		self._S = [0]*325				# opciones disponibles por restricción
+		self._first = [0]*729			# primer nodo de cada opción
+		self._values = [0]*81
+		self._givens = [False]*81
+		self._placed_by = [None]*81
+		self.__selected = []			# opciones de las pistas cubiertas
+		self.__step = self.__guesses = self.__backtracks = 0
+		self.__link()
+	#-------------------------------------------------------------------------------#
+	def __link(self):
+		L, R, U, D, C, ROW, S = self._L, self._R, self._U, self._D, self._C, self._ROW, self._S
+		# Cabeceras enlazadas horizontalmente a la raíz
+		for c in range(325):
+			L[c] = c - 1 if c else 324
+			R[c] = c + 1 if c < 324 else 0
+		node = 325
+		for i in range(81):
+			r, c, q = i // 9, i % 9, (i // 27)*3 + (i % 9)//3
+			for d in _BOARD_RANGE:
+				columns = (1 + i, 82 + r*9 + d, 163 + c*9 + d, 244 + q*9 + d)
+				first = node
+				self._first[i*9 + d] = first
+				for k, col in enumerate(columns):
+					C[node] = col
+					ROW[node] = i*9 + d
+					# enlace vertical al final de la columna
+					U[node] = U[col]
+					D[node] = col
+					D[U[col]] = node
+					U[col] = node
+					S[col] += 1
+					# enlace horizontal circular dentro de la opción
+					L[node] = first + (k - 1) % 4
+					R[node] = first + (k + 1) % 4
+					node += 1
+	#-------------------------------------------------------------------------------#
+	def __cover(self, c, /):
+		L, R, U, D, C, S = self._L, self._R, self._U, self._D, self._C, self._S
+		L[R[c]] = L[c]
+		R[L[c]] = R[c]
+		i = D[c]
+		while i != c:
+			j = R[i]
+			while j != i:
+				U[D[j]] = U[j]
+				D[U[j]] = D[j]
+				S[C[j]] -= 1
+				j = R[j]
+			i = D[i]
+	#-------------------------------------------------------------------------------#
+	def __uncover(self, c, /):
+		L, R, U, D, C, S = self._L, self._R, self._U, self._D, self._C, self._S
+		i = U[c]
+		while i != c:
+			j = L[i]
+			while j != i:
+				S[C[j]] += 1
+				U[D[j]] = j
+				D[U[j]] = j
+				j = L[j]
+			i = U[i]
+		L[R[c]] = c
+		R[L[c]] = c
+	#-------------------------------------------------------------------------------#
+	def __release(self):
+		# Descubrir las pistas en orden inverso, dejando la estructura como al inicio
+		L, C = self._L, self._C
+		while self.__selected:
+			first = self.__selected.pop()
+			j = L[first]
+			while True:
+				self.__uncover(C[j])
+				if j == first: break
+				j = L[j]
+	#-------------------------------------------------------------------------------#
+	def _load(self, sequence, verbose=True, /):
+		self.__release()
+		self._values = [0]*81
+		self._givens = [False]*81
+		self._placed_by = [None]*81
+		self.__step = self.__guesses = self.__backtracks = 0
+		L, R, C = self._L, self._R, self._C
+		for i, value in enumerate(sequence):
+			if value.isnumeric() and int(value) > 0:
+				first = self._first[i*9 + int(value) - 1]
+				# todas las restricciones de la opción deben seguir sin cubrir
+				j = first
+				while True:
+					c = C[j]
+					if R[L[c]] != c:
+						if verbose: print("[ERROR] Tablero inconsistente.", f"Celda {dict(row=i//9, col=i%9)} no admite el valor {value}")
+						self.__release()
+						return False
+					j = R[j]
+					if j == first: break
+				while True:
+					self.__cover(C[j])
+					j = R[j]
+					if j == first: break
+				self.__selected.append(first)
+				self._values[i] = int(value)
+				self._givens[i] = True
+				self._placed_by[i] = _GIVEN
+		return True
+	#-------------------------------------------------------------------------------#
+	def __open_node(self, depth, /):
+		# Restricción cubierta a la profundidad indicada; sólo lo mide 'SolverStats'
+		pass
+	#-------------------------------------------------------------------------------#
+	def __search(self, limit=1, /):
+		# Algoritmo X iterativo: por nivel, la restricción cubierta, la opción en curso (la propia
+		# cabecera si aún no hay una) y su cantidad de opciones. Retorna las soluciones halladas,
+		# hasta 'limit' (se registra la última), ó '_LIMITED' al alcanzar el límite de opciones ó
+		# de tiempo; en todo caso, la estructura queda descubierta como al inicio.
+		R, L, D, C, S, ROW = self._R, self._L, self._D, self._C, self._S, self._ROW
+		stack = []
+		found = 0
+		while True:
+			if R[0] == 0:
+				# todas las restricciones cubiertas: registrar la solución
+				found += 1
+				if found >= limit:
+					for c, r, size in stack:
+						self._values[ROW[r] // 9] = ROW[r] % 9 + 1
+						self._placed_by[ROW[r] // 9] = self.__FORCED_BY[(c - 1) // 81] if size == 1 else _GUESS
+					self.__step = len(stack)
+					break
+			else:
+				# elegir la restricción con menos opciones disponibles
+				c = R[0]
+				size = S[c]
+				j = R[c]
+				while j and size > 1:
+					if S[j] < size:
+						c, size = j, S[j]
+					j = R[j]
+				if size:
+					self.__cover(c)
+					self.__open_node(len(stack) + 1)
+					stack.append([c, c, size])
+			# Pasar a la siguiente opción del nivel más profundo que aún tenga alguna
+			while stack:
+				frame = stack[-1]
+				c, r, size = frame
+				if r != c:
+					j = L[r]
+					while j != r:
+						self.__uncover(C[j])
+						j = L[j]
+					if size > 1: self.__backtracks += 1
+				r = frame[1] = D[r]
+				if r == c:
+					self.__uncover(c)
+					stack.pop()
+					continue
+				if size > 1:
+					# al alcanzar los límites se deshace la cobertura sin seguir buscando
+					if self.__guesses >= self._max_guesses or time.perf_counter() > self._deadline:
+						frame[1] = c
+						found = _LIMITED
+						break
+					self.__guesses += 1
+				j = R[r]
+				while j != r:
+					self.__cover(C[j])
+					j = R[j]
+				break
+			else:
+				return found
+			if found == _LIMITED: break
+		# Descubrir los niveles pendientes, del más profundo al primero
+		for c, r, size in reversed(stack):
+			if r != c:
+				j = L[r]
+				while j != r:
+					self.__uncover(C[j])
+					j = L[j]
+			self.__uncover(c)
+		return found
+	#-------------------------------------------------------------------------------#
+	def _count_solutions(self, limit, /):
+		try:
+			return self.__search(limit)
+		finally:
+			self.__release()
+	#-------------------------------------------------------------------------------#
+	def _run(self, showing, show_by_step, boardN, /):
+		try:
+			if (found:= self.__search()) == _LIMITED:
+				raise SearchLimitError(f"Búsqueda detenida tras {self.__guesses} opciones probadas.")
+			if not found:
+				raise InconsistentBoardError("No se encuentra un camino de solución al tablero.")
+		finally:
+			self.__release()
+		self.show_board(boardN, showing)
+	#-------------------------------------------------------------------------------#
+	def _metrics(self):
+		return (self.__step, self.__guesses, self.__backtracks, tuple(self._placed_by))
+	#-------------------------------------------------------------------------------#
+	def _candidates_left(self):
+		# Opciones aún disponibles en las restricciones de celda sin cubrir
+		R, S = self._R, self._S
+		total = cells = 0
+		c = R[0]
+		while c and c <= 81:
+			total += S[c]
+			cells += 1
+			c = R[c]
+		return (total, cells)
+	#-------------------------------------------------------------------------------#
+	def is_solved(self):
+		return 0 not in self._values
+	#-------------------------------------------------------------------------------#
+	def get_current_sequence(self):
+		return "".join(map(str, self._values))
+	#-------------------------------------------------------------------------------#
+	def show_board(self, boardN, can_show, /):
+		"""
+		Método para visualizar el estado de un tablero Sudoku.
+		
+		ARGS:
+		- can_show	: (bool) permite la visualización de tablero.
+		- boardN	: (int) número de tablero siendo procesado su solución.
+		"""
+		if can_show: _print_board(self._values, self._givens, boardN, self.__step)
+
+#####################################################################################################
+#####################################################################################################
+
+# Tablas de 'ScalableBoard' por tamaño de cuadrante, construidas a demanda (ver '_scalable_tables')
+_SCALABLE_TABLES = {}
+# Cantidad de bits en 1 de una máscara ('int.bit_count' desde Python 3.10)
+_bit_count = int.bit_count if hasattr(int, "bit_count") else lambda m: bin(m).count("1")
+#-------------------------------------------------------------------------------#
+def _scalable_tables(box, /):
+	"""
+	Tablas de un tablero de cuadrantes de box×box para 'ScalableBoard': unidades, unidades y
+	vecinas por celda, posición de cada celda en sus unidades, y para las intersecciones 
+	cuadrante/línea, las máscaras de posiciones de cada fila/columna interna de un cuadrante 
+	y de cada segmento de fila/columna, con las celdas afectadas por cada una.
+	"""
+	if box in _SCALABLE_TABLES: return _SCALABLE_TABLES[box]
+	size = box*box
+	span = range(size)
+	units, cell_units, peers = _unit_tables(box)
+	slots = tuple(tuple((u*size, ~(1 << units[u].index(i))) for u in cell_units[i]) for i in range(size*size))
+	row_masks = tuple(((1 << box) - 1) << box*k for k in range(box))
+	column_masks = tuple(sum(1 << (k*box + j) for k in range(box)) for j in range(box))
+	# (máscara, celdas afectadas) por cuadrante: sus filas y columnas internas, fuera del cuadrante
+	pointing = tuple(tuple(
+		[(row_masks[k], tuple(i for i in units[size + (q//box)*box + k] if i not in units[q])) for k in range(box)] +
+		[(column_masks[k], tuple(i for i in units[2*size + (q%box)*box + k] if i not in units[q])) for k in range(box)])
+		for q in span)
+	# (máscara, celdas afectadas) por fila/columna: sus segmentos, el resto de su cuadrante
+	claiming = tuple(tuple(
+		(row_masks[k], tuple(i for i in units[cell_units[units[u][k*box]][0]] if i not in units[u])) for k in range(box))
+		for u in range(size, 3*size))
+	_SCALABLE_TABLES[box] = tables = (size, units, cell_units, peers, slots, pointing, claiming)
+	return tables
+#-------------------------------------------------------------------------------#
+
+class ScalableBoard:
+	"""
+	Motor para tableros de N×N, con cuadrantes de 2×2 a 5×5 (de 4×4 hasta 25×25 celdas). 
+	Representa los candidatos igual que 'BitmaskBoard' (máscaras de N bits por celda, y de
+	posiciones por unidad y dígito), pero sin tablas indexadas por máscara, que a partir de 
+	16×16 serían demasiado grandes: sus tablas se construyen una vez por tamaño de cuadrante.
+	Aplica candidatos únicos, candidatos de frecuencia única por sector, las intersecciones
+	cuadrante/línea ("pointing" y "box_line") y los pares desnudos y ocultos ("naked_pairs" y
+	"hidden_pairs"), si están entre las técnicas indicadas, y prueba-error sobre la decisión
+	más restringida: la celda con menos candidatos, ó el dígito con menos posiciones en una
+	unidad. El tamaño de cuadrante es '_box' al cargar cada tablero.
+	"""
+	_INSTRUMENTED = {
+		"_ScalableBoard__place_unique_candidates": _NAKED_SINGLE,
+		"_ScalableBoard__trace_single_frequency_values": _HIDDEN_SINGLE_BY,
+		"_ScalableBoard__apply_technique": None,
+		"_ScalableBoard__search": _SEARCH,
+		"_ScalableBoard__open_node": _NODE,
+		"_ScalableBoard__restore": _RESTORE,
+	}
+	# Técnicas adicionales que este motor sabe aplicar en cualquier tamaño
+	__TECHNIQUES = ("pointing", "box_line", "naked_pairs", "hidden_pairs")
+	_max_guesses = inf
+	_deadline = inf
+	_techniques = _DEFAULT_TECHNIQUES
+	#-------------------------------------------------------------------------------#
+	def __init__(self, box:int=3):
+		self._box = box
+		self.__tables = None
+		self._cands = []
+		self._values = []
+		self._places = []
+		self._placed = []
+		self._givens = []
+		self._placed_by = []
+		self._queue = []
+		self.__step = 0
+		self.__guesses = 0
+		self.__backtracks = 0
+		self.__showing = False
+		self.__show_by_step = 0
+		self.__boardN = 0
+	#-------------------------------------------------------------------------------#
+	def __reset(self):
+		if self._box not in _BOX_SIZES:
+			raise ValueError("El tamaño de cuadrante debe estar entre 2 y 5.")
+		if self.__tables is None or self.__tables[0] != self._box**2:
+			self.__tables = _scalable_tables(self._box)
+		size = self.__tables[0]
+		full = (1 << size) - 1
+		self._cands = [full]*(size*size)
+		self._values = [0]*(size*size)
+		self._places = [full]*(3*size*size)
+		self._placed = [0]*(3*size)
+		self._givens = [False]*(size*size)
+		self._placed_by = [None]*(size*size)
+		self._queue.clear()
+		self.__step = self.__guesses = self.__backtracks = 0
+	#-------------------------------------------------------------------------------#
+	def __eliminate(self, i, bit, /):
+		# Retorna False si la celda se queda sin candidatos
+		cands = self._cands
+		if cands[i] & bit:
+			cands[i] = c = cands[i] ^ bit
+			places = self._places
+			d = bit.bit_length() - 1
+			for base, clear in self.__tables[4][i]:
+				places[base+d] &= clear
+			if not c:
+				return False
+			if not c & (c-1):
+				self._queue.append(i)
+		return True
+	#-------------------------------------------------------------------------------#
+	def __assign(self, i, value, /):
+		# Retorna False si la asignación conduce a un tablero inconsistente
+		if self._values[i]:
+			return self._values[i] == value
+		bit = 1 << (value-1)
+		cands = self._cands
+		if not cands[i] & bit:
+			return False
+		size, units, cell_units, peers, slots = self.__tables[:5]
+		self._values[i] = value
+		placed = self._placed
+		for u in cell_units[i]:
+			placed[u] |= bit
+		# retirar todos los candidatos de la celda de sus unidades
+		places = self._places
+		m = cands[i]
+		while m:
+			low = m & -m
+			d = low.bit_length() - 1
+			for base, clear in slots[i]:
+				places[base+d] &= clear
+			m ^= low
+		cands[i] = 0
+		# propagar la eliminación del valor a las celdas vecinas
+		d = value - 1
+		queue = self._queue
+		for j in peers[i]:
+			if (c:= cands[j]) & bit:
+				cands[j] = c = c ^ bit
+				for base, clear in slots[j]:
+					places[base+d] &= clear
+				if not c:
+					return False
+				if not c & (c-1):
+					queue.append(j)
+		self.__step += 1
+		if self.__showing and not (self.__step % self.__show_by_step):
+			self.show_board(self.__boardN, True)
+		return True
+	#-------------------------------------------------------------------------------#
+	def _load(self, sequence, verbose=True, /):
+		self.__reset()
+		size = self.__tables[0]
+		if len(sequence) != size*size:
+			if verbose: print("[ERROR] Tablero inválido.", f"Se esperaba una secuencia de {size*size} caracteres")
+			return False
+		for i, symbol in enumerate(sequence.upper()):
+			if 0 < (value:= _SYMBOLS.find(symbol)) <= size:
+				if not self.__assign(i, value):
+					if verbose: print("[ERROR] Tablero inconsistente.", f"Celda {dict(row=i//size, col=i%size)} no admite el valor {symbol}")
+					return False
+				self._givens[i] = True
+				self._placed_by[i] = _GIVEN
+		self._queue.clear()
+		self.__step = 0
+		return True
+	#-------------------------------------------------------------------------------#
+	def __place_unique_candidates(self):
+		queue = self._queue
+		cands = self._cands
+		while queue:
+			i = queue.pop()
+			if not self._values[i]:
+				if not cands[i] or not self.__assign(i, cands[i].bit_length()):
+					return False
+				self._placed_by[i] = _NAKED_SINGLE
+		return True
+	#-------------------------------------------------------------------------------#
+	def __trace_single_frequency_values(self, way, /):
+		# Retorna None si el tablero es inconsistente, o si hubo cambios en el tablero
+		size, units = self.__tables[:2]
+		full = (1 << size) - 1
+		places = self._places
+		values = self._values
+		placed = self._placed
+		change_exists = False
+		for u in range(way*size, way*size + size):
+			cells = units[u]
+			base = u*size
+			# sólo los dígitos aún sin asignar en la unidad
+			free = full & ~placed[u]
+			while free:
+				low = free & -free
+				free ^= low
+				d = low.bit_length() - 1
+				m = places[base+d]
+				if not m:
+					# un dígito sin asignar que no tiene lugar en la unidad
+					return None
+				if not m & (m-1):
+					i = cells[m.bit_length()-1]
+					if not values[i]:
+						if not self.__assign(i, d+1):
+							return None
+						self._placed_by[i] = _HIDDEN_SINGLE_BY[way]
+						change_exists = True
+		return change_exists
+	#-------------------------------------------------------------------------------#
+	def __apply_technique(self, name, /):
+		# Retorna None si el tablero es inconsistente, o si hubo cambios en los candidatos
+		if name == "naked_pairs": return self.__apply_naked_pairs()
+		if name == "hidden_pairs": return self.__apply_hidden_pairs()
+		return self.__apply_intersections(name == "pointing")
+	#-------------------------------------------------------------------------------#
+	def __apply_intersections(self, pointing, /):
+		# Intersecciones cuadrante/línea: un dígito confinado a una fila/columna interna de un
+		# cuadrante ("pointing") ó a un segmento de una fila/columna ("box_line") se elimina
+		# del resto de la línea ó del cuadrante
+		size = self.__tables[0]
+		box = self._box
+		first, lines = (0, self.__tables[5]) if pointing else (size, self.__tables[6])
+		full = (1 << size) - 1
+		places = self._places
+		placed = self._placed
+		cands = self._cands
+		eliminate = self.__eliminate
+		change_exists = False
+		for u, intersections in enumerate(lines, first):
+			base = u*size
+			free = full & ~placed[u]
+			while free:
+				bit = free & -free
+				free ^= bit
+				d = bit.bit_length() - 1
+				m = places[base+d]
+				if not m & (m-1): continue
+				# la única fila interna (ó segmento) que puede contenerlas es la de la primera posición,
+				# y en un cuadrante, también la columna interna de esa posición
+				k = (m & -m).bit_length() - 1
+				mask, cells = intersections[k // box]
+				if m & ~mask:
+					if not pointing: continue
+					mask, cells = intersections[box + k % box]
+					if m & ~mask: continue
+				for j in cells:
+					if cands[j] & bit:
+						if not eliminate(j, bit): return None
+						change_exists = True
+		return change_exists
+	#-------------------------------------------------------------------------------#
+	def __apply_naked_pairs(self):
+		# Dos celdas de una unidad con los mismos dos candidatos: esos dígitos se eliminan del
+		# resto de celdas de la unidad
+		cands = self._cands
+		eliminate = self.__eliminate
+		change_exists = False
+		for cells in self.__tables[1]:
+			seen = {}
+			for i in cells:
+				m = cands[i]
+				if not m or not (r:= m & (m-1)) or r & (r-1): continue
+				if m not in seen:
+					seen[m] = i
+					continue
+				for k in cells:
+					if k != i and k != seen[m] and cands[k] & m:
+						for bit in (m & -m, r):
+							if cands[k] & bit:
+								if not eliminate(k, bit): return None
+								change_exists = True
+		return change_exists
+	#-------------------------------------------------------------------------------#
+	def __apply_hidden_pairs(self):
+		# Dos dígitos con las mismas dos posiciones en una unidad: el resto de candidatos de
+		# esas dos celdas se elimina
+		size, units = self.__tables[:2]
+		full = (1 << size) - 1
+		places = self._places
+		placed = self._placed
+		cands = self._cands
+		eliminate = self.__eliminate
+		change_exists = False
+		for u, cells in enumerate(units):
+			base = u*size
+			seen = {}
+			free = full & ~placed[u]
+			while free:
+				low = free & -free
+				free ^= low
+				d = low.bit_length() - 1
+				m = places[base+d]
+				if not m or not (r:= m & (m-1)) or r & (r-1): continue
+				if m not in seen:
+					seen[m] = d
+					continue
+				keep = low | (1 << seen[m])
+				for k in ((m & -m).bit_length() - 1, r.bit_length() - 1):
+					i = cells[k]
+					extra = cands[i] & ~keep
+					while extra:
+						bit = extra & -extra
+						extra ^= bit
+						if not eliminate(i, bit): return None
+						change_exists = True
+		return change_exists
+	#-------------------------------------------------------------------------------#
+	def __propagate(self):
+		# Retorna False si el tablero resulta inconsistente
+		queue = self._queue
+		techniques = [name for name in self._techniques if name in self.__TECHNIQUES]
+		while True:
+			if not self.__place_unique_candidates(): return False
+			# Localizar candidatos únicos por cuadrante (0), fila (1), columna (2)
+			rescan = True
+			while rescan and not queue:
+				rescan = False
+				for way in _BLOCK_RANGE:
+					if (changed:= self.__trace_single_frequency_values(way)) is None: return False
+					rescan = rescan or changed
+			if queue: continue
+			if 0 not in self._values: return True
+			# Aplicar intersecciones; tras el primer cambio, volver a las anteriores
+			for name in techniques:
+				if (changed:= self.__apply_technique(name)) is None: return False
+				if changed: break
+			else:
+				return True
+	#-------------------------------------------------------------------------------#
+	def __detect_starting_cell_to_make_decision(self):
+		# Opciones (celda, valor) de la decisión más restringida, None si no queda ninguna celda:
+		# los candidatos de la primera celda con el mínimo de ellos, ó, si son menos, las
+		# posiciones del dígito con menos lugares en alguna unidad
+		size, units = self.__tables[:2]
+		cands = self._cands
+		best, first = size + 1, None
+		for i, c in enumerate(cands):
+			if c and (n:= _bit_count(c)) < best:
+				best, first = n, i
+				if n == 2: break
+		if first is None: return None
+		unit = None
+		if best > 2:
+			full = (1 << size) - 1
+			places = self._places
+			placed = self._placed
+			for u in range(3*size):
+				base = u*size
+				free = full & ~placed[u]
+				while free:
+					low = free & -free
+					free ^= low
+					d = low.bit_length() - 1
+					if (n:= _bit_count(places[base+d])) < best:
+						best, unit, digit = n, u, d
+				if best == 2: break
+		options = []
+		if unit is None:
+			m = cands[first]
+			while m:
+				options.append((first, (m & -m).bit_length()))
+				m &= m - 1
+		else:
+			m = places[unit*size + digit]
+			while m:
+				options.append((units[unit][(m & -m).bit_length() - 1], digit + 1))
+				m &= m - 1
+		return options
+	#-------------------------------------------------------------------------------#
+	def __snapshot(self):
+		return (self._cands[:], self._values[:], self._places[:], self._placed[:], self._placed_by[:], self.__step)
+	#-------------------------------------------------------------------------------#
+	def __restore(self, state, /):
+		self._cands = state[0][:]
+		self._values = state[1][:]
+		self._places = state[2][:]
+		self._placed = state[3][:]
+		self._placed_by = state[4][:]
+		self.__step = state[5]
+		self._queue.clear()
+	#-------------------------------------------------------------------------------#
+	def __open_node(self, depth, /):
+		# Punto de decisión abierto a la profundidad indicada; sólo lo mide 'SolverStats'
+		pass
+	#-------------------------------------------------------------------------------#
+	def __search(self, limit=1, /):
+		# Prueba-error iterativa, igual que en 'BitmaskBoard': retorna las soluciones halladas,
+		# hasta 'limit' (el tablero queda en la última), ó '_LIMITED' al alcanzar el límite de
+		# opciones ó de tiempo
+		stack = []
+		found = 0
+		consistent = self.__propagate()
+		while True:
+			if consistent:
+				if 0 not in self._values:
+					found += 1
+					if found >= limit: return found
+				elif (options:= self.__detect_starting_cell_to_make_decision()) is not None:
+					self.__open_node(len(stack) + 1)
+					stack.append([self.__snapshot(), options[::-1], 0])
+			# Retroceder hasta el punto de decisión más reciente con opciones por probar
+			while stack and not stack[-1][1]: stack.pop()
+			if not stack: return found
+			frame = stack[-1]
+			state, options, tried = frame
+			if tried:
+				self.__backtracks += 1
+				self.__restore(state)
+			frame[2] += 1
+			if self.__guesses >= self._max_guesses or time.perf_counter() > self._deadline: return _LIMITED
+			self.__guesses += 1
+			i, value = options.pop()
+			self._placed_by[i] = _GUESS
+			consistent = self.__assign(i, value) and self.__propagate()
+	#-------------------------------------------------------------------------------#
+	def _count_solutions(self, limit, /):
+		return self.__search(limit)
+	#-------------------------------------------------------------------------------#
+	def _run(self, showing, show_by_step, boardN, /):
+		if show_by_step < 0: show_by_step = 0
+		self.__showing = bool(showing and show_by_step)
+		self.__show_by_step = show_by_step
+		self.__boardN = boardN
+		self.__step = self.__guesses = self.__backtracks = 0
+		try:
+			if (found:= self.__search()) == _LIMITED:
+				raise SearchLimitError(f"Búsqueda detenida tras {self.__guesses} opciones probadas.")
+			if not found:
+				raise InconsistentBoardError("No se encuentra un camino de solución al tablero.")
+		finally:
+			self.__showing = False
+		self.show_board(boardN, showing and not (show_by_step and not (self.__step % show_by_step)))
+	#-------------------------------------------------------------------------------#
+	def _metrics(self):
+		return (self.__step, self.__guesses, self.__backtracks, tuple(self._placed_by))
+	#-------------------------------------------------------------------------------#
+	def _candidates_left(self):
+		return (sum(map(_bit_count, self._cands)), self._values.count(0))
+	#-------------------------------------------------------------------------------#
+	def is_solved(self):
+		return bool(self._values) and 0 not in self._values
+	#-------------------------------------------------------------------------------#
+	def get_current_sequence(self):
+		return "".join(_SYMBOLS[v] for v in self._values)
+	#-------------------------------------------------------------------------------#
+	def show_board(self, boardN, can_show, /):
+		"""
+		Método para visualizar el estado de un tablero Sudoku.
+		
+		ARGS:
+		- can_show	: (bool) permite la visualización de tablero.
+		- boardN	: (int) número de tablero siendo procesado su solución.
+		"""
+		if can_show: _print_board(self._values, self._givens, boardN, self.__step)
+
+_ENGINES = {"objects": SudokuBoard, "bitmask": BitmaskBoard, "dlx": DancingLinksBoard, "scalable": ScalableBoard}
+ENGINES = tuple(_ENGINES)	# nombres de los motores, p.ej. para las opciones de línea de órdenes
+
+#####################################################################################################
+#####################################################################################################
+
+# Propagación por lotes (ver 'solve_batch'): cada tablero es una fila de un arreglo (N, 81), con
+# los candidatos como máscaras de 9 bits igual que en 'BitmaskBoard'
+# Técnica con la que se resolvió cada celda, según su código en el lote (0: sin resolver)
+_BATCH_TECHNIQUES = (None, _GIVEN, _NAKED_SINGLE) + _HIDDEN_SINGLE_BY
+_numpy_checked = False
+#-------------------------------------------------------------------------------#
+def _numpy_available():
+	# Importa NumPy y construye las tablas de la propagación por lotes la primera vez que se
+	# requieren; sin NumPy, 'solve_batch' resuelve los tableros uno a uno
+	global np, _numpy_checked, _NP_UNITS, _NP_CELL_UNITS, _NP_BIT, _NP_POPCOUNT, _NP_LOWEST_DIGIT, _NP_BATCH_TECHNIQUES
+	if _numpy_checked: return np is not None
+	_numpy_checked = True
+	try:
+		import numpy as np
+	except ImportError:
+		return False
+	_NP_UNITS = np.array(_UNITS, dtype=np.intp)				# (27, 9)
+	_NP_CELL_UNITS = np.array(_CELL_UNITS, dtype=np.intp).T	# (3, 81): cuadrante, fila y columna
+	_NP_BIT = np.array([0] + [1 << (d-1) for d in _VALID_DIGITS], dtype=np.uint16)
+	_NP_POPCOUNT = np.array(_POPCOUNT, dtype=np.int8)
+	_NP_LOWEST_DIGIT = np.array(_LOWEST_DIGIT, dtype=np.int8)
+	_NP_BATCH_TECHNIQUES = np.array(_BATCH_TECHNIQUES, dtype=object)
+	return True
+#-------------------------------------------------------------------------------#
+def _propagate_batch(values, /):
+	"""
+	Aplica sencillos desnudos y ocultos a la vez sobre todos los tableros de un lote, hasta que
+	ninguno avance. Los tableros que se completan, ó en los que se halla una contradicción,
+	dejan de procesarse en las rondas siguientes.
+	
+	ARGS:
+	- values	: (ndarray) (N, 81) dígito de cada celda, 0 si está vacía.
+	
+	RETURN:
+	- (tuple) valores alcanzados (N, 81), código de la técnica que resolvió cada celda (N, 81,
+		ver '_BATCH_TECHNIQUES') y tableros con alguna contradicción (N,).
+	"""
+	values = values.astype(np.int8)
+	placed_by = (values > 0).astype(np.int8)
+	cands = np.where(values == 0, _ALL_CANDIDATES, 0).astype(np.uint16)
+	failed = np.zeros(len(values), dtype=bool)
+	active = np.arange(len(values))
+	q, r, c = _NP_CELL_UNITS
+	while len(active):
+		vals, cs = values[active], cands[active]
+		unit_bits = _NP_BIT[vals][:, _NP_UNITS]
+		placed = np.bitwise_or.reduce(unit_bits, axis=2)
+		# un dígito repetido en una unidad hace que la suma de sus bits difiera de su unión
+		conflict = (unit_bits.sum(axis=2, dtype=np.uint16) != placed).any(axis=1)
+		cs &= ~(placed[:, q] | placed[:, r] | placed[:, c])
+		# intersecciones cuadrante-línea: un dígito confinado a un segmento de 3 celdas dentro de
+		# su cuadrante (ó de su línea) se descarta del resto de la línea (ó del cuadrante)
+		reduced = cs.copy()
+		for lines in (reduced.reshape(-1, 9, 9), reduced.reshape(-1, 9, 9).transpose(0, 2, 1)):
+			segments = np.bitwise_or.reduce(lines.reshape(-1, 3, 3, 3, 3), axis=4)	# banda, línea, segmento
+			in_box = segments & ~(np.roll(segments, 1, axis=2) | np.roll(segments, 2, axis=2))
+			in_line = segments & ~(np.roll(segments, 1, axis=3) | np.roll(segments, 2, axis=3))
+			excluded = (np.roll(in_box, 1, axis=3) | np.roll(in_box, 2, axis=3) |
+				np.roll(in_line, 1, axis=2) | np.roll(in_line, 2, axis=2))
+			lines &= ~excluded.reshape(-1, 9, 3, 1).repeat(3, axis=3).reshape(-1, 9, 9)
+		changed = (reduced != cs).any(axis=1)
+		cs = reduced
+		# dígitos presentes entre los candidatos de cada unidad: al menos una vez, y más de una
+		unit_cands = cs[:, _NP_UNITS]
+		once = np.zeros_like(placed)
+		twice = np.zeros_like(placed)
+		for k in _BOARD_RANGE:
+			twice |= once & unit_cands[:, :, k]
+			once |= unit_cands[:, :, k]
+		conflict |= ((once | placed) != _ALL_CANDIDATES).any(axis=1)	# dígito sin lugar posible
+		once &= ~twice
+		empty = vals == 0
+		counts = _NP_POPCOUNT[cs]
+		conflict |= (empty & (counts == 0)).any(axis=1)
+		# sencillos desnudos, luego ocultos por cuadrante, fila y columna
+		tech = np.where(empty & (counts == 1), 2, 0).astype(np.int8)
+		found = np.where(tech > 0, cs, 0).astype(np.uint16)
+		hidden = np.zeros_like(cs)
+		for t, units in enumerate((q, r, c)):
+			single = cs & once[:, units]
+			hidden |= single
+			fresh = (single != 0) & (tech == 0)
+			found[fresh] = single[fresh]
+			tech[fresh] = 3 + t
+		conflict |= (_NP_POPCOUNT[hidden] > 1).any(axis=1)		# celda obligada a dos dígitos
+		solved = tech > 0
+		values[active] = np.where(solved, _NP_LOWEST_DIGIT[found], vals)
+		cands[active] = np.where(solved, 0, cs)
+		placed_by[active] = np.where(solved, tech, placed_by[active])
+		failed[active] = conflict
+		active = active[(solved.any(axis=1) | changed) & ~conflict]
+	return values, placed_by, failed
+#-------------------------------------------------------------------------------#
+def _solve_block(board, block, first, limits, /):
+	# Resuelve un bloque de secuencias: propagación vectorizada y, para los tableros que no se
+	# completan con ella, búsqueda tablero por tablero con 'board' a partir de lo alcanzado.
+	# Los tableros con contradicciones se entregan intactos a 'board', que decide su estado.
+	# Mismo criterio que '_parse_sequence' (81 caracteres, al menos 17 dígitos), pero vectorizado
+	results = [None]*len(block)
+	seqs = ["".join(raw.split()) for raw in block]
+	sized = [i for i, seq in enumerate(seqs) if len(seq) == 81]
+	time_start = time.perf_counter()
+	if sized:
+		grid = np.frombuffer("".join(seqs[i] for i in sized).encode("ascii", "replace"), dtype=np.uint8)
+		digits = grid.reshape(-1, 81).astype(np.int16) - ord("0")
+		digits = np.where((digits > 0) & (digits <= 9), digits, 0)
+		enough = (digits > 0).sum(axis=1) >= 17
+		valid = [i for i, flag in zip(sized, enough.tolist()) if flag]
+		digits = digits[enough]
+	else:
+		valid = []
+	for i in set(range(len(block))).difference(valid):
+		results[i] = SolveResult(first + i, block[i], _EXCLUDED)
+	if not valid: return results
+	values, placed_by, failed = _propagate_batch(digits)
+	texts = (values + ord("0")).astype(np.uint8).tobytes().decode()
+	steps = (placed_by > 1).sum(axis=1).tolist()
+	complete = ((values > 0).all(axis=1) & ~failed).tolist()
+	failed = failed.tolist()
+	share = (time.perf_counter() - time_start) / len(valid)
+	for k, i in enumerate(valid):
+		boardN, raw, reached = first + i, block[i], texts[81*k: 81*k + 81]
+		if complete[k]:
+			results[i] = SolveResult(boardN, raw, _SOLVED, reached, share, steps[k], 
+				techniques=tuple(_NP_BATCH_TECHNIQUES[placed_by[k]]))
+			continue
+		result = _solve_sequence(board, raw if failed[k] else reached, boardN, False, 0, False, None, None, limits)
+		result.sequence = raw
+		result.elapsed += share
+		if not failed[k]:
+			result.steps += steps[k]
+			if result.techniques is not None:
+				result.techniques = tuple(_BATCH_TECHNIQUES[code] if code > 1 else technique
+					for code, technique in zip(placed_by[k].tolist(), result.techniques))
+		results[i] = result
+	return results
+
+#####################################################################################################
+#####################################################################################################
+
+class SolveResult:
+	"""
+	Resultado de procesar un tablero Sudoku.
+	
+	ATTRS:
+	- boardN	: (int) número de tablero dentro del lote (en orden de entrada).
+	- sequence	: (str) secuencia del tablero, tal como fue leída.
+	- status	: (str) "solved", "unsolved", "aborted" (se excedió el límite de opciones 
+			probadas ó de tiempo) ó "excluded" (secuencia inválida o inconsistente).
+	- solution	: (str) secuencia solución de 81 dígitos (símbolos, en tableros de otro
+			tamaño), None si no se resolvió.
+	- elapsed	: (float) segundos empleados en resolver el tablero.
+	- steps		: (int) celdas-solución encontradas por las técnicas de resolución.
+	- guesses	: (int) opciones probadas en el proceso de prueba-error.
+	- backtracks	: (int) veces que se restauró el tablero tras una opción fallida.
+	- techniques	: (tuple) técnica con la que se resolvió cada celda (81 en 9×9): "given",
+			"naked_single", "hidden_single_quadrant", "hidden_single_row", 
+			"hidden_single_column" ó "guess" (None si la celda quedó sin resolver, ó si la
+			solución se obtuvo de la caché).
+	- cached	: (bool) la solución se obtuvo de una 'SolutionCache'.
+	"""
+	__slots__ = ("boardN", "sequence", "status", "solution", "elapsed", "steps", "guesses", "backtracks", "techniques", 
+		"cached")
+	#-------------------------------------------------------------------------------#
+	def __init__(self, boardN, sequence, status, solution=None, elapsed=0.0, steps=0, guesses=0, backtracks=0, techniques=None,
+			cached=False):
+		self.boardN = boardN
+		self.sequence = sequence
+		self.status = status
+		self.solution = solution
+		self.elapsed = elapsed
+		self.steps = steps
+		self.guesses = guesses
+		self.backtracks = backtracks
+		self.techniques = techniques
+		self.cached = cached
+	#-------------------------------------------------------------------------------#
+	def __repr__(self):
+		return (f"SolveResult(boardN={self.boardN}, status={self.status!r}, solution={self.solution!r}, "
+			f"elapsed={self.elapsed:.5f}, steps={self.steps}, guesses={self.guesses}, backtracks={self.backtracks}, "
+			f"cached={self.cached})")
+	#-------------------------------------------------------------------------------#
+	def __getstate__(self):
+		return tuple(getattr(self, k) for k in self.__slots__)
+	#-------------------------------------------------------------------------------#
+	def __setstate__(self, state):
+		for k, v in zip(self.__slots__, state):
+			setattr(self, k, v)
+
+#-------------------------------------------------------------------------------#
+
+class SolverStats:
+	"""
+	Instrumentación opcional de los motores: al pasarse a 'solve_from' ó 'iter_results', 
+	mide por técnica las llamadas, candidatos eliminados, celdas resueltas y tiempo, además
+	de la profundidad de la búsqueda y las restauraciones del tablero, acumulando todo el 
+	lote. Sin ella, los motores no ejecutan código de medición alguno.
+	
+	ARGS:
+	- callback	: (callable) función opcional llamada tras cada tablero con su 'SolveResult'
+			y el registro del tablero (dict con las claves "techniques", "search_calls" 
+			(puntos de decisión abiertos), "max_depth" y "restores").
+	- slowest	: (int) cantidad de tableros más lentos a conservar.
+	
+	El motor "dlx" no separa técnicas de propagación, por lo que sólo se mide su búsqueda.
+	"""
+	#-------------------------------------------------------------------------------#
+	def __init__(self, callback=None, slowest:int=5):
+		self.callback = callback
+		self.puzzles = self.solved = self.guesses = self.backtracks = 0
+		self.search_calls = self.max_depth = self.restores = 0
+		self.elapsed = 0.0
+		self.techniques = {}	# técnica -> [llamadas, eliminaciones, asignaciones, segundos]
+		self.slowest = []		# (segundos, boardN, guesses, max_depth), del más lento al más rápido
+		self.__keep = slowest
+		self.__record = None
+	#-------------------------------------------------------------------------------#
+	def __measure(self, board, method, label, /):
+		# Envoltura de una técnica: mide el cambio en candidatos y celdas sin resolver
+		candidates_left = board._candidates_left
+		techniques = self.__record["techniques"]
+		def wrapper(*args):
+			# etiqueta fija, por modo de rastreo (tupla), ó el nombre recibido (None)
+			name = label if type(label) == str else args[0] if label is None else label[args[0]]
+			cands, cells = candidates_left()
+			start = time.perf_counter()
+			try:
+				return method(*args)
+			finally:
+				seconds = time.perf_counter() - start
+				after_cands, after_cells = candidates_left()
+				row = techniques.setdefault(name, [0, 0, 0, 0.0])
+				row[0] += 1
+				row[1] += cands - after_cands
+				row[2] += cells - after_cells
+				row[3] += seconds
+		return wrapper
+	#-------------------------------------------------------------------------------#
+	def __measure_search(self, method, /):
+		# Envoltura de la búsqueda (iterativa): tiempo inclusivo, con la propagación inicial
+		record = self.__record
+		def wrapper(*args):
+			start = time.perf_counter()
+			try:
+				return method(*args)
+			finally:
+				row = record["techniques"].setdefault(_SEARCH, [0, 0, 0, 0.0])
+				row[0] += 1
+				row[3] += time.perf_counter() - start
+		return wrapper
+	#-------------------------------------------------------------------------------#
+	def __measure_node(self, method, /):
+		# Envoltura de la apertura de cada punto de decisión: cantidad y profundidad máxima
+		record = self.__record
+		def wrapper(depth):
+			record["search_calls"] += 1
+			if depth > record["max_depth"]: record["max_depth"] = depth
+			return method(depth)
+		return wrapper
+	#-------------------------------------------------------------------------------#
+	def __measure_restore(self, method, /):
+		record = self.__record
+		def wrapper(*args):
+			record["restores"] += 1
+			return method(*args)
+		return wrapper
+	#-------------------------------------------------------------------------------#
+	def _attach(self, board, /):
+		# Las envolturas se instalan como atributos de la instancia, ocultando a los métodos
+		# de la clase sólo mientras se resuelve el tablero
+		self.__record = {"techniques": {}, "search_calls": 0, "max_depth": 0, "restores": 0}
+		for name, label in board._INSTRUMENTED.items():
+			method = getattr(board, name)
+			if label == _SEARCH:
+				wrapper = self.__measure_search(method)
+			elif label == _NODE:
+				wrapper = self.__measure_node(method)
+			elif label == _RESTORE:
+				wrapper = self.__measure_restore(method)
+			else:
+				wrapper = self.__measure(board, method, label)
+			setattr(board, name, wrapper)
+	#-------------------------------------------------------------------------------#
+	def _detach(self, board, /):
+		for name in board._INSTRUMENTED:
+			board.__dict__.pop(name, None)
+		record, self.__record = self.__record, None
+		return record
+	#-------------------------------------------------------------------------------#
+	def _absorb(self, result, record, /):
+		# Acumula el registro de un tablero (medido en este proceso o en otro del pool)
+		self.puzzles += 1
+		if record is not None:
+			for name, row in record["techniques"].items():
+				total = self.techniques.setdefault(name, [0, 0, 0, 0.0])
+				for k in range(4):
+					total[k] += row[k]
+			self.search_calls += record["search_calls"]
+			self.restores += record["restores"]
+			self.max_depth = max(self.max_depth, record["max_depth"])
+		if result.status != _EXCLUDED:
+			self.solved += result.status == _SOLVED
+			self.guesses += result.guesses
+			self.backtracks += result.backtracks
+			self.elapsed += result.elapsed
+			if self.__keep:
+				self.slowest.append((result.elapsed, result.boardN, result.guesses, record["max_depth"] if record else 0))
+				self.slowest.sort(reverse=True)
+				del self.slowest[self.__keep:]
+		if self.callback: self.callback(result, record)
+	#-------------------------------------------------------------------------------#
+	def summary(self):
+		"""
+		Agregados del lote en un diccionario (apto para JSON).
+		"""
+		return {
+			"puzzles": self.puzzles,
+			"solved": self.solved,
+			"elapsed": self.elapsed,
+			"guesses": self.guesses,
+			"backtracks": self.backtracks,
+			"search_calls": self.search_calls,
+			"max_depth": self.max_depth,
+			"restores": self.restores,
+			"techniques": {name: dict(zip(("calls", "eliminations", "placements", "seconds"), row)) 
+				for name, row in self.techniques.items()},
+			"slowest": [dict(zip(("elapsed", "boardN", "guesses", "max_depth"), row)) for row in self.slowest],
+		}
+	#-------------------------------------------------------------------------------#
+	def __str__(self):
+		lines = [f"{self.solved} of {self.puzzles} puzzles solved in {self.elapsed:.5f} secs: {self.guesses} guesses, "
+			f"{self.backtracks} backtracks, {self.restores} restores, max depth {self.max_depth}",
+			"{:<24} {:>9} {:>13} {:>11} {:>10} {:>6}".format("technique", "calls", "eliminations", "placements", "secs", "%")]
+		for name, (calls, eliminations, placements, seconds) in sorted(self.techniques.items(), key=lambda x: -x[1][3]):
+			lines.append("{:<24} {:>9} {:>13} {:>11} {:>10.5f} {:>6.1f}".format(
+				name, calls, eliminations, placements, seconds, 100*seconds/self.elapsed if self.elapsed else 0.0))
+		for seconds, boardN, guesses, depth in self.slowest:
+			lines.append(f"  board {boardN}: {seconds:.5f} secs, {guesses} guesses, depth {depth}")
+		return "\n".join(lines)
+
+#-------------------------------------------------------------------------------#
+
+# Máximo de combinaciones de filas/columnas empatadas a comparar al canonizar un tablero
+_CANONICAL_LIMIT = 64
+
+def _arrangements(sig, /):
+	# Ordena bandas (grupos de 3 filas ó columnas) y, dentro de ellas, filas por su firma
+	# invariante; sólo las que empatan en firma son candidatas a permutarse entre sí
+	def ties(order, key):
+		groups = []
+		for i in order:
+			if groups and key(groups[-1][0]) == key(i): groups[-1].append(i)
+			else: groups.append([i])
+		return groups
+	band_key = lambda b: sorted(sig[b*3:b*3+3])
+	bands = ties(sorted(_BLOCK_RANGE, key=band_key), band_key)
+	inner = [ties(sorted(_BLOCK_RANGE, key=lambda k, b=b: sig[b*3+k]), lambda k, b=b: sig[b*3+k]) for b in _BLOCK_RANGE]
+	count = prod(factorial(len(g)) for g in chain(bands, *inner))
+	return bands, inner, count
+#-------------------------------------------------------------------------------#
+def _expand(bands, inner, full, /):
+	# Órdenes de las 9 filas (ó columnas): todas las permutaciones de empates, ó sólo la primera
+	if not full:
+		yield [b*3+k for b in chain(*bands) for k in chain(*inner[b])]
+		return
+	within = [[list(chain(*p)) for p in product(*map(permutations, inner[b]))] for b in _BLOCK_RANGE]
+	for order in product(*map(permutations, bands)):
+		order = list(chain(*order))
+		for w in product(*within):
+			yield [b*3+k for b in order for k in w[b]]
+#-------------------------------------------------------------------------------#
+def _canonical_form(seq, /):
+	"""
+	Forma canónica de un tablero bajo las simetrías del Sudoku: transposición, permutación
+	de bandas/pilas y de filas/columnas dentro de ellas, y reetiquetado de dígitos. Entre 
+	las disposiciones que respetan firmas invariantes (pistas por fila/columna) se elige la
+	menor lexicográficamente. Si los empates superan '_CANONICAL_LIMIT' combinaciones, se 
+	toma la primera: tableros equivalentes podrían no coincidir, pero la forma sigue siendo
+	exacta para el propio tablero.
+	
+	RETURN:
+	- (tuple) forma canónica (str), celda de origen de cada celda canónica (list), y
+		reetiquetado de dígitos original -> canónico (dict).
+	"""
+	values = [int(ch) if ch in "123456789" else 0 for ch in seq]
+	freq = [0]*10
+	for v in values: freq[v] += 1
+	best = None
+	for transposed in (False, True):
+		grid = [values[c*9 + r] for r in _BOARD_RANGE for c in _BOARD_RANGE] if transposed else values
+		rows = [grid[r*9:r*9+9] for r in _BOARD_RANGE]
+		cols = [grid[c::9] for c in _BOARD_RANGE]
+		rowcnt = [9 - row.count(0) for row in rows]
+		colcnt = [9 - col.count(0) for col in cols]
+		rowsig = [(rowcnt[r], sorted(colcnt[c] for c in _BOARD_RANGE if rows[r][c]), 
+			sorted(freq[v] for v in rows[r] if v)) for r in _BOARD_RANGE]
+		colsig = [(colcnt[c], sorted(rowcnt[r] for r in _BOARD_RANGE if cols[c][r]), 
+			sorted(freq[v] for v in cols[c] if v)) for c in _BOARD_RANGE]
+		row_bands, row_inner, row_count = _arrangements(rowsig)
+		col_bands, col_inner, col_count = _arrangements(colsig)
+		full = row_count * col_count <= _CANONICAL_LIMIT
+		col_orders = list(_expand(col_bands, col_inner, full))
+		for row_order in _expand(row_bands, row_inner, full):
+			for col_order in col_orders:
+				relabel = {}
+				out = [relabel.setdefault(v, len(relabel)+1) if (v:= grid[r*9 + c]) else 0 for r in row_order for c in col_order]
+				if best is None or out < best[0]:
+					best = (out, transposed, row_order, col_order, relabel)
+	out, transposed, row_order, col_order, relabel = best
+	cells = [c*9 + r if transposed else r*9 + c for r in row_order for c in col_order]
+	return "".join(map(str, out)), cells, relabel
+#-------------------------------------------------------------------------------#
+
+class SolutionCache:
+	"""
+	Caché LRU de soluciones, indexada por la forma canónica de cada tablero: un tablero 
+	repetido, o equivalente a uno ya resuelto por simetría, se responde sin resolverlo, 
+	trasladando la solución almacenada a su orientación original.
+	
+	ARGS:
+	- maxsize	: (int) cantidad máxima de soluciones; al superarse se descarta la de uso
+			menos reciente.
+	- path		: (str) archivo opcional desde donde se cargan las soluciones (si existe) y
+			donde 'save' las guarda, una línea "forma solución" por tablero.
+	"""
+	#-------------------------------------------------------------------------------#
+	def __init__(self, maxsize:int=4096, path=None):
+		if maxsize < 1:
+			raise ValueError("'maxsize' debe ser mayor a cero.")
+		self.maxsize = maxsize
+		self.path = path
+		self.hits = self.misses = self.evictions = 0
+		self.__solutions = OrderedDict()	# forma canónica -> solución canónica
+		self.__last = None					# última secuencia canonizada y su forma
+		if path and os.path.exists(path):
+			with open(path) as f:
+				for line in f:
+					if len(pair:= line.split()) == 2:
+						self.__store(*pair)
+			self.evictions = 0
+	#-------------------------------------------------------------------------------#
+	def __len__(self):
+		return len(self.__solutions)
+	#-------------------------------------------------------------------------------#
+	def __form(self, sequence, /):
+		seq = _parse_sequence(sequence)[0]
+		if self.__last is None or self.__last[0] != seq:
+			self.__last = (seq, _canonical_form(seq))
+		return self.__last[1]
+	#-------------------------------------------------------------------------------#
+	def __store(self, key, solution, /):
+		self.__solutions[key] = solution
+		self.__solutions.move_to_end(key)
+		if len(self.__solutions) > self.maxsize:
+			self.__solutions.popitem(last=False)
+			self.evictions += 1
+	#-------------------------------------------------------------------------------#
+	def get(self, sequence, /):
+		"""
+		Solución de un tablero (secuencia de 81 caracteres), None si no está en la caché.
+		"""
+		key, cells, relabel = self.__form(sequence)
+		if (canonical:= self.__solutions.get(key)) is None:
+			self.misses += 1
+			return None
+		self.__solutions.move_to_end(key)
+		self.hits += 1
+		original = {str(label): str(digit) for digit, label in relabel.items()}
+		# dígitos ausentes en las pistas: sus etiquetas canónicas son las restantes, en orden
+		missing = iter(sorted(set(_VALID_DIGITS) - set(relabel)))
+		solution = [""]*81
+		for k, i in enumerate(cells):
+			if (digit:= original.get(canonical[k])) is None:
+				digit = original[canonical[k]] = str(next(missing))
+			solution[i] = digit
+		return "".join(solution)
+	#-------------------------------------------------------------------------------#
+	def put(self, sequence, solution, /):
+		"""
+		Almacena la solución de un tablero (ambos como secuencias de 81 caracteres).
+		"""
+		key, cells, relabel = self.__form(sequence)
+		relabel = dict(relabel)
+		canonical = []
+		for i in cells:
+			digit = int(solution[i])
+			if digit not in relabel: relabel[digit] = len(relabel) + 1
+			canonical.append(str(relabel[digit]))
+		self.__store(key, "".join(canonical))
+	#-------------------------------------------------------------------------------#
+	def info(self):
+		"""
+		Estadísticas de uso de la caché.
+		"""
+		return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, 
+			"size": len(self.__solutions), "maxsize": self.maxsize}
+	#-------------------------------------------------------------------------------#
+	def save(self, path=None, /):
+		"""
+		Guarda las soluciones (de la menos a la más reciente) en 'path', ó en el archivo 
+		indicado al crear la caché.
+		"""
+		if not (path:= path or self.path):
+			raise ValueError("No se indicó el archivo donde guardar la caché.")
+		with open(path, "w") as f:
+			for key, solution in self.__solutions.items():
+				f.write(f"{key} {solution}\n")
+	#-------------------------------------------------------------------------------#
+	def clear(self):
+		self.__solutions.clear()
+		self.hits = self.misses = self.evictions = 0
+
+#-------------------------------------------------------------------------------#
+
+class Checkpoint:
+	"""
+	Progreso de un lote, para reanudarlo tras una interrupción: al pasarse a 'solve_from' ó
+	'iter_results', se registra cuántos tableros se entregaron (en orden de entrada), y una
+	nueva corrida con el mismo archivo continúa en el siguiente tablero. Un tablero se da por
+	procesado cuando se pide el siguiente resultado, por lo que tras una interrupción el último
+	entregado puede procesarse de nuevo (y, si el proceso termina abruptamente, los entregados
+	desde la última escritura del progreso). Los tableros que exceden su límite de búsqueda
+	('max_guesses' ó 'timeout', estado "aborted") se agregan al archivo de cuarentena.
+
+	ARGS:
+	- path		: (str) archivo de progreso: se reanuda desde él si existe (con las mismas
+			fuentes), y se reescribe (de forma atómica) cada 'interval' segundos y al terminar.
+			None para usar sólo la cuarentena.
+	- quarantine	: (str) archivo opcional de cuarentena: una línea JSON por tablero
+			abandonado, con "id" (número de tablero), "puzzle", "status", "elapsed",
+			"guesses" y "backtracks" (el formato de solicitudes de 'sudoku_server.py').
+	- interval	: (float) segundos entre escrituras del progreso.
+	"""
+	#-------------------------------------------------------------------------------#
+	def __init__(self, path, quarantine=None, interval:float=5.0):
+		if not (path or quarantine):
+			raise ValueError("No se indicó el archivo de progreso ni el de cuarentena.")
+		self.path = path
+		self.quarantine = quarantine
+		self.interval = interval
+		self.done = 0			# tableros procesados, incluyendo los de corridas anteriores
+		self.resumed = 0		# tableros omitidos al reanudar
+		self.counts = dict.fromkeys((_SOLVED, _UNSOLVED, _ABORTED, _EXCLUDED), 0)
+		self.__key = None		# fuentes del lote en curso
+		self.__saved_at = 0.0
+		self.__quarantined = None
+	#-------------------------------------------------------------------------------#
+	def _resume(self, key, /):
+		# Vincula el lote (fuentes, separador y tamaño de cuadrante) y retorna cuántos tableros
+		# omitir: los ya procesados si el archivo de progreso es del mismo lote
+		import json
+		# las rutas se normalizan: "data/x.txt" y "./data/x.txt" son el mismo lote
+		sources, sep, box = key
+		key = [[os.path.realpath(s) if s != "-" and os.path.isfile(s) else s for s in sources], sep, box]
+		self.__key = key
+		self.__saved_at = time.monotonic()
+		self.done = self.resumed = 0
+		self.counts = dict.fromkeys(self.counts, 0)
+		if self.path and os.path.exists(self.path):
+			with open(self.path) as f:
+				state = json.load(f)
+			if state["key"] != key:
+				raise ValueError(f"El progreso en '{self.path}' corresponde a otro lote.")
+			self.done = self.resumed = state["done"]
+			self.counts.update(state["counts"])
+		return self.done
+	#-------------------------------------------------------------------------------#
+	def _record(self, result, /):
+		self.done = result.boardN
+		self.counts[result.status] += 1
+		if result.status == _ABORTED and self.quarantine:
+			import json
+			if self.__quarantined is None:
+				self.__quarantined = open(self.quarantine, "a")
+			self.__quarantined.write(json.dumps({"id": result.boardN, "puzzle": result.sequence, "status": result.status,
+				"elapsed": round(result.elapsed, 6), "guesses": result.guesses, "backtracks": result.backtracks}) + "\n")
+			self.__quarantined.flush()
+		if time.monotonic() - self.__saved_at >= self.interval: self.save()
+	#-------------------------------------------------------------------------------#
+	def save(self):
+		"""
+		Escribe el progreso: en un archivo temporal que luego reemplaza al anterior, para que
+		una interrupción durante la escritura no lo deje incompleto.
+		"""
+		import json
+		if self.__key is None or not self.path: return
+		temporary = self.path + ".tmp"
+		with open(temporary, "w") as f:
+			json.dump({"key": self.__key, "done": self.done, "counts": self.counts}, f)
+			f.flush()
+			os.fsync(f.fileno())
+		os.replace(temporary, self.path)
+		self.__saved_at = time.monotonic()
+	#-------------------------------------------------------------------------------#
+	def close(self):
+		self.save()
+		if self.__quarantined is not None:
+			self.__quarantined.close()
+			self.__quarantined = None
+	#-------------------------------------------------------------------------------#
+	def info(self):
+		"""
+		Tableros procesados (también en corridas anteriores), omitidos al reanudar, y por estado.
+		"""
+		return {"done": self.done, "resumed": self.resumed, **self.counts}
+
+#-------------------------------------------------------------------------------#
+
+def _parse_sequence(data, box=3, /):
+	# https://www.technologyreview.com/s/426554/mathematicians-solve-minimum-sudoku-problem
+	minimum_numbers_given = _MINIMUM_GIVENS.get(box, 0)
+	values_per_board = box**4
+	seq = "".join(data.split())
+	if box > 3: seq = seq.upper()
+	return (seq, len(seq) == values_per_board and 
+		sum(map(seq.count, _SYMBOLS[1: box*box + 1])) >= minimum_numbers_given)
+#-------------------------------------------------------------------------------#
+def iter_sequences(sources, sep="\n", box=3, /):
+	"""
+	Generador que extrae, una a una, las secuencias de tableros a partir de sus fuentes,
+	sin cargar los archivos completos en memoria.
+	
+	ARGS:
+	- sources	: (list) secuencias de 81 caracteres, localizaciones de archivos (de texto
+			ó en formato empaquetado, ver 'sudoku_packed.py'), ó "-" para leer desde la
+			entrada estándar. Las secuencias inválidas se entregan igual (y se excluyen
+			al resolverlas); sólo lo que no parece una secuencia se busca como archivo.
+	- sep		: (str) separador entre secuencias dentro de un archivo: "\n" para una
+			secuencia por línea, u otro (p.ej. "========") para tableros en varias líneas.
+	- box		: (int) tamaño de cuadrante, para reconocer las secuencias sueltas de 
+			tableros de otro tamaño (box**4 caracteres).
+	"""
+	symbols = set(_SYMBOLS[: box*box + 1] + ".")
+	for source in sources:
+		if source != "-" and _parse_sequence(source, box)[1]:
+			yield source
+			continue
+		if source != "-" and not os.path.isfile(source) and set("".join(source.split()).upper()) <= symbols:
+			# secuencia mal formada (p.ej. de 80 caracteres, ó sin pistas suficientes): se entrega
+			# igual, para excluirla en su posición en lugar de detener el lote
+			yield source
+			continue
+		if source == "-":
+			yield from _split_stream(sys.stdin, sep)
+		else:
+			if not os.path.exists(source): 
+				raise FileNotFoundError("File not found.")
+			from sudoku_packed import is_packed, PackedPuzzles
+			if is_packed(source):
+				# formato binario: registros de tamaño fijo, sin separadores que interpretar
+				with PackedPuzzles(source) as puzzles:
+					if not len(puzzles): raise ValueError("File empty.")
+					yield from puzzles
+				continue
+			with open(source) as sf:
+				empty = True
+				for seq in _split_stream(sf, sep):
+					empty = False
+					yield seq
+			if empty: raise ValueError("File empty.")
+#-------------------------------------------------------------------------------#
+def _split_stream(stream, sep, /):
+	# Equivalente a 'stream.read().strip().split(sep)', pero entregando cada pieza apenas
+	# se completa; las piezas vacías al inicio y al final del flujo se descartan.
+	pending = 0		# piezas vacías aún no entregadas
+	started = False
+	if sep == "\n":
+		# una secuencia por línea (el caso más común): sin acumular ni volver a dividir
+		for line in stream:
+			if not (piece:= line.strip()):
+				if started: pending += 1
+				continue
+			if pending:
+				yield from [""]*pending
+				pending = 0
+			started = True
+			yield piece
+		return
+	# Se acumulan las líneas de la pieza en curso, y el separador se busca sólo en cada línea
+	# nueva junto con el final de la anterior ('tail'): el costo es lineal aunque sea escaso
+	chunks, tail = [], ""
+	keep = len(sep) - 1
+	for line in stream:
+		chunks.append(line)
+		if sep not in (text:= tail + line):
+			tail = text[-keep:] if keep else ""
+			continue
+		*pieces, rest = "".join(chunks).split(sep)
+		chunks = [rest]
+		tail = rest[-keep:] if keep else ""
+		for piece in pieces:
+			if not piece.strip():
+				if started: pending += 1
+				continue
+			if pending:
+				yield from [""]*pending
+				pending = 0
+			started = True
+			yield piece.strip()
+	if (buffer:= "".join(chunks)).strip():
+		if pending: yield from [""]*pending
+		yield buffer.strip()
+#-------------------------------------------------------------------------------#
+def _summary(cout, cunsolved, size, text, times, /):
+	# Sumario estadístico de un lote: 'times' tiene los segundos de cada tablero resuelto
+	csolved = len(times)
+	if times:
+		return "Excluded {}, Unsolved {}, Solved {} of {} {} puzzles (avg {:.5f} secs ({:.0f} Hz), max {:.5f} secs)".format(
+			cout, cunsolved, csolved, size, text, sum(times)/csolved, csolved/sum(times), max(times))
+	return "Excluded {}, Unsolved {}, Solved {} of {} {} puzzles".format(cout, cunsolved, csolved, size, text)
+#-------------------------------------------------------------------------------#
+def _cached_result(cache, boardN, raw, show_boards, /):
+	# Resultado de un tablero cuya solución está en la caché, None si no lo está
+	seq, flag = _parse_sequence(raw)
+	if not flag: return None
+	time_start = time.perf_counter()
+	if (solution:= cache.get(seq)) is None: return None
+	delta_time = time.perf_counter() - time_start
+	if show_boards:
+		print(seq)
+		_print_board(list(map(int, solution)), [ch in "123456789" for ch in seq], boardN, 0)
+		print("({:.5f} seconds, cached)\n".format(delta_time))
+	return SolveResult(boardN, raw, _SOLVED, solution, delta_time, cached=True)
+#-------------------------------------------------------------------------------#
+def _solve_sequence(board, seq, boardN, show_boards, show_by_step, verbose=True, stats=None, cache=None, limits=None, /):
+	"""
+	Resuelve una secuencia con el tablero (motor) indicado, midiendo su tiempo de ejecución.
+	Sólo se escribe en la salida estándar si 'show_boards' lo permite, ó si 'verbose' 
+	permite reportar errores. Con 'stats' (SolverStats) se instrumenta la resolución, con
+	'cache' (SolutionCache) se consulta y alimenta la caché de soluciones, y con 'limits'
+	(max_guesses, timeout) se detiene la búsqueda al excederlos (estado "aborted").
+	
+	RETURN:
+	- (SolveResult) resultado del tablero procesado.
+	"""
+	raw = seq
+	if cache is not None and (result:= _cached_result(cache, boardN, raw, show_boards)) is not None:
+		if stats is not None: stats._absorb(result, None)
+		return result
+	seq, flag = _parse_sequence(seq, board._box)
+	if not flag or not board._load(seq, verbose):
+		result = SolveResult(boardN, raw, _EXCLUDED)
+		if stats is not None: stats._absorb(result, None)
+		return result
+	if show_boards: print(seq)
+	board.show_board(boardN, show_boards and show_by_step)
+	if stats is not None: stats._attach(board)
+	aborted = False
+	time_start = time.perf_counter()
+	if limits is not None:
+		max_guesses, timeout = limits
+		board._max_guesses = inf if max_guesses is None else max_guesses
+		board._deadline = inf if timeout is None else time_start + timeout
+	try:
+		board._run(show_boards, show_by_step, boardN)
+	except Exception as e:
+		aborted = type(e) == SearchLimitError
+		board.show_board(boardN, show_boards and not show_by_step)
+		if verbose: print(f"[{type(e).__name__}] {e}")
+	finally:
+		delta_time = time.perf_counter() - time_start
+		record = stats._detach(board) if stats is not None else None
+		if limits is not None:
+			del board._max_guesses, board._deadline
+	if show_boards:
+		print("({:.5f} seconds)\n".format(delta_time))
+	solved = board.is_solved()
+	result = SolveResult(boardN, raw, _SOLVED if solved else _ABORTED if aborted else _UNSOLVED, 
+		board.get_current_sequence() if solved else None, delta_time, *board._metrics())
+	if stats is not None: stats._absorb(result, record)
+	if cache is not None and solved: cache.put(seq, result.solution)
+	return result
+#-------------------------------------------------------------------------------#
+_worker_board = None	# tablero propio de cada proceso del pool
+
+_worker_verbose = True
+
+_worker_stats = None	# instrumentación propia de cada proceso, si se solicitó
+
+_worker_records = []	# registros de 'SolverStats' aún no enviados al proceso principal
+
+def _init_worker(engine, verbose, instrumented=False, techniques=_DEFAULT_TECHNIQUES, branching=_DEFAULT_BRANCHING, 
+		box=3, /):
+	global _worker_board, _worker_verbose, _worker_stats
+	_worker_board = _ENGINES[engine]()
+	_worker_board._techniques = techniques
+	_worker_board._branching = branching
+	_worker_board._box = box
+	_worker_verbose = verbose
+	if instrumented:
+		_worker_stats = SolverStats(lambda result, record: _worker_records.append(record), slowest=0)
+#-------------------------------------------------------------------------------#
+def _solve_in_worker(item, /):
+	# 'item': (boardN, secuencia, límites de búsqueda ó None)
+	boardN, seq, limits = item
+	if _worker_stats is None:
+		return _solve_sequence(_worker_board, seq, boardN, False, 0, _worker_verbose, None, None, limits)
+	# el registro del tablero viaja con su resultado, para acumularse en el proceso principal
+	result = _solve_sequence(_worker_board, seq, boardN, False, 0, _worker_verbose, _worker_stats, None, limits)
+	return (result, _worker_records.pop())
+#-------------------------------------------------------------------------------#
+def _solve_in_pool(sequences, engine, workers, chunksize, verbose, stats=None, cache=None, limits=None, 
+		techniques=_DEFAULT_TECHNIQUES, branching=_DEFAULT_BRANCHING, box=3, first=1, /):
+	# Reparte los tableros por bloques entre los procesos; 'imap' conserva el orden de entrada.
+	# Los tableros se envían por ventanas, para no leer toda la fuente de una sola vez.
+	# La caché se consulta y alimenta en el proceso principal.
+	from multiprocessing import Pool
+	items = ((i, seq, limits) for i, seq in enumerate(sequences, first))
+	window = workers * chunksize * 4
+	with Pool(workers, _init_worker, (engine, verbose, stats is not None, techniques, branching, box)) as pool:
+		while (batch:= list(islice(items, window))):
+			if stats is None and cache is None:
+				yield from pool.imap(_solve_in_worker, batch, chunksize)
+				continue
+			hits = [_cached_result(cache, boardN, seq, False) if cache is not None else None for boardN, seq, _ in batch]
+			solved = pool.imap(_solve_in_worker, [item for item, hit in zip(batch, hits) if hit is None], chunksize)
+			for hit in hits:
+				if hit is not None:
+					result, record = hit, None
+				elif stats is None:
+					result, record = next(solved), None
+				else:
+					result, record = next(solved)
+				if stats is not None: stats._absorb(result, record)
+				if cache is not None and hit is None and result.status == _SOLVED:
+					cache.put(result.sequence, result.solution)
+				yield result
+
+#####################################################################################################
+#####################################################################################################
+
+def _format_grid(solution, box, /):
+	# Tablero en líneas de texto, con separadores entre cuadrantes (sin colores, para archivos)
+	size = box*box
+	rows = ["|".join(solution[r*size + c: r*size + c + box] for c in range(0, size, box)) for r in range(size)]
+	rule = "┼".join(["─"*box]*box)
+	return "\n".join(line for r, row in enumerate(rows) for line in ((rule, row) if r and not (r % box) else (row,)))
+#-------------------------------------------------------------------------------#
+def main(argv=None):
+	"""
+	Programa de línea de órdenes: resuelve los tableros de los archivos indicados (ó de la
+	entrada estándar) y escribe en la salida estándar una línea por tablero, en el orden de
+	entrada. El sumario va a la salida de errores. Retorna 0 si se resolvieron todos, 1 si no.
+	"""
+	# 'argparse' y 'json' sólo se importan aquí: importar este módulo como biblioteca no los carga
+	from argparse import ArgumentParser
+	parser = ArgumentParser(description="Resuelve tableros Sudoku, una solución por línea (también en tuberías).")
+	parser.add_argument("sources", nargs="*", default=["-"], help="archivos de tableros ó secuencias ('-' ó nada: entrada estándar)")
+	parser.add_argument("--sep", default="\n", help="separador entre secuencias de los archivos")
+	parser.add_argument("-e", "--engine", default="bitmask", choices=ENGINES, help="motor de resolución")
+	parser.add_argument("-w", "--workers", type=int, default=1, help="procesos resolutores")
+	parser.add_argument("-f", "--format", default="line", choices=("line", "json", "grid"),
+		help="salida: la solución (ó el estado, si no se resolvió), una línea JSON, ó el tablero en líneas")
+	parser.add_argument("-q", "--quiet", action="store_true", help="no escribir el sumario en la salida de errores")
+	parser.add_argument("--timeout", type=float, help="segundos máximos de búsqueda por tablero")
+	parser.add_argument("--max-guesses", type=int, help="opciones máximas probadas por tablero")
+	parser.add_argument("--box", type=int, default=3, choices=_BOX_SIZES, help="tamaño de cuadrante (3: tableros de 9×9)")
+	parser.add_argument("--checkpoint", help="archivo de progreso: al repetir la orden, se continúa donde quedó")
+	parser.add_argument("--quarantine", help="archivo donde agregar (líneas JSON) los tableros que exceden su límite")
+	args = parser.parse_args(argv)
+	checkpoint = Checkpoint(args.checkpoint, args.quarantine) if args.checkpoint or args.quarantine else None
+	if args.format == "json": import json
+
+	write = sys.stdout.write
+	cout = cunsolved = size = 0
+	times = []
+	try:
+		for result in SudokuBoard().iter_results(args.sources, sep=args.sep, engine=args.engine, workers=args.workers,
+				max_guesses=args.max_guesses, timeout=args.timeout, box=args.box, checkpoint=checkpoint):
+			size += 1
+			status = result.status
+			if status == _SOLVED: times.append(result.elapsed)
+			elif status == _EXCLUDED: cout += 1
+			else: cunsolved += 1
+			if args.format == "line":
+				write((result.solution or status) + "\n")
+			elif args.format == "json":
+				write(json.dumps({"id": result.boardN, "status": status, "solution": result.solution, 
+					"elapsed": round(result.elapsed, 6), "guesses": result.guesses, "backtracks": result.backtracks}) + "\n")
+			else:
+				write((_format_grid(result.solution, args.box) if result.solution else status) + "\n\n")
+			# con progreso, cada línea sale antes de que su tablero se dé por procesado
+			if checkpoint is not None: sys.stdout.flush()
+		sys.stdout.flush()
+	except KeyboardInterrupt:
+		return 130
+	except BrokenPipeError:
+		# el lector de la tubería terminó antes (p.ej. 'head'): no reportar el error al salir
+		os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+		return 1
+	except Exception as e:
+		print(f"[{type(e).__name__}] {e}", file=sys.stderr)
+		return 2
+	if not args.quiet:
+		print(_summary(cout, cunsolved, size, "", times), file=sys.stderr)
+		if checkpoint is not None:
+			print("Checkpoint: {done} puzzles done ({resumed} before resuming), {aborted} aborted".format(**checkpoint.info()), 
+				file=sys.stderr)
+	return 0 if len(times) == size else 1
 
 #####################################################################################################
 #####################################################################################################
 
 if __name__ == '__main__':
-	Puzzle = SudokuBoard()
-	# Puzzle.solve_from("_1______3______________46_7_9__________1_3____43___8_56__8___2___7_5_98___5_4_7__", 
-	# 	text="expert", show_boards=True, show_by_step=0)
-	# Puzzle.solve_from("_7_25_4__8_____9_3_____3_7_7____4_2_1_______7_4_5____8_9_6_____4_1_____5__7_82_3_", 
-	# 	text="diabolical", show_boards=True, show_by_step=0)
-	# Puzzle.solve_from(".....5.8....6.1.43..........1.5........1.6...3.......553.....61........4.........", 
-	# 	text="impossible", show_boards=True, show_by_step=0)  # no solucionable, sirve para tomar tiempo de esta conclusión
-	# Puzzle.solve_from("093000600000501000000000000100400050000090300000000800421000000000730000500000000", 
-	# 	text="evil", show_boards=True, show_by_step=0)	# solucionable
-	# Puzzle.solve_from("000700000100000000000430200000000006000509000000000418000081000002000050040000300", 
-	# 	text="evil", show_boards=True, show_by_step=0) # solucionable
-	# Puzzle.solve_from("000000012000000003002300400001800005060070800000009000008500000900040500470006000", 
-	# 	text="Blonde Platine", show_boards=True, show_by_step=0) # solucionable
-	# Puzzle.solve_from("000002750018090000000000000490000000030000008000700200000030009700000000500000080", 
-	# 	text="snake17", show_boards=True, show_by_step=0)	# solucionable
-	# Puzzle.solve_from(".....6....59.....82....8....45........3........6..3.54...325..6..................", 
-	# 	text="hardest", show_boards=True, show_by_step=0)	# solucionable
-	Puzzle.solve_from("data/easy50.txt", text="easy", show_boards=False, sep="========")
-	Puzzle.solve_from("data/top95.txt", text="hard", show_boards=False)
-	Puzzle.solve_from("data/hardest.txt", text="hardest", show_boards=False)
-	Puzzle.solve_from("data/hardest(2019).txt", text="hardest (2019)", show_boards=False)
+	# 'sudoku_packed' (formato binario) importa este módulo por su nombre: que no lo cargue otra vez
+	sys.modules.setdefault("sudoku_solver", sys.modules[__name__])
+	sys.exit(main())
 
 
 ## References used:
@@ -0,0 +1,212 @@
+# -----------------------------------------------------------
+# SOLUTION VALIDATOR for SUDOKU SOLVER
+#
+# Verifica pares (tablero, solución) de 9×9 sin recurrir a los
+# motores de 'sudoku_solver.py' ni a sus tablas: que la solución
+# tenga 81 dígitos, conserve las pistas de su tablero y no repita
+# dígitos en filas, columnas ni cuadrantes. Con NumPy, los pares se
+# verifican por bloques, todos a la vez; sólo los inválidos se
+# vuelven a revisar, uno a uno, para ubicar sus errores.
+#
+# Uso:
+#   python3 sudoku_validator.py data/top95.txt solutions.txt
+#   python3 sudoku_validator.py top95.sdk top95.sol.sdk
+#   python3 -m sudoku_solver data/top95.txt | python3 sudoku_validator.py data/top95.txt -
+#   python3 sudoku_validator.py --pairs pairs.txt
+#
+# Salida: una línea JSON por par inválido, con su número y sus errores
+# como [tipo, fila, columna] (0..8; null si el error no es de una celda):
+#   {"id": 7, "errors": [["given", 0, 3], ["row", 0, 3], ["row", 0, 8]]}
+# Tipos: "missing" (sin solución), "length" (no son 81 caracteres),
+# "symbol" (no es un dígito 1-9), "given" (no respeta la pista), y
+# "row", "column" ó "box" (dígito repetido en esa unidad).
+# -----------------------------------------------------------
+
+from itertools import islice, zip_longest
+import os
+import sys
+import time
+from sudoku_solver import iter_sequences
+try:
+	import numpy as np
+except ImportError:		# sin NumPy, cada par se verifica por separado
+	np = None
+
+_DIGITS = "123456789"
+_CELLS = 81
+# Unidades propias (no las del solucionador, para verificarlo de forma independiente): filas,
+# columnas y cuadrantes, con el tipo de error que reporta cada una
+_UNIT_KINDS = ("row",)*9 + ("column",)*9 + ("box",)*9
+_VALIDATOR_UNITS = tuple(
+	[tuple(range(r*9, r*9 + 9)) for r in range(9)] +
+	[tuple(range(c, _CELLS, 9)) for c in range(9)] +
+	[tuple((b//3*3 + k//3)*9 + b%3*3 + k%3 for k in range(9)) for b in range(9)])
+if np is not None:
+	_NP_VALIDATOR_UNITS = np.array(_VALIDATOR_UNITS, dtype=np.intp)		# (27, 9)
+
+#####################################################################################################
+#####################################################################################################
+
+class InvalidPair:
+	"""
+	Par (tablero, solución) que no superó la verificación.
+
+	ATTRS:
+	- index		: (int) número del par (en orden de entrada, desde 1).
+	- puzzle	: (str) tablero, tal como fue leído.
+	- solution	: (str) solución, tal como fue leída.
+	- errors	: (list) errores como tuplas (tipo, fila, columna), ver el encabezado.
+	"""
+	__slots__ = ("index", "puzzle", "solution", "errors")
+	#-------------------------------------------------------------------------------#
+	def __init__(self, index, puzzle, solution, errors):
+		self.index = index
+		self.puzzle = puzzle
+		self.solution = solution
+		self.errors = errors
+	#-------------------------------------------------------------------------------#
+	def __repr__(self):
+		return f"InvalidPair(index={self.index}, errors={self.errors!r})"
+
+#-------------------------------------------------------------------------------#
+
+def pair_errors(puzzle, solution, /):
+	"""
+	Verifica un par (tablero, solución) celda por celda.
+
+	RETURN:
+	- (list) errores como tuplas (tipo, fila, columna); vacía si la solución es válida.
+	"""
+	puzzle, solution = "".join(puzzle.split()), "".join(solution.split())
+	if not any(ch in _DIGITS for ch in solution):
+		return [("missing", None, None)]
+	if len(solution) != _CELLS or len(puzzle) != _CELLS:
+		return [("length", None, None)]
+	errors = []
+	for i, (given, value) in enumerate(zip(puzzle, solution)):
+		if value not in _DIGITS:
+			errors.append(("symbol", i//9, i%9))
+		elif given in _DIGITS and given != value:
+			errors.append(("given", i//9, i%9))
+	for kind, unit in zip(_UNIT_KINDS, _VALIDATOR_UNITS):
+		cells = {}
+		for i in unit:
+			if solution[i] in _DIGITS: cells.setdefault(solution[i], []).append(i)
+		errors.extend((kind, i//9, i%9) for repeated in cells.values() if len(repeated) > 1 for i in repeated)
+	return errors
+#-------------------------------------------------------------------------------#
+def _flag_block(puzzles, solutions, /):
+	# Posiciones (en el bloque) de los pares de 81 caracteres cuya solución no es válida:
+	# dígitos 1-9, pistas respetadas, y cada unidad con sus 9 dígitos (OR de sus bits = 511)
+	n = len(solutions)
+	sol = np.frombuffer("".join(solutions).encode("ascii", "replace"), dtype=np.uint8).reshape(n, _CELLS).astype(np.int16) - ord("0")
+	puz = np.frombuffer("".join(puzzles).encode("ascii", "replace"), dtype=np.uint8).reshape(n, _CELLS).astype(np.int16) - ord("0")
+	digits = (sol >= 1) & (sol <= 9)
+	givens = (puz >= 1) & (puz <= 9)
+	bits = np.where(digits, np.left_shift(1, np.clip(sol - 1, 0, 8)), 0).astype(np.uint16)
+	units = np.bitwise_or.reduce(bits[:, _NP_VALIDATOR_UNITS], axis=2)
+	valid = digits.all(axis=1) & ~(givens & (puz != sol)).any(axis=1) & (units == 511).all(axis=1)
+	return np.flatnonzero(~valid).tolist()
+#-------------------------------------------------------------------------------#
+def check_pairs(pairs, /, chunksize:int=8192):
+	"""
+	Generador que verifica pares (tablero, solución) y entrega sólo los inválidos, con la
+	ubicación de sus errores. Con NumPy, cada bloque de 'chunksize' pares se verifica a la
+	vez; sólo los pares marcados (y los que no tienen 81 caracteres) se revisan uno a uno.
+
+	ARGS:
+	- pairs		: (iterable) pares (tablero, solución) como secuencias de texto; p.ej. los de
+			'iter_pairs', ó (result.sequence, result.solution) de 'iter_results'.
+	- chunksize	: (int) cantidad de pares verificados a la vez.
+
+	RETURN:
+	- (InvalidPair) uno por par inválido, en el orden de entrada.
+	"""
+	if chunksize < 1:
+		raise ValueError("'chunksize' debe ser mayor a cero.")
+	pairs = iter(pairs)
+	first = 1
+	while (block:= list(islice(pairs, chunksize))):
+		if np is None:
+			flagged = range(len(block))
+		else:
+			clean = [("".join(p.split()), "".join(s.split())) for p, s in block]
+			sized = [k for k, (p, s) in enumerate(clean) if len(p) == len(s) == _CELLS]
+			flagged = set(range(len(block))).difference(sized)
+			if sized:
+				marked = _flag_block([clean[k][0] for k in sized], [clean[k][1] for k in sized])
+				flagged.update(sized[k] for k in marked)
+			flagged = sorted(flagged)
+		for k in flagged:
+			puzzle, solution = block[k]
+			if (errors:= pair_errors(puzzle, solution)):
+				yield InvalidPair(first + k, puzzle, solution, errors)
+		first += len(block)
+#-------------------------------------------------------------------------------#
+def iter_pairs(puzzles, solutions=None, /, sep="\n", solutions_sep="\n"):
+	"""
+	Generador de pares (tablero, solución) leídos a medida que se verifican.
+
+	ARGS:
+	- puzzles	: (str|list) archivo(s) de tableros, de texto ó empaquetados ("-" para la
+			entrada estándar); sin 'solutions', cada línea tiene un par separado por
+			espacios ("tablero solución").
+	- solutions	: (str|list) archivo(s) paralelo(s) de soluciones: la del tablero i en la
+			posición i (p.ej. la salida de 'python3 -m sudoku_solver', ó el archivo de
+			'sudoku_packed.py solve'). Si tienen distinta cantidad, los faltantes son "".
+	- sep		: (str) separador entre secuencias de los archivos de tableros.
+	- solutions_sep	: (str) separador entre secuencias de los archivos de soluciones (la
+			salida de 'python3 -m sudoku_solver' tiene siempre una por línea).
+	"""
+	as_list = lambda source: [source] if type(source) == str else source
+	if solutions is None:
+		for line in iter_sequences(as_list(puzzles), "\n"):
+			fields = line.split()
+			yield (fields[0] if fields else "", " ".join(fields[1:]))
+		return
+	yield from zip_longest(iter_sequences(as_list(puzzles), sep), iter_sequences(as_list(solutions), solutions_sep), fillvalue="")
+#-------------------------------------------------------------------------------#
+def main(argv=None):
+	from argparse import ArgumentParser
+	import json
+	parser = ArgumentParser(description="Verificación de soluciones Sudoku (9×9), independiente de los motores.")
+	parser.add_argument("puzzles", help="archivo de tableros, ó de pares con '--pairs' ('-' para la entrada estándar)")
+	parser.add_argument("solutions", nargs="?", help="archivo paralelo de soluciones ('-' para la entrada estándar)")
+	parser.add_argument("--pairs", action="store_true", help="cada línea de 'puzzles' tiene un par 'tablero solución'")
+	parser.add_argument("--sep", default="\n", help="separador entre secuencias del archivo de tableros")
+	parser.add_argument("--solutions-sep", default="\n", help="separador entre secuencias del archivo de soluciones")
+	parser.add_argument("--allow-missing", action="store_true", help="no contar como inválidos los tableros sin solución")
+	parser.add_argument("-q", "--quiet", action="store_true", help="no escribir el sumario en la salida de errores")
+	args = parser.parse_args(argv)
+	if (args.solutions is None) != args.pairs:
+		parser.error("indique un archivo de soluciones, ó '--pairs' para un archivo de pares")
+
+	counter = [0]
+	def counted(pairs):
+		for pair in pairs:
+			counter[0] += 1
+			yield pair
+	time_start = time.perf_counter()
+	invalid = 0
+	try:
+		for bad in check_pairs(counted(iter_pairs(args.puzzles, args.solutions, sep=args.sep, solutions_sep=args.solutions_sep))):
+			if args.allow_missing and bad.errors[0][0] == "missing": continue
+			invalid += 1
+			sys.stdout.write(json.dumps({"id": bad.index, "errors": bad.errors}) + "\n")
+		sys.stdout.flush()
+	except KeyboardInterrupt:
+		return 130
+	except BrokenPipeError:
+		# el lector de la tubería terminó antes (p.ej. 'head'): no reportar el error al salir
+		os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+		return 1
+	except Exception as e:
+		print(f"[{type(e).__name__}] {e}", file=sys.stderr)
+		return 2
+	elapsed = time.perf_counter() - time_start
+	if not args.quiet:
+		print(f"{counter[0]} pairs checked, {invalid} invalid ({counter[0]/elapsed if elapsed else 0:.0f} pairs per sec)", file=sys.stderr)
+	return 1 if invalid else 0
+
+if __name__ == '__main__':
+	sys.exit(main())
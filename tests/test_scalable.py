@@ -0,0 +1,63 @@
+# -----------------------------------------------------------
+# GUARD TESTS for the SCALABLE ENGINE
+#
+# Tableros difíciles para el motor "scalable" (el único para
+# tableros que no son de 9×9), con un tope de opciones probadas:
+# si la propagación ó la ramificación empeoran, la búsqueda se
+# detiene y el test falla.
+#
+# Uso:
+#   python3 -m unittest discover tests
+# -----------------------------------------------------------
+
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sudoku_solver import SudokuBoard, _SYMBOLS, _unit_tables
+
+# 16×16 de solución única (derivado de data/16x16.txt, retirando pistas): ~900 opciones probadas
+_HARD_16 = (".53......D.E14.8FD.E.B...5.....6..84.G3..C..........D.....B..2G.6EF.....G2....3...95......7....."
+	"7...2.G19A...C6.....A3.....C.D.B...8.....FA6B7.D..D7.4...9.....C2.5.F....B...8..A.C6BED71....3.5.7..."
+	"..B2.1..95.D.4..1.GA6.9...E13.G..A....F8.......7..F...B...2")
+# 9×9 sin solución del README: dlx lo descarta en fracciones de segundo
+_IMPOSSIBLE_9 = ".....5.8....6.1.43..........1.5........1.6...3.......553.....61........4........."
+
+#####################################################################################################
+#####################################################################################################
+
+class ScalableGuardTest(unittest.TestCase):
+	#-------------------------------------------------------------------------------#
+	def assertValidSolution(self, puzzle, solution, box):
+		size = box*box
+		self.assertEqual(len(solution), size*size)
+		for given, value in zip(puzzle, solution):
+			if given != ".": self.assertEqual(given, value)
+		digits = set(_SYMBOLS[1: size + 1])
+		for unit in _unit_tables(box)[0]:
+			self.assertEqual({solution[i] for i in unit}, digits)
+	#-------------------------------------------------------------------------------#
+	def test_hard_16x16_within_budget(self):
+		result = next(SudokuBoard().iter_results(_HARD_16, engine="scalable", box=4, max_guesses=2000))
+		self.assertEqual(result.status, "solved")
+		self.assertValidSolution(_HARD_16, result.solution, 4)
+	#-------------------------------------------------------------------------------#
+	def test_hard_16x16_is_unique(self):
+		self.assertTrue(SudokuBoard().has_unique_solution(_HARD_16, box=4))
+	#-------------------------------------------------------------------------------#
+	def test_impossible_9x9_within_budget(self):
+		result = next(SudokuBoard().iter_results(_IMPOSSIBLE_9, engine="scalable", max_guesses=1000))
+		self.assertEqual(result.status, "unsolved")
+		# sin técnicas adicionales, la ramificación por dígito por sí sola debe bastar
+		result = next(SudokuBoard().iter_results(_IMPOSSIBLE_9, engine="scalable", techniques=(), max_guesses=200000))
+		self.assertEqual(result.status, "unsolved")
+	#-------------------------------------------------------------------------------#
+	def test_16x16_dataset(self):
+		path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "16x16.txt")
+		results = list(SudokuBoard().iter_results(path, engine="scalable", box=4, max_guesses=1000))
+		self.assertTrue(all(r.status == "solved" for r in results))
+		for puzzle, result in zip(open(path).read().split(), results):
+			self.assertValidSolution(puzzle, result.solution, 4)
+
+if __name__ == '__main__':
+	unittest.main()